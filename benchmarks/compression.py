@@ -0,0 +1,105 @@
+"""
+Bytes on the wire and CPU time per response of the compression middleware.
+
+Builds task list pages as the API renders them and compresses each one
+with every available encoding, both as a single body and streamed in
+chunks (flushed after every chunk, as the middleware does).
+
+    python benchmarks/compression.py --tasks 50 --tasks 1000 --json
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+import click
+
+from todo_list.api.controller_schemas import TaskListDataResponse, TaskListResponse
+from todo_list.api.middleware.compression import COMPRESSORS, available_encodings
+from todo_list.api.responses import FastJSONResponse
+
+
+def make_body(count: int) -> bytes:
+    now = datetime(2024, 1, 10, 9, 15)
+    rows = [
+        {
+            'id': index,
+            'title': f'Task {index}',
+            'description': f'Description of task {index} in the benchmark project',
+            'status': ('todo', 'doing', 'done')[index % 3],
+            'deadline': now + timedelta(days=index % 30),
+            'created_at': now,
+            'updated_at': None,
+            'closed_at': None,
+            'project_id': 1 + index % 5,
+            'project_name': f'Project {1 + index % 5}',
+        }
+        for index in range(1, count + 1)
+    ]
+    content = TaskListDataResponse(
+        status="success",
+        message="Tasks retrieved successfully",
+        data=TaskListResponse(tasks=rows, total=len(rows))
+    )
+    return FastJSONResponse(content).body
+
+
+def compress(encoding: str, level: int, body: bytes, chunk_size: int = 0) -> bytes:
+    compressor = COMPRESSORS[encoding](level)
+    if not chunk_size:
+        return compressor.compress(body, final=True)
+    chunks = [body[start:start + chunk_size] for start in range(0, len(body), chunk_size)]
+    output = [compressor.compress(chunk, final=False) for chunk in chunks]
+    output.append(compressor.compress(b'', final=True))
+    return b''.join(output)
+
+
+def cpu_time(function, repeat: int) -> float:
+    function()
+    started = time.process_time()
+    for _ in range(repeat):
+        function()
+    return (time.process_time() - started) / repeat
+
+
+@click.command()
+@click.option('--tasks', 'sizes', type=int, multiple=True, default=(50, 200, 1000), help='Tasks per page')
+@click.option('--chunk-size', type=int, default=4096, help='Chunk size of the streamed variant')
+@click.option('--repeat', type=int, default=50, help='Compressions per measurement')
+@click.option('--json', 'as_json', is_flag=True, help='Print machine-readable results')
+def main(sizes, chunk_size, repeat, as_json):
+    levels = {'gzip': (1, 6, 9), 'br': (1, 4, 11), 'zstd': (1, 3, 19)}
+    results = []
+    for size in sizes:
+        body = make_body(size)
+        for encoding in available_encodings():
+            for level in levels[encoding]:
+                for streamed in (False, True):
+                    chunks = chunk_size if streamed else 0
+                    compressed = compress(encoding, level, body, chunks)
+                    results.append({
+                        'tasks': size,
+                        'encoding': encoding,
+                        'level': level,
+                        'streamed': streamed,
+                        'identity_bytes': len(body),
+                        'compressed_bytes': len(compressed),
+                        'ratio': round(len(body) / len(compressed), 2),
+                        'cpu_us': round(cpu_time(lambda: compress(encoding, level, body, chunks), repeat) * 1e6, 1),
+                    })
+    
+    if as_json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+    
+    print(f"{'tasks':>6} {'encoding':>8} {'level':>5} {'streamed':>8} {'identity':>9} {'bytes':>8} {'ratio':>6} {'cpu us':>9}")
+    for row in results:
+        print(
+            f"{row['tasks']:>6} {row['encoding']:>8} {row['level']:>5} {str(row['streamed']):>8} "
+            f"{row['identity_bytes']:>9} {row['compressed_bytes']:>8} {row['ratio']:>6} {row['cpu_us']:>9}"
+        )
+
+
+if __name__ == '__main__':
+    main()
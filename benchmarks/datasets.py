@@ -0,0 +1,84 @@
+"""
+Seeded datasets shared by the benchmarks.
+
+The same options always produce the same rows, relative to the time of
+seeding: titles and descriptions drawn from a fixed vocabulary (so
+full-text search has matches), a mix of statuses, deadlines from half a
+year ago to half a year ahead (so a share of the open tasks is overdue)
+and creation times spread over the past year. Rows go in with Core
+executemany inserts, so the triggers behind search and the project
+counters run as they would for the API.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.engine import Engine
+
+import todo_list.models  # noqa: F401 - registers every table
+from todo_list.db.base import Base
+from todo_list.models.project import Project
+from todo_list.models.task import Task
+from todo_list.repositories.task_filter import overdue_condition
+
+
+VOCABULARY = (
+    'report', 'invoice', 'meeting', 'review', 'deploy', 'release', 'budget', 'design',
+    'client', 'backup', 'database', 'migration', 'onboarding', 'roadmap', 'survey', 'audit',
+    'contract', 'payment', 'newsletter', 'workshop', 'benchmark', 'refactor', 'training', 'hiring',
+)
+STATUSES = ('todo', 'todo', 'doing', 'done')
+
+
+def reset_schema(engine: Engine) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def seed(engine: Engine, projects: int, tasks_per_project: int, seed: int = 0, chunk_size: int = 5000) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as connection:
+        project_ids = connection.execute(
+            insert(Project).returning(Project.id),
+            [
+                {'name': f'Project {number}', 'description': f'Seeded benchmark project {number}'}
+                for number in range(1, projects + 1)
+            ]
+        ).scalars().all()
+        
+        rows = []
+        for project_id in project_ids:
+            for _ in range(tasks_per_project):
+                words = rng.sample(VOCABULARY, 3)
+                status = rng.choice(STATUSES)
+                created_at = now - timedelta(seconds=rng.randrange(365 * 86400))
+                rows.append({
+                    'title': ' '.join(words[:2]).capitalize(),
+                    'description': f'Prepare the {words[0]} {words[1]} and {words[2]} items',
+                    'status': status,
+                    'deadline': now + timedelta(seconds=rng.randrange(-180 * 86400, 180 * 86400))
+                    if rng.random() < 0.8 else None,
+                    'created_at': created_at,
+                    'closed_at': created_at + timedelta(days=1) if status == 'done' else None,
+                    'project_id': project_id,
+                })
+                if len(rows) == chunk_size:
+                    connection.execute(insert(Task.__table__), rows)
+                    rows = []
+        if rows:
+            connection.execute(insert(Task.__table__), rows)
+    
+    # Fresh planner statistics, as a long-lived database would have
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def describe(engine: Engine) -> Dict[str, int]:
+    with engine.connect() as connection:
+        return {
+            'projects': connection.execute(select(func.count(Project.id))).scalar(),
+            'tasks': connection.execute(select(func.count(Task.id))).scalar(),
+            'overdue_tasks': connection.execute(select(func.count(Task.id)).where(overdue_condition())).scalar(),
+        }
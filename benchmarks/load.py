@@ -0,0 +1,370 @@
+"""
+Drive the API with concurrent clients and report latency per route.
+
+Runs a weighted mix of task and project reads and writes for --duration
+seconds, either in process (todo_list.api.main:app through httpx's
+ASGITransport, on the database of DATABASE_URL) or against a running
+server given with --url. Load is closed-loop with --concurrency clients,
+or open-loop at --rps requests per second with at most --concurrency in
+flight. Open-loop latency counts from each request's scheduled start, so
+an API that falls behind shows queueing instead of a lower request rate.
+
+Reports throughput, p50/p95/p99 latency and the error rate (transport
+errors and 4xx/5xx answers) of every route. Requests started during the
+first --warmup seconds are not counted.
+
+    python benchmarks/load.py --concurrency 32 --duration 30
+    python benchmarks/load.py --url http://127.0.0.1:8000 --rps 500 --write-ratio 0.3 --json
+    python benchmarks/load.py --weight search_tasks=0 --weight get_task=50
+
+The run writes to the database: it changes the status and description of
+existing tasks, and creates tasks that it deletes again at the end. In
+process the project and task limits are lifted so creates do not fail
+on them; a server keeps its own limits.
+"""
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import click
+import httpx
+
+from todo_list.api.main import app
+from todo_list.config import Config
+
+import datasets
+
+
+TASKS = '/api/v1/tasks'
+PROJECTS = '/api/v1/projects'
+
+
+class WorkingSet:
+    """Ids the operations pick from, and the rows the run created."""
+    
+    def __init__(self, project_ids: List[int], task_ids: List[int]):
+        self.project_ids = project_ids
+        self.task_ids = task_ids
+        # Tasks created by the load, which delete_task picks from
+        self.created_task_ids: List[int] = []
+        # Rows created by the bootstrap, deleted at the end only
+        self.bootstrap_task_ids: List[int] = []
+        self.created_project_ids: List[int] = []
+        self._names = itertools.count()
+    
+    def unique_name(self, prefix: str) -> str:
+        return f'{prefix} {os.getpid()}-{next(self._names)}'
+
+
+class Operation(NamedTuple):
+    route: str
+    write: bool
+    weight: float
+    send: Callable[[httpx.AsyncClient, WorkingSet, random.Random], Awaitable[httpx.Response]]
+
+
+def future_deadline() -> str:
+    return (datetime.now() + timedelta(days=30)).isoformat()
+
+
+async def create_task(client: httpx.AsyncClient, state: WorkingSet, rng: random.Random) -> httpx.Response:
+    response = await client.post(
+        f'{TASKS}/',
+        params={'project_id': rng.choice(state.project_ids)},
+        json={'title': state.unique_name('Load'), 'deadline': future_deadline()}
+    )
+    if response.status_code == 201:
+        state.created_task_ids.append(response.json()['data']['id'])
+    return response
+
+
+async def delete_task(client: httpx.AsyncClient, state: WorkingSet, rng: random.Random) -> httpx.Response:
+    # Only deletes tasks of this run; creates one instead when there is none
+    if not state.created_task_ids:
+        return await create_task(client, state, rng)
+    task_id = state.created_task_ids.pop(rng.randrange(len(state.created_task_ids)))
+    return await client.delete(f'{TASKS}/{task_id}')
+
+
+OPERATIONS: Dict[str, Operation] = {
+    'get_task': Operation('GET /tasks/{id}', False, 30, lambda c, s, r: c.get(f'{TASKS}/{r.choice(s.task_ids)}')),
+    'list_tasks': Operation('GET /tasks/', False, 15, lambda c, s, r: c.get(f'{TASKS}/')),
+    'list_project_tasks': Operation(
+        'GET /tasks/project/{id}', False, 10, lambda c, s, r: c.get(f'{TASKS}/project/{r.choice(s.project_ids)}')
+    ),
+    'search_tasks': Operation(
+        'GET /tasks/search', False, 10, lambda c, s, r: c.get(f'{TASKS}/search', params={'q': r.choice(datasets.VOCABULARY)})
+    ),
+    'get_project': Operation(
+        'GET /projects/{id}', False, 10, lambda c, s, r: c.get(f'{PROJECTS}/{r.choice(s.project_ids)}')
+    ),
+    'list_projects': Operation('GET /projects/', False, 10, lambda c, s, r: c.get(f'{PROJECTS}/')),
+    'project_stats': Operation('GET /projects/stats', False, 5, lambda c, s, r: c.get(f'{PROJECTS}/stats')),
+    'create_task': Operation('POST /tasks/', True, 30, create_task),
+    'update_task': Operation(
+        'PUT /tasks/{id}', True, 25,
+        lambda c, s, r: c.put(f'{TASKS}/{r.choice(s.task_ids)}', json={'description': s.unique_name('Updated')})
+    ),
+    'update_task_status': Operation(
+        'PATCH /tasks/{id}/status', True, 25,
+        lambda c, s, r: c.patch(f'{TASKS}/{r.choice(s.task_ids)}/status', json={'status': r.choice(['todo', 'doing'])})
+    ),
+    'delete_task': Operation('DELETE /tasks/{id}', True, 20, delete_task),
+}
+
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = Counter()
+    
+    def record(self, latency: float, error: Optional[str]) -> None:
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors[error] += 1
+    
+    def summary(self, elapsed: float) -> Dict:
+        latencies = sorted(self.latencies)
+        requests = len(latencies)
+        errors = sum(self.errors.values())
+        return {
+            'requests': requests,
+            'throughput_rps': round(requests / elapsed, 2),
+            'errors': errors,
+            'error_rate': round(errors / requests, 4) if requests else 0.0,
+            'error_statuses': dict(sorted(self.errors.items())),
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'max_ms': round(latencies[-1] * 1000, 3) if latencies else None,
+        }
+
+
+def percentile(latencies: List[float], percent: int) -> Optional[float]:
+    """Nearest-rank percentile of sorted latencies, in milliseconds."""
+    if not latencies:
+        return None
+    rank = max(0, -(-len(latencies) * percent // 100) - 1)
+    return round(latencies[rank] * 1000, 3)
+
+
+def mix_weights(write_ratio: float, overrides: Dict[str, float]) -> Dict[str, float]:
+    """Weights of the operations, with reads and writes scaled to their share."""
+    weights = {name: overrides.get(name, operation.weight) for name, operation in OPERATIONS.items()}
+    shares = {False: 1 - write_ratio, True: write_ratio}
+    totals = defaultdict(float)
+    for name, weight in weights.items():
+        totals[OPERATIONS[name].write] += weight
+    scaled = {
+        name: weight * shares[OPERATIONS[name].write] / totals[OPERATIONS[name].write]
+        for name, weight in weights.items()
+        if weight
+    }
+    return {name: weight for name, weight in scaled.items() if weight}
+
+
+async def bootstrap(client: httpx.AsyncClient, projects: int, tasks: int) -> WorkingSet:
+    """Collect existing ids, creating projects and tasks when there are too few."""
+    response = await client.get(f'{PROJECTS}/', params={'limit': Config.MAX_PAGE_SIZE})
+    response.raise_for_status()
+    state = WorkingSet([project['id'] for project in response.json()['data']['projects']], [])
+    while len(state.project_ids) < projects:
+        response = await client.post(f'{PROJECTS}/', json={'name': state.unique_name('Load')})
+        response.raise_for_status()
+        state.project_ids.append(response.json()['data']['id'])
+        state.created_project_ids.append(state.project_ids[-1])
+    
+    response = await client.get(f'{TASKS}/', params={'limit': Config.MAX_PAGE_SIZE})
+    response.raise_for_status()
+    state.task_ids = [task['id'] for task in response.json()['data']['tasks']]
+    missing = tasks - len(state.task_ids)
+    if missing > 0:
+        response = await client.post(f'{TASKS}/bulk', json={'tasks': [
+            {'title': state.unique_name('Load'), 'project_id': state.project_ids[index % len(state.project_ids)]}
+            for index in range(missing)
+        ]})
+        response.raise_for_status()
+        created_ids = [task['id'] for task in response.json()['data']['created']]
+        state.task_ids.extend(created_ids)
+        state.bootstrap_task_ids.extend(created_ids)
+    if not state.task_ids:
+        raise click.ClickException("No tasks to read: the bootstrap could not create any")
+    return state
+
+
+async def clean_up(client: httpx.AsyncClient, state: WorkingSet) -> None:
+    task_ids = state.created_task_ids + state.bootstrap_task_ids
+    for start in range(0, len(task_ids), Config.MAX_BULK_TASKS):
+        await client.post(f'{TASKS}/bulk/delete', json={'task_ids': task_ids[start:start + Config.MAX_BULK_TASKS]})
+    for project_id in state.created_project_ids:
+        await client.delete(f'{PROJECTS}/{project_id}')
+
+
+async def generate_load(client: httpx.AsyncClient, state: WorkingSet, weights: Dict[str, float],
+                        concurrency: int, rps: Optional[float], duration: float, warmup: float,
+                        rng: random.Random) -> Tuple[Dict[str, RouteStats], float]:
+    """Stats per route, and the seconds from the end of the warm-up until the last answer."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    measure_from = started + warmup
+    stop_at = measure_from + duration
+    names, cumulative = list(weights), list(itertools.accumulate(weights.values()))
+    stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+    
+    async def issue(scheduled: float) -> None:
+        operation = OPERATIONS[rng.choices(names, cum_weights=cumulative)[0]]
+        error = None
+        try:
+            response = await operation.send(client, state, rng)
+            if response.status_code >= 400:
+                error = str(response.status_code)
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+        if scheduled >= measure_from:
+            stats[operation.route].record(loop.time() - scheduled, error)
+    
+    if rps is None:
+        async def run_client():
+            while (now := loop.time()) < stop_at:
+                await issue(now)
+        
+        await asyncio.gather(*(run_client() for _ in range(concurrency)))
+        return stats, loop.time() - measure_from
+    
+    in_flight = asyncio.Semaphore(concurrency)
+    pending = set()
+    
+    async def issue_and_release(scheduled: float) -> None:
+        try:
+            await issue(scheduled)
+        finally:
+            in_flight.release()
+    
+    for number in itertools.count():
+        scheduled = started + number / rps
+        if scheduled >= stop_at:
+            break
+        if scheduled > loop.time():
+            await asyncio.sleep(scheduled - loop.time())
+        # Waiting for a free slot counts toward the request's latency
+        await in_flight.acquire()
+        task = loop.create_task(issue_and_release(scheduled))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    await asyncio.gather(*pending)
+    return stats, loop.time() - measure_from
+
+
+async def run(url: Optional[str], concurrency: int, **options) -> Tuple[Dict[str, RouteStats], float]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if url is not None:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+            return await drive(client, concurrency, **options)
+    
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url='http://load', limits=limits) as client:
+            return await drive(client, concurrency, **options)
+
+
+async def drive(client: httpx.AsyncClient, concurrency: int, projects: int, tasks: int,
+                **options) -> Tuple[Dict[str, RouteStats], float]:
+    state = await bootstrap(client, projects, tasks)
+    try:
+        return await generate_load(client, state, concurrency=concurrency, **options)
+    finally:
+        await clean_up(client, state)
+
+
+def parse_weights(values) -> Dict[str, float]:
+    weights = {}
+    for value in values:
+        name, _, weight = value.partition('=')
+        if name not in OPERATIONS:
+            raise click.BadParameter(
+                f"unknown operation {name!r}, expected one of {', '.join(OPERATIONS)}", param_hint="'--weight'"
+            )
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise click.BadParameter(f"weight of {name!r} must be a number", param_hint="'--weight'")
+    return weights
+
+
+@click.command()
+@click.option('--url', default=None, help='Base URL of a running server (default: the app in process)')
+@click.option('--concurrency', type=click.IntRange(min=1), default=16, show_default=True,
+              help='Concurrent clients, or the cap on requests in flight with --rps')
+@click.option('--rps', type=click.FloatRange(min=0, min_open=True), default=None,
+              help='Target requests per second (default: as fast as the clients go)')
+@click.option('--duration', type=click.FloatRange(min=0, min_open=True), default=10, show_default=True,
+              help='Measured seconds')
+@click.option('--warmup', type=click.FloatRange(min=0), default=2, show_default=True, help='Seconds run before measuring')
+@click.option('--write-ratio', type=click.FloatRange(0, 1), default=0.2, show_default=True, help='Share of requests that write')
+@click.option('--weight', 'weight_values', multiple=True, metavar='OPERATION=WEIGHT',
+              help=f"Relative weight of an operation among the reads or writes: {', '.join(OPERATIONS)}")
+@click.option('--projects', type=click.IntRange(min=1), default=5, show_default=True,
+              help='Projects to use, created when the database has fewer')
+@click.option('--tasks', type=click.IntRange(min=1), default=100, show_default=True,
+              help='Tasks to read and update, created when the database has fewer')
+@click.option('--seed', 'random_seed', type=int, default=0, show_default=True, help='Seed of the request mix')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='Write the results to this JSON file')
+@click.option('--json', 'as_json', is_flag=True, help='Print machine-readable results')
+def main(url, concurrency, rps, duration, warmup, write_ratio, weight_values, projects, tasks, random_seed,
+         output, as_json):
+    weights = mix_weights(write_ratio, parse_weights(weight_values))
+    if not weights:
+        raise click.UsageError("Every operation of the mix has a weight of 0")
+    if url is None:
+        # Services read their limits when built; lift them for the writes of the run
+        os.environ['MAX_NUMBER_OF_PROJECTS'] = str(10 ** 9)
+        os.environ['MAX_NUMBER_OF_TASKS_PER_PROJECT'] = str(10 ** 9)
+    
+    stats, elapsed = asyncio.run(run(
+        url, concurrency, projects=projects, tasks=tasks, weights=weights, rps=rps, duration=duration,
+        warmup=warmup, rng=random.Random(random_seed)
+    ))
+    total = RouteStats()
+    for route_stats in stats.values():
+        total.latencies.extend(route_stats.latencies)
+        total.errors.update(route_stats.errors)
+    results = {route: stats[route].summary(elapsed) for route in sorted(stats)}
+    results['total'] = total.summary(elapsed)
+    document = {
+        'meta': {
+            'target': url or 'in-process',
+            'concurrency': concurrency,
+            'rps': rps,
+            'duration': duration,
+            'elapsed': round(elapsed, 3),
+            'warmup': warmup,
+            'weights': {name: round(weight, 4) for name, weight in weights.items()},
+        },
+        'results': results,
+    }
+    
+    if output:
+        with open(output, 'w') as results_file:
+            json.dump(document, results_file, indent=2)
+            results_file.write('\n')
+    if as_json:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+        return
+    
+    print(f"{'route':<28}{'requests':>9}{'req/s':>9}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for route, result in results.items():
+        print(
+            f"{route:<28}{result['requests']:>9}{result['throughput_rps']:>9.1f}{result['error_rate']:>8.1%}"
+            f"{result['p50_ms'] or 0:>9.2f}{result['p95_ms'] or 0:>9.2f}{result['p99_ms'] or 0:>9.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
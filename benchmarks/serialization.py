@@ -0,0 +1,153 @@
+"""
+Cost of the task list endpoints, in microseconds per task.
+
+Compares the former path with the current one, for pages of several sizes
+read from a seeded in-memory SQLite database:
+
+- legacy: ORM entities, TaskResponse built field by field, an untyped
+  StandardResponse, then FastAPI's second validation and encoding pass.
+- typed: column rows validated in one pass by the typed envelope and
+  rendered by FastJSONResponse, with orjson when it is installed and the
+  stdlib encoder otherwise.
+
+The "serialize" columns exclude the SELECT; the "load+serialize" columns
+include it.
+
+    python benchmarks/serialization.py --tasks 50 --tasks 1000 --json
+"""
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+import click
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import todo_list.models  # noqa: F401 - registers the mappers
+from todo_list.api import responses
+from todo_list.api.controller_schemas import StandardResponse, TaskListDataResponse, TaskListResponse, TaskResponse
+from todo_list.db.base import Base
+from todo_list.models.project import Project
+from todo_list.models.task import Task
+from todo_list.repositories.task_repository import TaskRepository
+
+
+def seed(session: Session, count: int) -> None:
+    project = Project(name='Benchmark', description='Seeded project')
+    session.add(project)
+    session.flush()
+    now = datetime(2024, 1, 10, 9, 15)
+    session.add_all(
+        Task(
+            title=f'Task {index}',
+            description='Benchmark task description',
+            status='todo',
+            deadline=now + timedelta(days=index % 30),
+            project_id=project.id
+        )
+        for index in range(count)
+    )
+    session.commit()
+
+
+def legacy_serialize(tasks, route: APIRoute) -> bytes:
+    task_responses = []
+    for task in tasks:
+        task_responses.append(
+            TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                status=task.status,
+                deadline=task.deadline,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                closed_at=task.closed_at,
+                project_id=task.project_id,
+                project_name=task.project.name
+            )
+        )
+    content = StandardResponse(
+        status="success",
+        message="Tasks retrieved successfully",
+        data=TaskListResponse(tasks=task_responses, total=len(task_responses))
+    )
+    encoded = asyncio.run(serialize_response(field=route.response_field, response_content=content))
+    return JSONResponse(encoded).body
+
+
+def typed_serialize(rows) -> bytes:
+    content = TaskListDataResponse(
+        status="success",
+        message="Tasks retrieved successfully",
+        data=TaskListResponse(tasks=rows, total=len(rows))
+    )
+    return responses.FastJSONResponse(content).body
+
+
+def best_of(function, repeat: int, setup=None) -> float:
+    timings = []
+    for _ in range(repeat + 1):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings[1:])
+
+
+@click.command()
+@click.option('--tasks', 'sizes', type=int, multiple=True, default=(50, 200, 1000), help='Tasks per page')
+@click.option('--repeat', type=int, default=20, help='Runs per measurement; the fastest one is kept')
+@click.option('--json', 'as_json', is_flag=True, help='Print machine-readable results')
+def main(sizes, repeat, as_json):
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    seed(session, max(sizes))
+    repository = TaskRepository(session)
+    route = APIRoute('/tasks', lambda: None, response_model=StandardResponse)
+    encoders = {'stdlib': None}
+    if responses.orjson is not None:
+        encoders['orjson'] = responses.orjson
+    
+    results = []
+    for size in sizes:
+        tasks = repository.get_all(limit=size)
+        rows = repository.get_all_rows(limit=size)
+        assert json.loads(legacy_serialize(tasks, route)) == json.loads(typed_serialize(rows))
+        
+        per_task = 1e6 / size
+        result = {
+            'tasks': size,
+            'legacy_serialize_us': best_of(lambda: legacy_serialize(tasks, route), repeat) * per_task,
+            'legacy_total_us': best_of(
+                lambda: legacy_serialize(repository.get_all(limit=size), route), repeat, setup=session.expunge_all
+            ) * per_task,
+        }
+        for name, module in encoders.items():
+            responses.orjson = module
+            result[f'typed_{name}_serialize_us'] = best_of(lambda: typed_serialize(rows), repeat) * per_task
+            result[f'typed_{name}_total_us'] = best_of(
+                lambda: typed_serialize(repository.get_all_rows(limit=size)), repeat
+            ) * per_task
+        responses.orjson = encoders.get('orjson')
+        results.append(result)
+    
+    if as_json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+    
+    columns = [key for key in results[0] if key != 'tasks']
+    print('us per task'.ljust(28) + ''.join(f'{size:>10}' for size in sizes))
+    for column in columns:
+        print(column.ljust(28) + ''.join(f'{result[column]:>10.2f}' for result in results))
+
+
+if __name__ == '__main__':
+    main()
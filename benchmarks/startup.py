@@ -0,0 +1,221 @@
+"""
+Startup time and memory of the production server.
+
+Times importing todo_list.api.main in fresh interpreters, then starts the
+serve command for every --workers value and measures:
+
+- the time until the first answer to /health, until every worker has
+  finished its lifespan startup, and until the server is gone after a
+  SIGTERM;
+- the memory of the supervisor and of each worker after --requests
+  requests over new connections (so the kernel spreads them over the
+  workers), read from /proc/<pid>/smaps_rollup. PSS splits pages shared
+  with other processes between them, so the total PSS is what the server
+  really costs; private memory is what each worker copied or allocated
+  for itself.
+
+With --compare-freeze every multi-worker server is also started with
+--no-gc-freeze. Memory figures need Linux; the server uses the database
+of DATABASE_URL (or --database-url), which should be migrated.
+
+    python benchmarks/startup.py --workers 1 --workers 4 --compare-freeze
+"""
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import click
+import httpx
+
+import todo_list
+
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(todo_list.__file__))
+WARMUP_ROUTES = ('/health', '/api/v1/projects/', '/api/v1/tasks/', '/openapi.json')
+STARTUP_COMPLETE = 'Application startup complete.'
+# A single worker runs in the supervisor's process, so nothing is frozen
+FREEZE_LABELS = {True: 'yes', False: 'no', None: '-'}
+
+IMPORT_SCRIPT = (
+    "import time; started = time.perf_counter(); import todo_list.api.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def environment(database_url: Optional[str]) -> Dict[str, str]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SOURCE_ROOT, os.environ.get('PYTHONPATH')])))
+    if database_url:
+        env['DATABASE_URL'] = database_url
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env: Dict[str, str], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT], env=env, capture_output=True, text=True, check=True
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return {'min_s': round(min(timings), 4), 'median_s': round(statistics.median(timings), 4)}
+
+
+def memory(pid: int) -> Dict[str, float]:
+    """Resident, proportional and private memory of a process, in MiB."""
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as smaps:
+        for line in smaps:
+            name, _, value = line.partition(':')
+            if value.strip().endswith('kB'):
+                fields[name] = int(value.split()[0])
+    return {
+        'rss_mb': round(fields['Rss'] / 1024, 1),
+        'pss_mb': round(fields['Pss'] / 1024, 1),
+        'private_mb': round((fields['Private_Clean'] + fields['Private_Dirty']) / 1024, 1),
+    }
+
+
+def children(pid: int) -> List[int]:
+    with open(f'/proc/{pid}/task/{pid}/children') as listing:
+        return [int(child) for child in listing.read().split()]
+
+
+def warm_up(port: int, requests: int) -> int:
+    def get(number: int) -> int:
+        route = WARMUP_ROUTES[number % len(WARMUP_ROUTES)]
+        return httpx.get(f'http://127.0.0.1:{port}{route}', headers={'Connection': 'close'}).status_code
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return sum(status >= 400 for status in executor.map(get, range(requests)))
+
+
+def measure_server(env: Dict[str, str], workers: int, freeze: bool, requests: int, timeout: float) -> Dict[str, object]:
+    port = free_port()
+    command = [
+        sys.executable, '-m', 'todo_list.commands.serve', '--host', '127.0.0.1', '--port', str(port),
+        '--workers', str(workers), '--no-access-log', '--gc-freeze' if freeze else '--no-gc-freeze',
+    ]
+    started = time.perf_counter()
+    server = subprocess.Popen(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    
+    ready_times = []
+    all_ready = threading.Event()
+    
+    def follow_log():
+        for line in server.stdout:
+            if STARTUP_COMPLETE in line:
+                ready_times.append(time.perf_counter() - started)
+                if len(ready_times) == workers:
+                    all_ready.set()
+    
+    threading.Thread(target=follow_log, daemon=True).start()
+    
+    try:
+        first_response = None
+        while first_response is None:
+            if server.poll() is not None:
+                raise click.ClickException(f"Server exited with {server.returncode} during startup")
+            if time.perf_counter() - started > timeout:
+                raise click.ClickException(f"Server did not answer within {timeout}s")
+            try:
+                httpx.get(f'http://127.0.0.1:{port}/health', timeout=1).raise_for_status()
+                first_response = time.perf_counter() - started
+            except httpx.HTTPError:
+                time.sleep(0.01)
+        if not all_ready.wait(timeout):
+            raise click.ClickException(f"Only {len(ready_times)} of {workers} workers started within {timeout}s")
+        
+        errors = warm_up(port, requests)
+        worker_pids = children(server.pid) or [server.pid]
+        workers_memory = [memory(pid) for pid in worker_pids]
+        supervisor_memory = memory(server.pid) if worker_pids != [server.pid] else None
+        
+        stopping = time.perf_counter()
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout)
+        shutdown = time.perf_counter() - stopping
+    finally:
+        if server.poll() is None:
+            server.kill()
+            server.wait()
+    
+    processes = workers_memory + ([supervisor_memory] if supervisor_memory else [])
+    return {
+        'workers': workers,
+        'gc_freeze': freeze if workers > 1 else None,
+        'first_response_s': round(first_response, 3),
+        'all_workers_ready_s': round(ready_times[-1], 3),
+        'shutdown_s': round(shutdown, 3),
+        'warmup_errors': errors,
+        'supervisor': supervisor_memory,
+        'worker_rss_mb': round(statistics.mean(m['rss_mb'] for m in workers_memory), 1),
+        'worker_pss_mb': round(statistics.mean(m['pss_mb'] for m in workers_memory), 1),
+        'worker_private_mb': round(statistics.mean(m['private_mb'] for m in workers_memory), 1),
+        'total_pss_mb': round(sum(m['pss_mb'] for m in processes), 1),
+    }
+
+
+@click.command()
+@click.option('--workers', 'worker_counts', type=click.IntRange(min=1), multiple=True, default=(1, 4), show_default=True,
+              help='Worker counts to start the server with (repeatable)')
+@click.option('--compare-freeze', is_flag=True, help='Also start every multi-worker server with --no-gc-freeze')
+@click.option('--requests', type=click.IntRange(min=0), default=400, show_default=True,
+              help='Requests served before memory is measured')
+@click.option('--repeat', type=click.IntRange(min=1), default=5, show_default=True, help='Timed imports of the app')
+@click.option('--database-url', default=None, help='Database of the server (default: DATABASE_URL)')
+@click.option('--timeout', type=click.FloatRange(min=0, min_open=True), default=60, show_default=True,
+              help='Seconds to wait for startup and shutdown')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='Write the results to this JSON file')
+@click.option('--json', 'as_json', is_flag=True, help='Print machine-readable results')
+def main(worker_counts, compare_freeze, requests, repeat, database_url, timeout, output, as_json):
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        raise click.UsageError("Memory is read from /proc/<pid>/smaps_rollup, which needs Linux 4.14 or later")
+    
+    env = environment(database_url)
+    document = {
+        'meta': {'python': sys.version.split()[0], 'requests': requests},
+        'import': measure_import(env, repeat),
+        'servers': [
+            measure_server(env, workers, freeze, requests, timeout)
+            for workers in worker_counts
+            for freeze in ((True, False) if compare_freeze and workers > 1 else (True,))
+        ],
+    }
+    
+    if output:
+        with open(output, 'w') as results_file:
+            json.dump(document, results_file, indent=2)
+            results_file.write('\n')
+    if as_json:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+        return
+    
+    print(f"import todo_list.api.main: {document['import']['median_s'] * 1000:.0f} ms median, "
+          f"{document['import']['min_s'] * 1000:.0f} ms min")
+    print(f"{'workers':>8}{'freeze':>8}{'first s':>9}{'ready s':>9}{'stop s':>8}"
+          f"{'rss MiB':>9}{'pss MiB':>9}{'priv MiB':>10}{'total pss':>11}")
+    for result in document['servers']:
+        print(
+            f"{result['workers']:>8}{FREEZE_LABELS[result['gc_freeze']]:>8}{result['first_response_s']:>9.2f}"
+            f"{result['all_workers_ready_s']:>9.2f}{result['shutdown_s']:>8.2f}{result['worker_rss_mb']:>9.1f}"
+            f"{result['worker_pss_mb']:>9.1f}{result['worker_private_mb']:>10.1f}{result['total_pss_mb']:>11.1f}"
+        )
+    print("rss, pss and priv are per worker; total pss includes the supervisor")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,391 @@
+"""
+Time every repository method and API route against a seeded database.
+
+Seeds --projects x --tasks-per-project tasks (see datasets.py) into the
+database at --database-url, after dropping and recreating its tables,
+then times each case --repeat times after one warm-up run. Routes go
+through the whole ASGI app in process with httpx's ASGITransport, on
+sessions from the benchmark database. Entity caches are cleared before
+every run, so lookups measure the database rather than the cache. Create
+cases add a few rows; the other write cases change rows they inserted
+themselves or restore the rows they changed.
+
+Results are JSON keyed by case name, stable enough to diff between
+versions or to compare directly:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --projects 100 --tasks-per-project 10000 --output before.json
+    python benchmarks/suite.py --database-url postgresql://localhost/todolist_bench --output pg.json
+    python benchmarks/suite.py --output after.json --compare before.json
+"""
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import click
+import httpx
+import sqlalchemy
+from sqlalchemy import create_engine, func, insert, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from todo_list.api.dependencies.database import get_db
+from todo_list.api.dependencies.pagination import encode_cursor
+from todo_list.api.main import app
+from todo_list.cache import project_cache, task_cache
+from todo_list.config import Config
+from todo_list.models.project import Project
+from todo_list.models.task import Task
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_filter import TaskFilter
+from todo_list.repositories.task_repository import TaskRepository
+
+import datasets
+
+
+BATCH = 50
+
+
+class Case(NamedTuple):
+    name: str
+    # run(target, prepared) is timed; target is a Session for repository
+    # cases and an httpx.AsyncClient for routes
+    run: Callable[[Any, Any], Any]
+    # setup(session) and teardown(session, prepared, result) are not timed
+    setup: Optional[Callable[[Session], Any]] = None
+    teardown: Optional[Callable[[Session, Any, Any], None]] = None
+
+
+class Sample(NamedTuple):
+    """Rows of the seeded dataset the cases read and write."""
+    project_id: int
+    task_id: int
+    deep_after_id: int
+    search_term: str
+
+
+_names = itertools.count()
+
+
+def unique_name(prefix: str) -> str:
+    return f'{prefix} {os.getpid()}-{next(_names)}'
+
+
+def future_deadline() -> datetime:
+    # Naive, like the deadlines the API documents
+    return datetime.now() + timedelta(days=30)
+
+
+def insert_tasks(session: Session, project_id: int, count: int, **values) -> List[int]:
+    rows = [
+        {'title': unique_name('Bench'), 'status': 'todo', 'project_id': project_id, **values}
+        for _ in range(count)
+    ]
+    task_ids = session.execute(insert(Task.__table__).returning(Task.id), rows).scalars().all()
+    session.commit()
+    return task_ids
+
+
+def insert_project(session: Session) -> int:
+    project_id = session.execute(insert(Project).returning(Project.id), {'name': unique_name('Bench')}).scalar()
+    session.commit()
+    return project_id
+
+
+def reopen(session: Session, task_ids: List[int]) -> None:
+    session.execute(update(Task).where(Task.id.in_(task_ids)).values(status='todo', closed_at=None))
+    session.commit()
+
+
+def pick_sample(session: Session) -> Sample:
+    first_id, last_id = session.execute(select(func.min(Task.id), func.max(Task.id))).one()
+    project_ids = session.execute(select(Project.id).order_by(Project.id)).scalars().all()
+    return Sample(
+        project_id=project_ids[len(project_ids) // 2],
+        task_id=(first_id + last_id) // 2,
+        deep_after_id=first_id + (last_id - first_id) * 9 // 10,
+        search_term=datasets.VOCABULARY[0],
+    )
+
+
+def repository_cases(sample: Sample) -> List[Case]:
+    tasks = TaskRepository
+    projects = ProjectRepository
+    page = Config.DEFAULT_PAGE_SIZE
+    open_tasks = TaskFilter(statuses=['todo', 'doing'])
+    return [
+        Case('TaskRepository.get_by_id', lambda s, _: tasks(s).get_by_id(sample.task_id)),
+        Case('TaskRepository.get_by_ids', lambda s, _: tasks(s).get_by_ids(range(sample.task_id, sample.task_id + BATCH))),
+        Case('TaskRepository.get_all', lambda s, _: tasks(s).get_all(limit=page)),
+        Case('TaskRepository.get_all_rows', lambda s, _: tasks(s).get_all_rows(limit=page)),
+        Case('TaskRepository.get_all_rows[deep_page]',
+             lambda s, _: tasks(s).get_all_rows(limit=page, after_id=sample.deep_after_id)),
+        Case('TaskRepository.get_all_rows[filtered,-deadline]',
+             lambda s, _: tasks(s).get_all_rows(limit=page, task_filter=open_tasks, sort='-deadline')),
+        Case('TaskRepository.get_by_project', lambda s, _: tasks(s).get_by_project(sample.project_id, limit=page)),
+        Case('TaskRepository.get_rows_by_project',
+             lambda s, _: tasks(s).get_rows_by_project(sample.project_id, limit=page)),
+        Case('TaskRepository.get_overdue_tasks', lambda s, _: tasks(s).get_overdue_tasks()),
+        Case('TaskRepository.get_overdue_rows', lambda s, _: tasks(s).get_overdue_rows()),
+        Case('TaskRepository.search_rows', lambda s, _: tasks(s).search_rows(sample.search_term, limit=page)),
+        Case('TaskRepository.get_page_version', lambda s, _: tasks(s).get_page_version(limit=page)),
+        Case('TaskRepository.get_overdue_version', lambda s, _: tasks(s).get_overdue_version()),
+        Case('TaskRepository.count_overdue_tasks', lambda s, _: tasks(s).count_overdue_tasks()),
+        Case('TaskRepository.count_by_project', lambda s, _: tasks(s).count_by_project(sample.project_id)),
+        Case('TaskRepository.count_by_projects',
+             lambda s, _: tasks(s).count_by_projects(range(sample.project_id, sample.project_id + BATCH))),
+        Case('TaskRepository.get_existing_project_ids',
+             lambda s, _: tasks(s).get_existing_project_ids(range(sample.project_id, sample.project_id + BATCH))),
+        Case('TaskRepository.get_upcoming_deadlines', lambda s, _: tasks(s).get_upcoming_deadlines(1000)),
+        Case('TaskRepository.create', lambda s, _: tasks(s).create(
+            unique_name('Bench'), sample.project_id, 'Created by the benchmark', future_deadline())),
+        Case('TaskRepository.create_many', lambda s, _: tasks(s).create_many(
+            [{'title': unique_name('Bench'), 'project_id': sample.project_id} for _ in range(BATCH)],
+            Config.BULK_INSERT_CHUNK_SIZE)),
+        Case('TaskRepository.update',
+             lambda s, _: tasks(s).update(sample.task_id, description=unique_name('Updated'))),
+        Case('TaskRepository.close_task', lambda s, task_ids: tasks(s).close_task(task_ids[0]),
+             setup=lambda s: insert_tasks(s, sample.project_id, 1)),
+        Case('TaskRepository.delete', lambda s, task_ids: tasks(s).delete(task_ids[0]),
+             setup=lambda s: insert_tasks(s, sample.project_id, 1)),
+        Case('TaskRepository.close_many', lambda s, task_ids: tasks(s).close_many(task_ids),
+             setup=lambda s: insert_tasks(s, sample.project_id, BATCH)),
+        Case('TaskRepository.update_status_many', lambda s, task_ids: tasks(s).update_status_many(task_ids, 'doing'),
+             setup=lambda s: insert_tasks(s, sample.project_id, BATCH)),
+        Case('TaskRepository.delete_many', lambda s, task_ids: tasks(s).delete_many(task_ids),
+             setup=lambda s: insert_tasks(s, sample.project_id, BATCH)),
+        Case('TaskRepository.close_overdue_batch', lambda s, _: tasks(s).close_overdue_batch(BATCH),
+             teardown=lambda s, _, closed_ids: reopen(s, closed_ids)),
+        Case('ProjectRepository.get_by_id', lambda s, _: projects(s).get_by_id(sample.project_id)),
+        Case('ProjectRepository.get_by_name', lambda s, _: projects(s).get_by_name(f'Project {sample.project_id}')),
+        Case('ProjectRepository.count', lambda s, _: projects(s).count()),
+        Case('ProjectRepository.has_tasks', lambda s, _: projects(s).has_tasks(sample.project_id)),
+        Case('ProjectRepository.get_all', lambda s, _: projects(s).get_all(limit=page)),
+        Case('ProjectRepository.get_with_task_count', lambda s, _: projects(s).get_with_task_count(sample.project_id)),
+        Case('ProjectRepository.get_all_with_task_counts', lambda s, _: projects(s).get_all_with_task_counts(limit=page)),
+        Case('ProjectRepository.get_rows_with_task_counts', lambda s, _: projects(s).get_rows_with_task_counts(limit=page)),
+        Case('ProjectRepository.get_status_stats', lambda s, _: projects(s).get_status_stats(limit=page)),
+        Case('ProjectRepository.get_page_version', lambda s, _: projects(s).get_page_version(limit=page)),
+        Case('ProjectRepository.rebuild_counters[dry_run]', lambda s, _: projects(s).rebuild_counters(dry_run=True)),
+        Case('ProjectRepository.create', lambda s, _: projects(s).create(unique_name('Bench'))),
+        Case('ProjectRepository.update',
+             lambda s, _: projects(s).update(sample.project_id, description=unique_name('Updated'))),
+        Case('ProjectRepository.delete', lambda s, project_id: projects(s).delete(project_id), setup=insert_project),
+    ]
+
+
+def route_cases(sample: Sample) -> List[Case]:
+    tasks = '/api/v1/tasks'
+    projects = '/api/v1/projects'
+    task_body = lambda: {'title': unique_name('Bench'), 'deadline': future_deadline().isoformat()}
+    return [
+        Case('GET /projects/', lambda c, _: c.get(f'{projects}/')),
+        Case('GET /projects/stats', lambda c, _: c.get(f'{projects}/stats')),
+        Case('GET /projects/{id}', lambda c, _: c.get(f'{projects}/{sample.project_id}')),
+        Case('POST /projects/', lambda c, _: c.post(f'{projects}/', json={'name': unique_name('Bench')})),
+        Case('PUT /projects/{id}',
+             lambda c, _: c.put(f'{projects}/{sample.project_id}', json={'description': unique_name('Updated')})),
+        Case('DELETE /projects/{id}', lambda c, project_id: c.delete(f'{projects}/{project_id}'), setup=insert_project),
+        Case('GET /tasks/', lambda c, _: c.get(f'{tasks}/')),
+        Case('GET /tasks/[deep_page]',
+             lambda c, _: c.get(f'{tasks}/', params={'cursor': encode_cursor(sample.deep_after_id)})),
+        Case('GET /tasks/[filtered,-deadline]',
+             lambda c, _: c.get(f'{tasks}/', params={'status': ['todo', 'doing'], 'sort': '-deadline'})),
+        Case('GET /tasks/project/{id}', lambda c, _: c.get(f'{tasks}/project/{sample.project_id}')),
+        Case('GET /tasks/overdue', lambda c, _: c.get(f'{tasks}/overdue')),
+        Case('GET /tasks/search', lambda c, _: c.get(f'{tasks}/search', params={'q': sample.search_term})),
+        Case('GET /tasks/{id}', lambda c, _: c.get(f'{tasks}/{sample.task_id}')),
+        Case('POST /tasks/', lambda c, _: c.post(f'{tasks}/', params={'project_id': sample.project_id}, json=task_body())),
+        Case('POST /tasks/bulk', lambda c, _: c.post(
+            f'{tasks}/bulk', json={'tasks': [{**task_body(), 'project_id': sample.project_id} for _ in range(BATCH)]})),
+        Case('PUT /tasks/{id}',
+             lambda c, _: c.put(f'{tasks}/{sample.task_id}', json={'description': unique_name('Updated')})),
+        Case('PATCH /tasks/{id}/status', lambda c, task_ids: c.patch(f'{tasks}/{task_ids[0]}/status', json={'status': 'doing'}),
+             setup=lambda s: insert_tasks(s, sample.project_id, 1)),
+        Case('POST /tasks/{id}/close', lambda c, task_ids: c.post(f'{tasks}/{task_ids[0]}/close'),
+             setup=lambda s: insert_tasks(s, sample.project_id, 1)),
+        Case('DELETE /tasks/{id}', lambda c, task_ids: c.delete(f'{tasks}/{task_ids[0]}'),
+             setup=lambda s: insert_tasks(s, sample.project_id, 1)),
+        Case('POST /tasks/bulk/close', lambda c, task_ids: c.post(f'{tasks}/bulk/close', json={'task_ids': task_ids}),
+             setup=lambda s: insert_tasks(s, sample.project_id, BATCH)),
+        Case('PATCH /tasks/bulk/status',
+             lambda c, task_ids: c.patch(f'{tasks}/bulk/status', json={'task_ids': task_ids, 'status': 'doing'}),
+             setup=lambda s: insert_tasks(s, sample.project_id, BATCH)),
+        Case('POST /tasks/bulk/delete', lambda c, task_ids: c.post(f'{tasks}/bulk/delete', json={'task_ids': task_ids}),
+             setup=lambda s: insert_tasks(s, sample.project_id, BATCH)),
+    ]
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    timings = sorted(timing * 1000 for timing in timings)
+    return {
+        'runs': len(timings),
+        'min_ms': round(timings[0], 4),
+        'median_ms': round(statistics.median(timings), 4),
+        'mean_ms': round(statistics.fmean(timings), 4),
+        'p95_ms': round(timings[max(0, -(-len(timings) * 95 // 100) - 1)], 4),
+        'max_ms': round(timings[-1], 4),
+    }
+
+
+def clear_caches() -> None:
+    task_cache.clear()
+    project_cache.clear()
+
+
+def run_repository_case(case: Case, sessions: sessionmaker, repeat: int) -> Dict[str, float]:
+    timings = []
+    for run in range(repeat + 1):
+        with sessions() as session:
+            prepared = case.setup(session) if case.setup else None
+            clear_caches()
+            started = time.perf_counter()
+            result = case.run(session, prepared)
+            elapsed = time.perf_counter() - started
+            if case.teardown:
+                case.teardown(session, prepared, result)
+        if run:
+            timings.append(elapsed)
+    return summarize(timings)
+
+
+async def run_route_case(case: Case, client: httpx.AsyncClient, sessions: sessionmaker, repeat: int) -> Dict[str, float]:
+    timings = []
+    for run in range(repeat + 1):
+        with sessions() as session:
+            prepared = case.setup(session) if case.setup else None
+        clear_caches()
+        started = time.perf_counter()
+        response = await case.run(client, prepared)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise click.ClickException(f"{case.name} answered {response.status_code}: {response.text}")
+        if case.teardown:
+            with sessions() as session:
+                case.teardown(session, prepared, response)
+        if run:
+            timings.append(elapsed)
+    return summarize(timings)
+
+
+async def run_routes(cases: List[Case], sessions: sessionmaker, repeat: int, report: Callable) -> Dict[str, Dict]:
+    def get_benchmark_db():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    app.dependency_overrides[get_db] = get_benchmark_db
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://benchmark') as client:
+            for case in cases:
+                results[case.name] = await run_route_case(case, client, sessions, repeat)
+                report(case.name, results[case.name])
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        revision = subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return revision.stdout.strip()
+
+
+def print_comparison(results: Dict[str, Dict], baseline: Dict[str, Dict]) -> None:
+    print(f"\n{'median ms':<48}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<48}{'-':>12}{result['median_ms']:>12.3f}{'new':>10}")
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] * 100 if before['median_ms'] else 0.0
+        print(f"{name:<48}{before['median_ms']:>12.3f}{result['median_ms']:>12.3f}{change:>+9.1f}%")
+
+
+@click.command()
+@click.option('--database-url', default=None,
+              help='Benchmark database; its tables are dropped and recreated (default: a SQLite file in the temp directory)')
+@click.option('--projects', type=click.IntRange(min=1), default=20, show_default=True, help='Projects to seed')
+@click.option('--tasks-per-project', type=click.IntRange(min=1), default=1000, show_default=True, help='Tasks seeded per project')
+@click.option('--seed', 'random_seed', type=int, default=0, show_default=True, help='Seed of the generated dataset')
+@click.option('--reuse', is_flag=True, help='Keep the data already in the database instead of seeding')
+@click.option('--repeat', type=click.IntRange(min=1), default=20, show_default=True, help='Timed runs per case')
+@click.option('--only', 'pattern', default=None, help='Only run the cases whose name contains this text')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='Write the results to this JSON file')
+@click.option('--compare', type=click.Path(exists=True, dir_okay=False), help='Results JSON of an earlier run to compare with')
+@click.option('--json', 'as_json', is_flag=True, help='Print machine-readable results')
+def main(database_url, projects, tasks_per_project, random_seed, reuse, repeat, pattern, output, compare, as_json):
+    if Config.USE_ASYNC_DB:
+        raise click.UsageError("The suite drives the sync session path; unset USE_ASYNC_DB")
+    database_url = database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'todo_list_benchmark.db')}"
+    # Services read their limits when built; lift them above the seeded dataset
+    os.environ['MAX_NUMBER_OF_PROJECTS'] = str(10 ** 9)
+    os.environ['MAX_NUMBER_OF_TASKS_PER_PROJECT'] = str(10 ** 9)
+    
+    engine = create_engine(database_url)
+    sessions = sessionmaker(bind=engine, autoflush=False)
+    if not reuse:
+        started = time.perf_counter()
+        datasets.reset_schema(engine)
+        datasets.seed(engine, projects, tasks_per_project, seed=random_seed)
+        print(f"Seeded {projects} x {tasks_per_project} tasks in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    with sessions() as session:
+        sample = pick_sample(session)
+    
+    def report(name, result):
+        if not as_json:
+            print(f"{name:<48}{result['median_ms']:>10.3f} ms median{result['p95_ms']:>10.3f} ms p95")
+    
+    results = {}
+    for case in repository_cases(sample):
+        if pattern is None or pattern in case.name:
+            results[case.name] = run_repository_case(case, sessions, repeat)
+            report(case.name, results[case.name])
+    cases = [case for case in route_cases(sample) if pattern is None or pattern in case.name]
+    results.update(asyncio.run(run_routes(cases, sessions, repeat, report)))
+    
+    document = {
+        'meta': {
+            'revision': git_revision(),
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'dialect': engine.dialect.name,
+            'server_version': '.'.join(map(str, engine.dialect.server_version_info or ())),
+            'python': platform.python_version(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'entity_cache': Config.ENTITY_CACHE_BACKEND,
+            'dataset': {'seed': random_seed, 'reused': reuse, **datasets.describe(engine)},
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+    if output:
+        with open(output, 'w') as results_file:
+            json.dump(document, results_file, indent=2, sort_keys=True)
+            results_file.write('\n')
+    if as_json:
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        print()
+    if compare:
+        with open(compare) as baseline_file:
+            print_comparison(results, json.load(baseline_file)['results'])
+
+
+if __name__ == '__main__':
+    main()
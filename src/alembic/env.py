@@ -24,7 +24,7 @@ if config.config_file_name is not None:
 # add your model's MetaData object here
 # for 'autogenerate' support
 from todo_list.db.base import Base
-from todo_list.models import Project, Task
+from todo_list.models import Project, ProjectCounter, Task
 target_metadata = Base.metadata
 
 
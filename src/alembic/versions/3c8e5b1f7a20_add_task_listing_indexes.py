@@ -0,0 +1,42 @@
+"""add_task_listing_indexes
+
+Revision ID: 3c8e5b1f7a20
+Revises: f21a23cecd8b
+Create Date: 2026-10-17 11:40:12.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8e5b1f7a20'
+down_revision: Union[str, Sequence[str], None] = 'f21a23cecd8b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Filter and sort columns of GET /tasks/, each followed by id so keyset
+# pagination can seek directly to the row after the cursor.
+LISTING_INDEXES = {
+    'ix_tasks_status_id': ['status', 'id'],
+    'ix_tasks_deadline_id': ['deadline', 'id'],
+    'ix_tasks_created_at_id': ['created_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, columns in LISTING_INDEXES.items():
+            op.create_index(name, 'tasks', columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in reversed(list(LISTING_INDEXES)):
+            op.drop_index(name, table_name='tasks', postgresql_concurrently=True)
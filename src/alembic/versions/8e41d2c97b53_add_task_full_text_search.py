@@ -0,0 +1,85 @@
+"""add_task_full_text_search
+
+Revision ID: 8e41d2c97b53
+Revises: d4a8c61f0e93
+Create Date: 2026-10-17 14:05:37.918244
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41d2c97b53'
+down_revision: Union[str, Sequence[str], None] = 'd4a8c61f0e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# PostgreSQL: weighted tsvector of title (A) and description (B), kept
+# current by the database as a stored generated column.
+POSTGRES_SEARCH_VECTOR = """
+    ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+"""
+
+# SQLite: external-content FTS5 table kept in sync by triggers.
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Adding a stored generated column rewrites the table once
+        op.execute(POSTGRES_SEARCH_VECTOR)
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_tasks_search_vector', 'tasks', ['search_vector'], unique=False,
+                postgresql_using='gin', postgresql_concurrently=True
+            )
+    elif dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_tasks_search_vector', table_name='tasks', postgresql_concurrently=True)
+        op.drop_column('tasks', 'search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('tasks_fts_au', 'tasks_fts_ad', 'tasks_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
@@ -0,0 +1,41 @@
+"""add_open_tasks_by_project_index
+
+Revision ID: a5c2e7d91b36
+Revises: b7f3a9e2c514
+Create Date: 2026-10-17 17:05:41.662904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c2e7d91b36'
+down_revision: Union[str, Sequence[str], None] = 'b7f3a9e2c514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Unclosed tasks of a project in creation order, as read by the overdue count
+# and oldest open task of ProjectRepository.get_status_stats.
+OPEN_PREDICATE = sa.text("closed_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_open_project_created_at', 'tasks', ['project_id', 'created_at'], unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=OPEN_PREDICATE,
+            sqlite_where=OPEN_PREDICATE
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_open_project_created_at', table_name='tasks', postgresql_concurrently=True)
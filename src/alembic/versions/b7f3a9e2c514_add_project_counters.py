@@ -0,0 +1,188 @@
+"""add_project_counters
+
+Revision ID: b7f3a9e2c514
+Revises: 8e41d2c97b53
+Create Date: 2026-10-17 16:20:48.307615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7f3a9e2c514'
+down_revision: Union[str, Sequence[str], None] = '8e41d2c97b53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# PostgreSQL: statement-level triggers with transition tables apply the net
+# change of each statement to each project's counters once.
+POSTGRES_COUNTER_DDL = [
+    """
+    CREATE FUNCTION project_counters_add(project_ids integer[], statuses varchar[], deltas integer[])
+    RETURNS void LANGUAGE sql AS $$
+        INSERT INTO project_counters AS counters (project_id, todo_count, doing_count, done_count)
+        SELECT d.project_id,
+               coalesce(sum(d.delta) FILTER (WHERE d.status = 'todo'), 0),
+               coalesce(sum(d.delta) FILTER (WHERE d.status = 'doing'), 0),
+               coalesce(sum(d.delta) FILTER (WHERE d.status = 'done'), 0)
+        FROM unnest(project_ids, statuses, deltas) AS d(project_id, status, delta)
+        JOIN projects ON projects.id = d.project_id
+        GROUP BY d.project_id
+        ORDER BY d.project_id
+        ON CONFLICT (project_id) DO UPDATE SET
+            todo_count = counters.todo_count + EXCLUDED.todo_count,
+            doing_count = counters.doing_count + EXCLUDED.doing_count,
+            done_count = counters.done_count + EXCLUDED.done_count
+    $$
+    """,
+    """
+    CREATE FUNCTION project_counters_on_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM project_counters_add(array_agg(project_id), array_agg(status), array_agg(1)) FROM new_rows;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE FUNCTION project_counters_on_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM project_counters_add(array_agg(project_id), array_agg(status), array_agg(-1)) FROM old_rows;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE FUNCTION project_counters_on_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM project_counters_add(array_agg(d.project_id), array_agg(d.status), array_agg(d.delta))
+        FROM (
+            WITH moved AS (
+                SELECT old_rows.project_id AS old_project_id, old_rows.status AS old_status,
+                       new_rows.project_id AS new_project_id, new_rows.status AS new_status
+                FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+                WHERE (old_rows.project_id, old_rows.status) IS DISTINCT FROM (new_rows.project_id, new_rows.status)
+            )
+            SELECT old_project_id AS project_id, old_status AS status, -1 AS delta FROM moved
+            UNION ALL
+            SELECT new_project_id, new_status, 1 FROM moved
+        ) AS d;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER project_counters_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counters_on_insert()
+    """,
+    """
+    CREATE TRIGGER project_counters_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counters_on_delete()
+    """,
+    """
+    CREATE TRIGGER project_counters_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counters_on_update()
+    """,
+]
+
+# SQLite: row-level triggers.
+SQLITE_COUNTER_DDL = [
+    """
+    CREATE TRIGGER project_counters_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO project_counters (project_id, todo_count, doing_count, done_count)
+        VALUES (new.project_id, new.status IS 'todo', new.status IS 'doing', new.status IS 'done')
+        ON CONFLICT (project_id) DO UPDATE SET
+            todo_count = todo_count + excluded.todo_count,
+            doing_count = doing_count + excluded.doing_count,
+            done_count = done_count + excluded.done_count;
+    END
+    """,
+    """
+    CREATE TRIGGER project_counters_ad AFTER DELETE ON tasks BEGIN
+        UPDATE project_counters SET
+            todo_count = todo_count - (old.status IS 'todo'),
+            doing_count = doing_count - (old.status IS 'doing'),
+            done_count = done_count - (old.status IS 'done')
+        WHERE project_id = old.project_id;
+    END
+    """,
+    """
+    CREATE TRIGGER project_counters_au AFTER UPDATE OF status, project_id ON tasks
+    WHEN old.status IS NOT new.status OR old.project_id IS NOT new.project_id BEGIN
+        UPDATE project_counters SET
+            todo_count = todo_count - (old.status IS 'todo'),
+            doing_count = doing_count - (old.status IS 'doing'),
+            done_count = done_count - (old.status IS 'done')
+        WHERE project_id = old.project_id;
+        INSERT INTO project_counters (project_id, todo_count, doing_count, done_count)
+        VALUES (new.project_id, new.status IS 'todo', new.status IS 'doing', new.status IS 'done')
+        ON CONFLICT (project_id) DO UPDATE SET
+            todo_count = todo_count + excluded.todo_count,
+            doing_count = doing_count + excluded.doing_count,
+            done_count = done_count + excluded.done_count;
+    END
+    """,
+    """
+    CREATE TRIGGER project_counters_project_ad AFTER DELETE ON projects BEGIN
+        DELETE FROM project_counters WHERE project_id = old.id;
+    END
+    """,
+]
+
+BACKFILL_COUNTERS = """
+    INSERT INTO project_counters (project_id, todo_count, doing_count, done_count)
+    SELECT project_id,
+           sum(CASE WHEN status = 'todo' THEN 1 ELSE 0 END),
+           sum(CASE WHEN status = 'doing' THEN 1 ELSE 0 END),
+           sum(CASE WHEN status = 'done' THEN 1 ELSE 0 END)
+    FROM tasks
+    GROUP BY project_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'project_counters',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('todo_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('doing_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('done_count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id')
+    )
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Writers wait while the counters are backfilled, so none is missed
+        op.execute("LOCK TABLE tasks IN SHARE MODE")
+        statements = POSTGRES_COUNTER_DDL
+    elif dialect == 'sqlite':
+        statements = SQLITE_COUNTER_DDL
+    else:
+        statements = []
+    for statement in statements:
+        op.execute(statement)
+    op.execute(BACKFILL_COUNTERS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for trigger in ('project_counters_update', 'project_counters_delete', 'project_counters_insert'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON tasks")
+        for function in (
+            'project_counters_on_update()', 'project_counters_on_delete()', 'project_counters_on_insert()',
+            'project_counters_add(integer[], varchar[], integer[])'
+        ):
+            op.execute(f"DROP FUNCTION IF EXISTS {function}")
+    elif dialect == 'sqlite':
+        for trigger in ('project_counters_project_ad', 'project_counters_au', 'project_counters_ad', 'project_counters_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.drop_table('project_counters')
@@ -0,0 +1,44 @@
+"""normalize_sqlite_timestamps
+
+Revision ID: d4a8c61f0e93
+Revises: 3c8e5b1f7a20
+Create Date: 2026-10-17 16:22:08.417530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8c61f0e93'
+down_revision: Union[str, Sequence[str], None] = '3c8e5b1f7a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite stores datetimes as text. Rows stamped by CURRENT_TIMESTAMP have no
+# fraction, while SQLAlchemy binds 'YYYY-MM-DD HH:MM:SS.ffffff', so cursors and
+# created_after/created_before compared the two formats as strings.
+TIMESTAMP_COLUMNS = {
+    'tasks': ['created_at', 'updated_at'],
+    'projects': ['created_at', 'updated_at'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"UPDATE {table} SET {column} = {column} || '.000000' WHERE length({column}) = 19"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The padded values are read back unchanged, so there is nothing to undo.
+    pass
@@ -0,0 +1,46 @@
+"""add_task_query_indexes
+
+Revision ID: f21a23cecd8b
+Revises: 9d3952421f6b
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f21a23cecd8b'
+down_revision: Union[str, Sequence[str], None] = '9d3952421f6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Open tasks with a deadline, as filtered by TaskRepository.get_overdue_tasks.
+# The predicate has no bound parameters so the planner can always prove it.
+OPEN_DEADLINE_PREDICATE = sa.text("deadline IS NOT NULL AND closed_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_tasks_project_id'), 'tasks', ['project_id'], unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tasks_open_deadline', 'tasks', ['deadline'], unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=OPEN_DEADLINE_PREDICATE,
+            sqlite_where=OPEN_DEADLINE_PREDICATE
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_open_deadline', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_tasks_project_id'), table_name='tasks', postgresql_concurrently=True)
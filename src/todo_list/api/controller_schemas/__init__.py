@@ -1,12 +1,27 @@
 from .requests.project_requests import ProjectCreate, ProjectUpdate
-from .requests.task_requests import TaskCreate, TaskUpdate, TaskStatusUpdate
-from .responses.project_responses import ProjectResponse, ProjectListResponse
-from .responses.task_responses import TaskResponse, TaskListResponse
-from .responses.base_responses import StandardResponse, ErrorResponse
+from .requests.task_requests import (
+    TaskCreate, TaskBulkCreate, TaskBulkCreateItem, TaskBulkIds, TaskBulkStatusUpdate, TaskUpdate, TaskStatusUpdate
+)
+from .responses.project_responses import (
+    ProjectResponse, ProjectListResponse, ProjectStatsResponse, ProjectStatsListResponse,
+    ProjectDataResponse, ProjectListDataResponse, ProjectStatsListDataResponse
+)
+from .responses.task_responses import (
+    TaskResponse, TaskListResponse, TaskSearchResult, TaskSearchListResponse, TaskBulkCreateResponse,
+    TaskBulkItemError, TaskBulkOperationResponse, TaskDataResponse, TaskListDataResponse, TaskSearchDataResponse,
+    TaskBulkCreateDataResponse, TaskBulkOperationDataResponse
+)
+from .responses.base_responses import StandardResponse, DataResponse, ErrorResponse
 
 
 __all__ = [
     'ProjectCreate', 'ProjectUpdate', 'ProjectResponse', 'ProjectListResponse',
     'TaskCreate', 'TaskUpdate', 'TaskStatusUpdate', 'TaskResponse', 'TaskListResponse',
-    'StandardResponse', 'ErrorResponse'
+    'TaskBulkCreate', 'TaskBulkCreateItem', 'TaskBulkCreateResponse', 'TaskBulkItemError',
+    'TaskBulkIds', 'TaskBulkStatusUpdate', 'TaskBulkOperationResponse',
+    'ProjectStatsResponse', 'ProjectStatsListResponse', 'ProjectStatsListDataResponse',
+    'ProjectDataResponse', 'ProjectListDataResponse', 'TaskDataResponse', 'TaskListDataResponse',
+    'TaskSearchResult', 'TaskSearchListResponse', 'TaskSearchDataResponse',
+    'TaskBulkCreateDataResponse', 'TaskBulkOperationDataResponse',
+    'StandardResponse', 'DataResponse', 'ErrorResponse'
 ]
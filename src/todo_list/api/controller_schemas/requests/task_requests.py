@@ -1,9 +1,10 @@
 import os
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from todo_list.config import Config
 from todo_list.models.task import TaskStatus
 
 
@@ -32,6 +33,73 @@ class TaskCreate(BaseModel):
         }
 
 
+class TaskBulkCreateItem(TaskCreate):
+    """Schema for one task of a bulk create request"""
+    project_id: int = Field(..., description="Project ID to create task in")
+    # Lengths are checked per item by the service, so one bad title is
+    # reported in the item errors instead of rejecting the whole request
+    title: str = Field(..., description="Task title")
+    description: Optional[str] = Field(None, description="Task description")
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks across projects"""
+    tasks: List[TaskBulkCreateItem] = Field(
+        ...,
+        min_length=1,
+        max_length=Config.MAX_BULK_TASKS,
+        description="Tasks to create"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "tasks": [
+                    {
+                        "project_id": 1,
+                        "title": "Write documentation",
+                        "description": "Complete API documentation",
+                        "deadline": "2024-12-31T17:00:00"
+                    },
+                    {
+                        "project_id": 2,
+                        "title": "Review pull requests"
+                    }
+                ]
+            }
+        }
+
+
+class TaskBulkIds(BaseModel):
+    """Schema for a bulk operation on a list of task ids"""
+    task_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=Config.MAX_BULK_TASKS,
+        description="IDs of the tasks to operate on"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_ids": [1, 2, 3]
+            }
+        }
+
+
+class TaskBulkStatusUpdate(TaskBulkIds):
+    """Schema for updating the status of many tasks"""
+    status: TaskStatus = Field(..., description="New task status")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_ids": [1, 2, 3],
+                "status": "doing"
+            }
+        }
+
+
 class TaskUpdate(BaseModel):
     """Schema for updating an existing task"""
     title: Optional[str] = Field(
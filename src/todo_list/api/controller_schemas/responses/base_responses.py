@@ -1,4 +1,4 @@
-from typing import Optional, Any
+from typing import Generic, Optional, Any, TypeVar
 
 from pydantic import BaseModel
 
@@ -19,6 +19,16 @@ class StandardResponse(BaseModel):
         }
 
 
+DataT = TypeVar('DataT')
+
+
+class DataResponse(BaseModel, Generic[DataT]):
+    """Standard response format with a typed payload"""
+    status: str
+    message: str
+    data: DataT
+
+
 class ErrorResponse(BaseModel):
     """Standard error response format"""
     status: str
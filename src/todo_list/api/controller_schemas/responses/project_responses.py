@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from pydantic import BaseModel
 
+from .base_responses import DataResponse
+
 
 class ProjectResponse(BaseModel):
     """Schema for project response"""
@@ -15,12 +17,25 @@ class ProjectResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_row(cls, project, task_count: int) -> 'ProjectResponse':
+        """Build the response from a (Project, task_count) row"""
+        return cls(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            task_count=task_count
+        )
 
 
 class ProjectListResponse(BaseModel):
     """Schema for project list response"""
     projects: List[ProjectResponse]
     total: int
+    next_cursor: Optional[str] = None
     
     class Config:
         json_schema_extra = {
@@ -35,6 +50,56 @@ class ProjectListResponse(BaseModel):
                         "task_count": 5
                     }
                 ],
-                "total": 1
+                "total": 1,
+                "next_cursor": "WzFd"
             }
         }
+
+
+class ProjectStatsResponse(BaseModel):
+    """Schema for the task statistics of a project"""
+    id: int
+    name: str
+    task_count: int
+    status_counts: Dict[str, int]
+    overdue_count: int
+    oldest_open_created_at: Optional[datetime]
+    oldest_open_age_seconds: Optional[float]
+
+
+class ProjectStatsListResponse(BaseModel):
+    """Schema for project statistics response"""
+    projects: List[ProjectStatsResponse]
+    total: int
+    next_cursor: Optional[str] = None
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "projects": [
+                    {
+                        "id": 1,
+                        "name": "Work Tasks",
+                        "task_count": 5,
+                        "status_counts": {"todo": 2, "doing": 1, "done": 2},
+                        "overdue_count": 1,
+                        "oldest_open_created_at": "2024-01-10T09:15:00",
+                        "oldest_open_age_seconds": 86400.0
+                    }
+                ],
+                "total": 1,
+                "next_cursor": "WzFd"
+            }
+        }
+
+
+class ProjectDataResponse(DataResponse[ProjectResponse]):
+    """Response envelope holding a single project"""
+
+
+class ProjectListDataResponse(DataResponse[ProjectListResponse]):
+    """Response envelope holding a page of projects"""
+
+
+class ProjectStatsListDataResponse(DataResponse[ProjectStatsListResponse]):
+    """Response envelope holding the task statistics of a page of projects"""
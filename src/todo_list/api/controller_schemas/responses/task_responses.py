@@ -1,10 +1,12 @@
 from typing import List, Optional
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import AliasPath, BaseModel, Field
 
 from todo_list.models.task import TaskStatus
 
+from .base_responses import DataResponse
+
 
 class TaskResponse(BaseModel):
     """Schema for task response"""
@@ -17,16 +19,18 @@ class TaskResponse(BaseModel):
     updated_at: Optional[datetime]
     closed_at: Optional[datetime]
     project_id: int
-    project_name: str
+    project_name: str = Field(validation_alias=AliasPath('project', 'name'))
     
     class Config:
         from_attributes = True
+        populate_by_name = True
 
 
 class TaskListResponse(BaseModel):
     """Schema for task list response"""
     tasks: List[TaskResponse]
     total: int
+    next_cursor: Optional[str] = None
     
     class Config:
         json_schema_extra = {
@@ -45,6 +49,120 @@ class TaskListResponse(BaseModel):
                         "project_name": "Work Tasks"
                     }
                 ],
-                "total": 1
+                "total": 1,
+                "next_cursor": "WzFd"
+            }
+        }
+
+
+class TaskSearchResult(TaskResponse):
+    """Schema for a task matching a search, with its relevance"""
+    rank: float
+
+
+class TaskSearchListResponse(BaseModel):
+    """Schema for task search response, best matches first"""
+    tasks: List[TaskSearchResult]
+    total: int
+    next_cursor: Optional[str] = None
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "tasks": [
+                    {
+                        "id": 1,
+                        "title": "Write documentation",
+                        "description": "Complete API docs",
+                        "status": "todo",
+                        "deadline": "2024-12-31T17:00:00",
+                        "created_at": "2024-01-10T09:15:00",
+                        "updated_at": None,
+                        "closed_at": None,
+                        "project_id": 1,
+                        "project_name": "Work Tasks",
+                        "rank": 0.6
+                    }
+                ],
+                "total": 1,
+                "next_cursor": "WzAuNiwxXQ"
             }
         }
+
+
+class TaskBulkItemError(BaseModel):
+    """Schema for a task that could not be created by a bulk request"""
+    index: int
+    project_id: Optional[int]
+    message: str
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Schema for bulk task creation response"""
+    created: List[TaskResponse]
+    errors: List[TaskBulkItemError]
+    total_created: int
+    total_failed: int
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created": [
+                    {
+                        "id": 1,
+                        "title": "Write documentation",
+                        "description": "Complete API docs",
+                        "status": "todo",
+                        "deadline": "2024-12-31T17:00:00",
+                        "created_at": "2024-01-10T09:15:00",
+                        "updated_at": None,
+                        "closed_at": None,
+                        "project_id": 1,
+                        "project_name": "Work Tasks"
+                    }
+                ],
+                "errors": [
+                    {
+                        "index": 1,
+                        "project_id": 2,
+                        "message": "Project with id 2 not found"
+                    }
+                ],
+                "total_created": 1,
+                "total_failed": 1
+            }
+        }
+
+
+class TaskBulkOperationResponse(BaseModel):
+    """Schema for bulk close, status update and delete responses"""
+    affected_ids: List[int]
+    missing_ids: List[int]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "affected_ids": [1, 2],
+                "missing_ids": [3]
+            }
+        }
+
+
+class TaskDataResponse(DataResponse[TaskResponse]):
+    """Response envelope holding a single task"""
+
+
+class TaskListDataResponse(DataResponse[TaskListResponse]):
+    """Response envelope holding a page of tasks"""
+
+
+class TaskSearchDataResponse(DataResponse[TaskSearchListResponse]):
+    """Response envelope holding a page of search results"""
+
+
+class TaskBulkCreateDataResponse(DataResponse[TaskBulkCreateResponse]):
+    """Response envelope of a bulk task creation"""
+
+
+class TaskBulkOperationDataResponse(DataResponse[TaskBulkOperationResponse]):
+    """Response envelope of a bulk close, status update or delete"""
@@ -1,11 +1,18 @@
+from operator import itemgetter
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from todo_list.services.project_service import ProjectService
 from todo_list.api.controller_schemas.requests.project_requests import ProjectCreate, ProjectUpdate
-from todo_list.api.controller_schemas.responses.project_responses import ProjectResponse, ProjectListResponse
+from todo_list.api.controller_schemas.responses.project_responses import (
+    ProjectResponse, ProjectListResponse, ProjectStatsListResponse,
+    ProjectDataResponse, ProjectListDataResponse, ProjectStatsListDataResponse
+)
 from todo_list.api.controller_schemas.responses.base_responses import StandardResponse, ErrorResponse
-from todo_list.api.dependencies.services import get_project_service
+from todo_list.api.dependencies.services import project_service_provider, run_service
+from todo_list.api.dependencies.pagination import Pagination, get_pagination
+from todo_list.api.dependencies.conditional import ConditionalRequest, get_conditional_request
+from todo_list.api.responses import FastJSONResponse
 from todo_list.exceptions import NotFoundException, DuplicateEntryException, ValidationException, BusinessRuleException
 
 
@@ -13,18 +20,18 @@ router = APIRouter()
 
 @router.post(
     "/",
-    response_model=StandardResponse,
+    response_model=ProjectDataResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project",
     responses={
-        201: {"model": StandardResponse, "description": "Project created successfully"},
+        201: {"model": ProjectDataResponse, "description": "Project created successfully"},
         400: {"model": ErrorResponse, "description": "Validation error"},
         409: {"model": ErrorResponse, "description": "Project with this name already exists"}
     }
 )
 async def create_project(
     project_data: ProjectCreate,
-    project_service: ProjectService = Depends(get_project_service)
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
     Create a new project with the given name and description.
@@ -33,24 +40,21 @@ async def create_project(
     - **description**: Optional project description
     """
     try:
-        project = project_service.create_project(
+        project = await run_service(
+            project_service.create_project,
             name=project_data.name,
             description=project_data.description
         )
         
-        response_data = ProjectResponse(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            task_count=len(project.tasks)
-        )
+        response_data = ProjectResponse.from_row(project, 0)
         
-        return StandardResponse(
-            status="success",
-            message="Project created successfully",
-            data=response_data
+        return FastJSONResponse(
+            ProjectDataResponse(
+                status="success",
+                message="Project created successfully",
+                data=response_data
+            ),
+            status_code=status.HTTP_201_CREATED
         )
         
     except DuplicateEntryException as e:
@@ -66,80 +70,136 @@ async def create_project(
 
 @router.get(
     "/",
-    response_model=StandardResponse,
+    response_model=ProjectListDataResponse,
     summary="Get all projects",
     responses={
-        200: {"model": StandardResponse, "description": "Projects retrieved successfully"}
+        200: {"model": ProjectListDataResponse, "description": "Projects retrieved successfully"},
+        304: {"description": "Page unchanged since the ETag sent in If-None-Match"}
     }
 )
 async def get_all_projects(
-    project_service: ProjectService = Depends(get_project_service)
+    pagination: Pagination = Depends(get_pagination),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
-    Retrieve all projects with their task counts.
+    Retrieve projects with their task counts, one page at a time.
+    
+    - **limit**: Page size (optional)
+    - **cursor**: Cursor of the next page, taken from `next_cursor` (optional)
+    - **If-None-Match**: ETag of a previous response; answered with 304 when unchanged
     """
-    projects = project_service.get_all_projects()
+    version = await run_service(
+        project_service.get_projects_version,
+        limit=pagination.fetch_size,
+        after_id=pagination.after_id
+    )
+    not_modified = conditional.evaluate(pagination.limit, pagination.after_id, *version)
+    if not_modified:
+        return not_modified
     
-    project_responses = []
-    for project in projects:
-        project_responses.append(
-            ProjectResponse(
-                id=project.id,
-                name=project.name,
-                description=project.description,
-                created_at=project.created_at,
-                updated_at=project.updated_at,
-                task_count=len(project.tasks)
-            )
-        )
+    rows = await run_service(
+        project_service.get_project_rows_with_task_counts,
+        limit=pagination.fetch_size,
+        after_id=pagination.after_id
+    )
+    rows, next_cursor = pagination.split(rows, key=itemgetter('id'))
     
     response_data = ProjectListResponse(
-        projects=project_responses,
-        total=len(project_responses)
+        projects=rows,
+        total=len(rows),
+        next_cursor=next_cursor
     )
     
-    return StandardResponse(
-        status="success",
-        message="Projects retrieved successfully",
-        data=response_data
+    return FastJSONResponse(
+        ProjectListDataResponse(
+            status="success",
+            message="Projects retrieved successfully",
+            data=response_data
+        ),
+        headers=conditional.headers
+    )
+
+@router.get(
+    "/stats",
+    response_model=ProjectStatsListDataResponse,
+    summary="Get task statistics per project",
+    responses={
+        200: {"model": ProjectStatsListDataResponse, "description": "Project statistics retrieved successfully"}
+    }
+)
+async def get_project_stats(
+    pagination: Pagination = Depends(get_pagination),
+    project_service: ProjectService = Depends(project_service_provider)
+):
+    """
+    Retrieve task counts by status, overdue task counts and the age of the
+    oldest open task of each project, one page at a time.
+    
+    - **limit**: Page size (optional)
+    - **cursor**: Cursor of the next page, taken from `next_cursor` (optional)
+    """
+    rows = await run_service(
+        project_service.get_project_stats,
+        limit=pagination.fetch_size,
+        after_id=pagination.after_id
+    )
+    rows, next_cursor = pagination.split(rows, key=itemgetter('id'))
+    
+    response_data = ProjectStatsListResponse(
+        projects=rows,
+        total=len(rows),
+        next_cursor=next_cursor
+    )
+    
+    return FastJSONResponse(
+        ProjectStatsListDataResponse(
+            status="success",
+            message="Project statistics retrieved successfully",
+            data=response_data
+        )
     )
 
 @router.get(
     "/{project_id}",
-    response_model=StandardResponse,
+    response_model=ProjectDataResponse,
     summary="Get project by ID",
     responses={
-        200: {"model": StandardResponse, "description": "Project retrieved successfully"},
+        200: {"model": ProjectDataResponse, "description": "Project retrieved successfully"},
+        304: {"description": "Project unchanged since the ETag sent in If-None-Match"},
         404: {"model": ErrorResponse, "description": "Project not found"}
     }
 )
 async def get_project(
     project_id: int,
-    project_service: ProjectService = Depends(get_project_service)
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
     Retrieve a specific project by its ID.
     
     - **project_id**: Project ID (integer)
+    - **If-None-Match**: ETag of a previous response; answered with 304 when unchanged
     """
     try:
-        project = project_service.get_project(project_id)
-        if not project:
+        row = await run_service(project_service.get_project_with_task_count, project_id)
+        if not row:
             raise NotFoundException(f"Project with id {project_id} not found")
         
-        response_data = ProjectResponse(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            task_count=len(project.tasks)
-        )
+        project, task_count = row
+        not_modified = conditional.evaluate(project.id, project.updated_at or project.created_at, task_count)
+        if not_modified:
+            return not_modified
         
-        return StandardResponse(
-            status="success",
-            message="Project retrieved successfully",
-            data=response_data
+        response_data = ProjectResponse.from_row(project, task_count)
+        
+        return FastJSONResponse(
+            ProjectDataResponse(
+                status="success",
+                message="Project retrieved successfully",
+                data=response_data
+            ),
+            headers=conditional.headers
         )
         
     except NotFoundException as e:
@@ -150,10 +210,10 @@ async def get_project(
 
 @router.put(
     "/{project_id}",
-    response_model=StandardResponse,
+    response_model=ProjectDataResponse,
     summary="Update project",
     responses={
-        200: {"model": StandardResponse, "description": "Project updated successfully"},
+        200: {"model": ProjectDataResponse, "description": "Project updated successfully"},
         404: {"model": ErrorResponse, "description": "Project not found"},
         409: {"model": ErrorResponse, "description": "Project name already exists"}
     }
@@ -161,7 +221,7 @@ async def get_project(
 async def update_project(
     project_id: int,
     project_data: ProjectUpdate,
-    project_service: ProjectService = Depends(get_project_service)
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
     Update an existing project.
@@ -171,25 +231,22 @@ async def update_project(
     - **description**: New project description (optional)
     """
     try:
-        project = project_service.update_project(
+        project = await run_service(
+            project_service.update_project,
             project_id=project_id,
             name=project_data.name,
             description=project_data.description
         )
+        project, task_count = await run_service(project_service.get_project_with_task_count, project.id)
         
-        response_data = ProjectResponse(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            task_count=len(project.tasks)
-        )
+        response_data = ProjectResponse.from_row(project, task_count)
         
-        return StandardResponse(
-            status="success",
-            message="Project updated successfully",
-            data=response_data
+        return FastJSONResponse(
+            ProjectDataResponse(
+                status="success",
+                message="Project updated successfully",
+                data=response_data
+            )
         )
         
     except NotFoundException as e:
@@ -215,7 +272,7 @@ async def update_project(
 )
 async def delete_project(
     project_id: int,
-    project_service: ProjectService = Depends(get_project_service)
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
     Delete a project by its ID.
@@ -224,7 +281,7 @@ async def delete_project(
     - **Note**: Projects with existing tasks cannot be deleted
     """
     try:
-        project_service.delete_project(project_id)
+        await run_service(project_service.delete_project, project_id)
         
         return StandardResponse(
             status="success",
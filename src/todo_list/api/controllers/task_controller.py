@@ -1,26 +1,36 @@
-from typing import List, Optional
+from operator import itemgetter
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
 from todo_list.services.task_service import TaskService
 from todo_list.services.project_service import ProjectService
-from todo_list.api.controller_schemas.requests.task_requests import TaskCreate, TaskUpdate, TaskStatusUpdate
-from todo_list.api.controller_schemas.responses.task_responses import TaskResponse, TaskListResponse
+from todo_list.api.controller_schemas.requests.task_requests import (
+    TaskCreate, TaskBulkCreate, TaskBulkIds, TaskBulkStatusUpdate, TaskUpdate, TaskStatusUpdate
+)
+from todo_list.api.controller_schemas.responses.task_responses import (
+    TaskResponse, TaskListResponse, TaskSearchListResponse, TaskBulkCreateResponse, TaskBulkItemError,
+    TaskBulkOperationResponse, TaskDataResponse, TaskListDataResponse, TaskSearchDataResponse,
+    TaskBulkCreateDataResponse, TaskBulkOperationDataResponse
+)
 from todo_list.api.controller_schemas.responses.base_responses import StandardResponse, ErrorResponse
-from todo_list.api.dependencies.services import get_task_service, get_project_service
-from todo_list.exceptions import NotFoundException, ValidationException
-from todo_list.models.task import TaskStatus
+from todo_list.api.dependencies.services import task_service_provider, project_service_provider, run_service
+from todo_list.api.dependencies.pagination import Pagination, get_pagination
+from todo_list.api.dependencies.conditional import ConditionalRequest, get_conditional_request
+from todo_list.api.dependencies.filters import get_task_filter, get_task_sort
+from todo_list.api.responses import FastJSONResponse
+from todo_list.exceptions import BusinessRuleException, NotFoundException, ValidationException
+from todo_list.repositories.task_filter import TaskFilter
 
 
 router = APIRouter()
 
 @router.post(
     "/",
-    response_model=StandardResponse,
+    response_model=TaskDataResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
     responses={
-        201: {"model": StandardResponse, "description": "Task created successfully"},
+        201: {"model": TaskDataResponse, "description": "Task created successfully"},
         400: {"model": ErrorResponse, "description": "Validation error"},
         404: {"model": ErrorResponse, "description": "Project not found"}
     }
@@ -28,8 +38,8 @@ router = APIRouter()
 async def create_task(
     task_data: TaskCreate,
     project_id: int = Query(..., description="Project ID to create task in"),
-    task_service: TaskService = Depends(get_task_service),
-    project_service: ProjectService = Depends(get_project_service)
+    task_service: TaskService = Depends(task_service_provider),
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
     Create a new task in the specified project.
@@ -40,34 +50,27 @@ async def create_task(
     - **deadline**: Optional task deadline (datetime)
     """
     try:
-        project = project_service.get_project(project_id)
+        project = await run_service(project_service.get_project, project_id)
         if not project:
             raise NotFoundException(f"Project with id {project_id} not found")
         
-        task = task_service.create_task(
+        task = await run_service(
+            task_service.create_task,
             title=task_data.title,
             project_id=project_id,
             description=task_data.description,
             deadline=task_data.deadline
         )
         
-        response_data = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            deadline=task.deadline,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            closed_at=task.closed_at,
-            project_id=task.project_id,
-            project_name=task.project.name
-        )
+        response_data = TaskResponse.model_validate(task)
         
-        return StandardResponse(
-            status="success",
-            message="Task created successfully",
-            data=response_data
+        return FastJSONResponse(
+            TaskDataResponse(
+                status="success",
+                message="Task created successfully",
+                data=response_data
+            ),
+            status_code=status.HTTP_201_CREATED
         )
         
     except (NotFoundException, ValidationException) as e:
@@ -76,103 +79,275 @@ async def create_task(
             detail={"status": "error", "message": str(e)}
         )
 
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateDataResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many tasks",
+    responses={
+        201: {"model": TaskBulkCreateDataResponse, "description": "Every task created"},
+        207: {"model": TaskBulkCreateDataResponse, "description": "Some tasks created, with per-item errors"},
+        422: {"model": TaskBulkCreateDataResponse, "description": "No task created, with per-item errors"}
+    }
+)
+async def create_tasks_bulk(
+    bulk_data: TaskBulkCreate,
+    task_service: TaskService = Depends(task_service_provider)
+):
+    """
+    Create many tasks, possibly across projects, in a single transaction.
+    
+    - **tasks**: List of tasks, each with project_id, title, optional description and deadline
+    - **Note**: Invalid items are reported in `errors` by index; the others are still created.
+      The status is 201 when every task was created, 207 when some failed and 422 when all did
+    """
+    tasks, errors = await run_service(
+        task_service.create_tasks_bulk,
+        [item.model_dump() for item in bulk_data.tasks]
+    )
+    
+    task_responses = [TaskResponse.model_validate(task) for task in tasks]
+    
+    response_data = TaskBulkCreateResponse(
+        created=task_responses,
+        errors=[TaskBulkItemError(**error) for error in errors],
+        total_created=len(task_responses),
+        total_failed=len(errors)
+    )
+    
+    if not errors:
+        status_code = status.HTTP_201_CREATED
+    elif task_responses:
+        status_code = status.HTTP_207_MULTI_STATUS
+    else:
+        status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
+    
+    return FastJSONResponse(
+        TaskBulkCreateDataResponse(
+            status="success" if task_responses else "error",
+            message=f"Created {len(task_responses)} of {len(bulk_data.tasks)} tasks",
+            data=response_data
+        ),
+        status_code=status_code
+    )
+
+@router.post(
+    "/bulk/close",
+    response_model=TaskBulkOperationDataResponse,
+    summary="Close many tasks",
+    responses={
+        200: {"model": TaskBulkOperationDataResponse, "description": "Tasks closed, with the ids that were not found"}
+    }
+)
+async def close_tasks_bulk(
+    bulk_data: TaskBulkIds,
+    task_service: TaskService = Depends(task_service_provider)
+):
+    """
+    Close many tasks (mark as done) with a single statement.
+    
+    - **task_ids**: IDs of the tasks to close
+    """
+    affected_ids, missing_ids = await run_service(task_service.close_tasks, bulk_data.task_ids)
+    
+    return FastJSONResponse(
+        TaskBulkOperationDataResponse(
+            status="success",
+            message=f"Closed {len(affected_ids)} tasks",
+            data=TaskBulkOperationResponse(affected_ids=affected_ids, missing_ids=missing_ids)
+        )
+    )
+
+@router.patch(
+    "/bulk/status",
+    response_model=TaskBulkOperationDataResponse,
+    summary="Update the status of many tasks",
+    responses={
+        200: {"model": TaskBulkOperationDataResponse, "description": "Task statuses updated, with the ids that were not found"}
+    }
+)
+async def update_tasks_status_bulk(
+    bulk_data: TaskBulkStatusUpdate,
+    task_service: TaskService = Depends(task_service_provider)
+):
+    """
+    Update the status of many tasks with a single statement.
+    
+    - **task_ids**: IDs of the tasks to update
+    - **status**: New task status (todo, doing, done)
+    """
+    affected_ids, missing_ids = await run_service(
+        task_service.update_tasks_status,
+        bulk_data.task_ids,
+        bulk_data.status
+    )
+    
+    return FastJSONResponse(
+        TaskBulkOperationDataResponse(
+            status="success",
+            message=f"Updated the status of {len(affected_ids)} tasks",
+            data=TaskBulkOperationResponse(affected_ids=affected_ids, missing_ids=missing_ids)
+        )
+    )
+
+@router.post(
+    "/bulk/delete",
+    response_model=TaskBulkOperationDataResponse,
+    summary="Delete many tasks",
+    responses={
+        200: {"model": TaskBulkOperationDataResponse, "description": "Tasks deleted, with the ids that were not found"}
+    }
+)
+async def delete_tasks_bulk(
+    bulk_data: TaskBulkIds,
+    task_service: TaskService = Depends(task_service_provider)
+):
+    """
+    Delete many tasks with a single statement.
+    
+    - **task_ids**: IDs of the tasks to delete
+    """
+    affected_ids, missing_ids = await run_service(task_service.delete_tasks, bulk_data.task_ids)
+    
+    return FastJSONResponse(
+        TaskBulkOperationDataResponse(
+            status="success",
+            message=f"Deleted {len(affected_ids)} tasks",
+            data=TaskBulkOperationResponse(affected_ids=affected_ids, missing_ids=missing_ids)
+        )
+    )
+
 @router.get(
     "/",
-    response_model=StandardResponse,
+    response_model=TaskListDataResponse,
     summary="Get all tasks",
     responses={
-        200: {"model": StandardResponse, "description": "Tasks retrieved successfully"}
+        200: {"model": TaskListDataResponse, "description": "Tasks retrieved successfully"},
+        304: {"description": "Page unchanged since the ETag sent in If-None-Match"},
+        400: {"model": ErrorResponse, "description": "Invalid filter, sort order or cursor"}
     }
 )
 async def get_all_tasks(
-    task_service: TaskService = Depends(get_task_service)
+    pagination: Pagination = Depends(get_pagination),
+    task_filter: TaskFilter = Depends(get_task_filter),
+    sort: str = Depends(get_task_sort),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    task_service: TaskService = Depends(task_service_provider)
 ):
     """
-    Retrieve all tasks across all projects.
-    """
-    tasks = task_service.get_all_tasks()
+    Retrieve tasks across all projects, filtered and sorted in the database, one page at a time.
     
-    task_responses = []
-    for task in tasks:
-        task_responses.append(
-            TaskResponse(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                status=task.status,
-                deadline=task.deadline,
-                created_at=task.created_at,
-                updated_at=task.updated_at,
-                closed_at=task.closed_at,
-                project_id=task.project_id,
-                project_name=task.project.name
-            )
+    - **status**: Task status; repeat to match several (optional)
+    - **project_id**: Project ID; repeat to match several (optional)
+    - **deadline_after** / **deadline_before**: Deadline window (optional)
+    - **created_after** / **created_before**: Creation time window (optional)
+    - **sort**: id, deadline or created_at, prefixed with `-` for descending order (default id)
+    - **limit**: Page size (optional)
+    - **cursor**: Cursor of the next page, taken from `next_cursor`; only valid with the same sort (optional)
+    - **If-None-Match**: ETag of a previous response; answered with 304 when unchanged
+    """
+    sort_key = sort.lstrip('-')
+    listing = dict(
+        limit=pagination.fetch_size,
+        after_id=pagination.after_id,
+        task_filter=task_filter,
+        sort=sort,
+        after_value=pagination.sort_value if sort_key != 'id' else None
+    )
+    try:
+        version = await run_service(task_service.get_tasks_version, **listing)
+        not_modified = conditional.evaluate(pagination.limit, pagination.values, vars(task_filter), sort, *version)
+        if not_modified:
+            return not_modified
+        
+        rows = await run_service(task_service.get_task_rows, **listing)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": "error", "message": str(e)}
         )
     
+    key = itemgetter('id') if sort_key == 'id' else itemgetter(sort_key, 'id')
+    rows, next_cursor = pagination.split(rows, key=key)
+    
+    # Rows are validated into TaskResponse in one pass by the list model
     response_data = TaskListResponse(
-        tasks=task_responses,
-        total=len(task_responses)
+        tasks=rows,
+        total=len(rows),
+        next_cursor=next_cursor
     )
     
-    return StandardResponse(
-        status="success",
-        message="Tasks retrieved successfully",
-        data=response_data
+    return FastJSONResponse(
+        TaskListDataResponse(
+            status="success",
+            message="Tasks retrieved successfully",
+            data=response_data
+        ),
+        headers=conditional.headers
     )
 
 @router.get(
     "/project/{project_id}",
-    response_model=StandardResponse,
+    response_model=TaskListDataResponse,
     summary="Get tasks by project",
     responses={
-        200: {"model": StandardResponse, "description": "Tasks retrieved successfully"},
+        200: {"model": TaskListDataResponse, "description": "Tasks retrieved successfully"},
+        304: {"description": "Page unchanged since the ETag sent in If-None-Match"},
         404: {"model": ErrorResponse, "description": "Project not found"}
     }
 )
 async def get_tasks_by_project(
     project_id: int,
-    task_service: TaskService = Depends(get_task_service),
-    project_service: ProjectService = Depends(get_project_service)
+    pagination: Pagination = Depends(get_pagination),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    task_service: TaskService = Depends(task_service_provider),
+    project_service: ProjectService = Depends(project_service_provider)
 ):
     """
-    Retrieve all tasks for a specific project.
+    Retrieve tasks for a specific project, one page at a time.
     
     - **project_id**: Project ID (integer)
+    - **limit**: Page size (optional)
+    - **cursor**: Cursor of the next page, taken from `next_cursor` (optional)
+    - **If-None-Match**: ETag of a previous response; answered with 304 when unchanged
     """
     try:
         # Verify project exists
-        project = project_service.get_project(project_id)
+        project = await run_service(project_service.get_project, project_id)
         if not project:
             raise NotFoundException(f"Project with id {project_id} not found")
         
-        tasks = task_service.get_tasks_by_project(project_id)
+        version = await run_service(
+            task_service.get_tasks_version,
+            limit=pagination.fetch_size,
+            after_id=pagination.after_id,
+            project_id=project_id
+        )
+        not_modified = conditional.evaluate(project_id, pagination.limit, pagination.after_id, *version)
+        if not_modified:
+            return not_modified
         
-        task_responses = []
-        for task in tasks:
-            task_responses.append(
-                TaskResponse(
-                    id=task.id,
-                    title=task.title,
-                    description=task.description,
-                    status=task.status,
-                    deadline=task.deadline,
-                    created_at=task.created_at,
-                    updated_at=task.updated_at,
-                    closed_at=task.closed_at,
-                    project_id=task.project_id,
-                    project_name=task.project.name
-                )
-            )
+        rows = await run_service(
+            task_service.get_task_rows_by_project,
+            project_id,
+            limit=pagination.fetch_size,
+            after_id=pagination.after_id
+        )
+        rows, next_cursor = pagination.split(rows, key=itemgetter('id'))
         
         response_data = TaskListResponse(
-            tasks=task_responses,
-            total=len(task_responses)
+            tasks=rows,
+            total=len(rows),
+            next_cursor=next_cursor
         )
         
-        return StandardResponse(
-            status="success",
-            message="Tasks retrieved successfully",
-            data=response_data
+        return FastJSONResponse(
+            TaskListDataResponse(
+                status="success",
+                message="Tasks retrieved successfully",
+                data=response_data
+            ),
+            headers=conditional.headers
         )
         
     except NotFoundException as e:
@@ -181,46 +356,139 @@ async def get_tasks_by_project(
             detail={"status": "error", "message": str(e)}
         )
 
+@router.get(
+    "/overdue",
+    response_model=TaskListDataResponse,
+    summary="Get overdue tasks",
+    responses={
+        200: {"model": TaskListDataResponse, "description": "Overdue tasks retrieved successfully"},
+        304: {"description": "Overdue tasks unchanged since the ETag sent in If-None-Match"}
+    }
+)
+async def get_overdue_tasks(
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    task_service: TaskService = Depends(task_service_provider)
+):
+    """
+    Retrieve all overdue tasks (tasks with past deadlines that are not done).
+    
+    - **If-None-Match**: ETag of a previous response; answered with 304 when unchanged
+    """
+    version = await run_service(task_service.get_overdue_tasks_version)
+    not_modified = conditional.evaluate(*version)
+    if not_modified:
+        return not_modified
+    
+    rows = await run_service(task_service.get_overdue_task_rows)
+    
+    response_data = TaskListResponse(
+        tasks=rows,
+        total=len(rows)
+    )
+    
+    return FastJSONResponse(
+        TaskListDataResponse(
+            status="success",
+            message="Overdue tasks retrieved successfully",
+            data=response_data
+        ),
+        headers=conditional.headers
+    )
+
+@router.get(
+    "/search",
+    response_model=TaskSearchDataResponse,
+    summary="Search tasks",
+    responses={
+        200: {"model": TaskSearchDataResponse, "description": "Matching tasks retrieved successfully"},
+        400: {"model": ErrorResponse, "description": "Invalid query or cursor"}
+    }
+)
+async def search_tasks(
+    q: str = Query(..., min_length=1, description="Words to find in task titles and descriptions"),
+    pagination: Pagination = Depends(get_pagination),
+    task_service: TaskService = Depends(task_service_provider)
+):
+    """
+    Full-text search over task titles and descriptions, best matches first, one page at a time.
+    
+    - **q**: Search words; tasks must match all of them (title matches rank higher)
+    - **limit**: Page size (optional)
+    - **cursor**: Cursor of the next page, taken from `next_cursor`; only valid with the same query (optional)
+    """
+    try:
+        rows = await run_service(
+            task_service.search_task_rows,
+            q,
+            limit=pagination.fetch_size,
+            after_id=pagination.after_id,
+            after_rank=pagination.sort_value
+        )
+    except (ValidationException, BusinessRuleException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": "error", "message": str(e)}
+        )
+    
+    rows, next_cursor = pagination.split(rows, key=itemgetter('rank', 'id'))
+    
+    response_data = TaskSearchListResponse(
+        tasks=rows,
+        total=len(rows),
+        next_cursor=next_cursor
+    )
+    
+    return FastJSONResponse(
+        TaskSearchDataResponse(
+            status="success",
+            message="Matching tasks retrieved successfully",
+            data=response_data
+        )
+    )
+
 @router.get(
     "/{task_id}",
-    response_model=StandardResponse,
+    response_model=TaskDataResponse,
     summary="Get task by ID",
     responses={
-        200: {"model": StandardResponse, "description": "Task retrieved successfully"},
+        200: {"model": TaskDataResponse, "description": "Task retrieved successfully"},
+        304: {"description": "Task unchanged since the ETag sent in If-None-Match"},
         404: {"model": ErrorResponse, "description": "Task not found"}
     }
 )
 async def get_task(
     task_id: int,
-    task_service: TaskService = Depends(get_task_service)
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    task_service: TaskService = Depends(task_service_provider)
 ):
     """
     Retrieve a specific task by its ID.
     
     - **task_id**: Task ID (integer)
+    - **If-None-Match**: ETag of a previous response; answered with 304 when unchanged
     """
     try:
-        task = task_service.get_task(task_id)
+        task = await run_service(task_service.get_task, task_id)
         if not task:
             raise NotFoundException(f"Task with id {task_id} not found")
         
-        response_data = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            deadline=task.deadline,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            closed_at=task.closed_at,
-            project_id=task.project_id,
-            project_name=task.project.name
+        not_modified = conditional.evaluate(
+            task.id,
+            task.updated_at or task.created_at,
+            task.project.updated_at or task.project.created_at
         )
+        if not_modified:
+            return not_modified
         
-        return StandardResponse(
-            status="success",
-            message="Task retrieved successfully",
-            data=response_data
+        response_data = TaskResponse.model_validate(task)
+        
+        return FastJSONResponse(
+            TaskDataResponse(
+                status="success",
+                message="Task retrieved successfully",
+                data=response_data
+            ),
+            headers=conditional.headers
         )
         
     except NotFoundException as e:
@@ -231,10 +499,10 @@ async def get_task(
 
 @router.put(
     "/{task_id}",
-    response_model=StandardResponse,
+    response_model=TaskDataResponse,
     summary="Update task",
     responses={
-        200: {"model": StandardResponse, "description": "Task updated successfully"},
+        200: {"model": TaskDataResponse, "description": "Task updated successfully"},
         404: {"model": ErrorResponse, "description": "Task not found"},
         400: {"model": ErrorResponse, "description": "Validation error"}
     }
@@ -242,7 +510,7 @@ async def get_task(
 async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    task_service: TaskService = Depends(get_task_service)
+    task_service: TaskService = Depends(task_service_provider)
 ):
     """
     Update an existing task.
@@ -261,25 +529,16 @@ async def update_task(
         if task_data.deadline is not None:
             update_data['deadline'] = task_data.deadline
         
-        task = task_service.update_task(task_id, **update_data)
+        task = await run_service(task_service.update_task, task_id, **update_data)
         
-        response_data = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            deadline=task.deadline,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            closed_at=task.closed_at,
-            project_id=task.project_id,
-            project_name=task.project.name
-        )
+        response_data = TaskResponse.model_validate(task)
         
-        return StandardResponse(
-            status="success",
-            message="Task updated successfully",
-            data=response_data
+        return FastJSONResponse(
+            TaskDataResponse(
+                status="success",
+                message="Task updated successfully",
+                data=response_data
+            )
         )
         
     except NotFoundException as e:
@@ -295,17 +554,17 @@ async def update_task(
 
 @router.patch(
     "/{task_id}/status",
-    response_model=StandardResponse,
+    response_model=TaskDataResponse,
     summary="Update task status",
     responses={
-        200: {"model": StandardResponse, "description": "Task status updated successfully"},
+        200: {"model": TaskDataResponse, "description": "Task status updated successfully"},
         404: {"model": ErrorResponse, "description": "Task not found"}
     }
 )
 async def update_task_status(
     task_id: int,
     status_data: TaskStatusUpdate,
-    task_service: TaskService = Depends(get_task_service)
+    task_service: TaskService = Depends(task_service_provider)
 ):
     """
     Update the status of a task.
@@ -314,25 +573,16 @@ async def update_task_status(
     - **status**: New task status (todo, doing, done)
     """
     try:
-        task = task_service.update_task_status(task_id, status_data.status)
+        task = await run_service(task_service.update_task_status, task_id, status_data.status)
         
-        response_data = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            deadline=task.deadline,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            closed_at=task.closed_at,
-            project_id=task.project_id,
-            project_name=task.project.name
-        )
+        response_data = TaskResponse.model_validate(task)
         
-        return StandardResponse(
-            status="success",
-            message="Task status updated successfully",
-            data=response_data
+        return FastJSONResponse(
+            TaskDataResponse(
+                status="success",
+                message="Task status updated successfully",
+                data=response_data
+            )
         )
         
     except NotFoundException as e:
@@ -343,16 +593,16 @@ async def update_task_status(
 
 @router.post(
     "/{task_id}/close",
-    response_model=StandardResponse,
+    response_model=TaskDataResponse,
     summary="Close task",
     responses={
-        200: {"model": StandardResponse, "description": "Task closed successfully"},
+        200: {"model": TaskDataResponse, "description": "Task closed successfully"},
         404: {"model": ErrorResponse, "description": "Task not found"}
     }
 )
 async def close_task(
     task_id: int,
-    task_service: TaskService = Depends(get_task_service)
+    task_service: TaskService = Depends(task_service_provider)
 ):
     """
     Close a task (mark as done).
@@ -360,25 +610,16 @@ async def close_task(
     - **task_id**: Task ID to close (integer)
     """
     try:
-        task = task_service.close_task(task_id)
+        task = await run_service(task_service.close_task, task_id)
         
-        response_data = TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            deadline=task.deadline,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            closed_at=task.closed_at,
-            project_id=task.project_id,
-            project_name=task.project.name
-        )
+        response_data = TaskResponse.model_validate(task)
         
-        return StandardResponse(
-            status="success",
-            message="Task closed successfully",
-            data=response_data
+        return FastJSONResponse(
+            TaskDataResponse(
+                status="success",
+                message="Task closed successfully",
+                data=response_data
+            )
         )
         
     except NotFoundException as e:
@@ -387,50 +628,6 @@ async def close_task(
             detail={"status": "error", "message": str(e)}
         )
 
-@router.get(
-    "/overdue",
-    response_model=StandardResponse,
-    summary="Get overdue tasks",
-    responses={
-        200: {"model": StandardResponse, "description": "Overdue tasks retrieved successfully"}
-    }
-)
-async def get_overdue_tasks(
-    task_service: TaskService = Depends(get_task_service)
-):
-    """
-    Retrieve all overdue tasks (tasks with past deadlines that are not done).
-    """
-    tasks = task_service.get_overdue_tasks()
-    
-    task_responses = []
-    for task in tasks:
-        task_responses.append(
-            TaskResponse(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                status=task.status,
-                deadline=task.deadline,
-                created_at=task.created_at,
-                updated_at=task.updated_at,
-                closed_at=task.closed_at,
-                project_id=task.project_id,
-                project_name=task.project.name
-            )
-        )
-    
-    response_data = TaskListResponse(
-        tasks=task_responses,
-        total=len(task_responses)
-    )
-    
-    return StandardResponse(
-        status="success",
-        message="Overdue tasks retrieved successfully",
-        data=response_data
-    )
-
 @router.delete(
     "/{task_id}",
     response_model=StandardResponse,
@@ -442,7 +639,7 @@ async def get_overdue_tasks(
 )
 async def delete_task(
     task_id: int,
-    task_service: TaskService = Depends(get_task_service)
+    task_service: TaskService = Depends(task_service_provider)
 ):
     """
     Delete a task by its ID.
@@ -450,7 +647,7 @@ async def delete_task(
     - **task_id**: Task ID to delete (integer)
     """
     try:
-        task_service.delete_task(task_id)
+        await run_service(task_service.delete_task, task_id)
         
         return StandardResponse(
             status="success",
@@ -1,5 +1,18 @@
-from .database import get_db
-from .services import get_project_service, get_task_service
+from .database import get_db, get_async_db
+from .services import (
+    get_project_service, get_task_service, get_async_project_service, get_async_task_service,
+    project_service_provider, task_service_provider, run_service
+)
+from .pagination import Pagination, get_pagination
+from .conditional import ConditionalRequest, get_conditional_request, make_etag
+from .filters import get_task_filter, get_task_sort
 
 
-__all__ = ['get_db', 'get_project_service', 'get_task_service']
+__all__ = [
+    'get_db', 'get_async_db',
+    'get_project_service', 'get_task_service', 'get_async_project_service', 'get_async_task_service',
+    'project_service_provider', 'task_service_provider', 'run_service',
+    'Pagination', 'get_pagination',
+    'ConditionalRequest', 'get_conditional_request', 'make_etag',
+    'get_task_filter', 'get_task_sort'
+]
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Header, Response, status
+
+
+def make_etag(*version: Any) -> str:
+    """Build a strong ETag from the values that identify a representation."""
+    digest = hashlib.blake2b(repr(version).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+class ConditionalRequest:
+    """If-None-Match handling of a GET request."""
+    
+    def __init__(self, response: Response, if_none_match: Optional[str] = None):
+        self.response = response
+        self.if_none_match = if_none_match
+        self.etag: Optional[str] = None
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers for endpoints that return a Response object of their own."""
+        return {'ETag': self.etag} if self.etag else {}
+    
+    def evaluate(self, *version: Any) -> Optional[Response]:
+        """Tag the response; return a 304 response when the client already holds this version."""
+        etag = make_etag(*version)
+        self.etag = etag
+        self.response.headers['ETag'] = etag
+        if self._matches(etag):
+            # CompressionMiddleware adds Vary and weakens the ETag as it does on the 200
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        return None
+    
+    def _matches(self, etag: str) -> bool:
+        if not self.if_none_match:
+            return False
+        # If-None-Match uses the weak comparison function (RFC 9110 13.1.2)
+        candidates = [tag.strip() for tag in self.if_none_match.split(',')]
+        return any(tag == '*' or tag.removeprefix('W/') == etag for tag in candidates)
+
+
+def get_conditional_request(
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+) -> ConditionalRequest:
+    """Dependency that reads the If-None-Match header"""
+    return ConditionalRequest(response, if_none_match)
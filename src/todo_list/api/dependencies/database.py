@@ -1,6 +1,7 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from todo_list.db.session import db
@@ -16,3 +17,15 @@ def get_db() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session.
+    Automatically closes the session after request is complete.
+    """
+    session = db.get_async_session()
+    try:
+        yield session
+    finally:
+        await session.close()
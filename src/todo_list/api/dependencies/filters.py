@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import Query
+
+from todo_list.models.task import TaskStatus
+from todo_list.repositories.task_filter import TaskFilter, TASK_SORT_KEYS
+
+
+def get_task_filter(
+    statuses: Optional[List[TaskStatus]] = Query(None, alias="status", description="Task status; repeat to match several"),
+    project_ids: Optional[List[int]] = Query(None, alias="project_id", description="Project ID; repeat to match several"),
+    deadline_after: Optional[datetime] = Query(None, description="Only tasks with a deadline after this time"),
+    deadline_before: Optional[datetime] = Query(None, description="Only tasks with a deadline before this time"),
+    created_after: Optional[datetime] = Query(None, description="Only tasks created after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only tasks created before this time")
+) -> TaskFilter:
+    """Dependency that parses the filter query parameters of a task listing"""
+    return TaskFilter(
+        statuses=[task_status.value for task_status in statuses or []],
+        project_ids=project_ids,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        created_after=created_after,
+        created_before=created_before
+    )
+
+
+def get_task_sort(
+    sort: str = Query(
+        'id',
+        pattern=f"^-?({'|'.join(TASK_SORT_KEYS)})$",
+        description=f"Sort column, one of {', '.join(TASK_SORT_KEYS)}; prefix with '-' for descending order"
+    )
+) -> str:
+    """Dependency that reads the sort order of a task listing, limited to indexed columns"""
+    return sort
@@ -0,0 +1,84 @@
+import base64
+import binascii
+import json
+from operator import attrgetter
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query, status
+
+from todo_list.config import Config
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the keyset values of the last row of a page into an opaque cursor."""
+    payload = json.dumps(list(values), separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Decode a cursor produced by `encode_cursor` back into its keyset values."""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    if not isinstance(values, list) or not values:
+        raise ValueError("Cursor must hold a non-empty list of keyset values")
+    return values
+
+
+class Pagination:
+    """Keyset pagination parameters of a list request."""
+
+    def __init__(self, limit: int, after_id: Optional[int] = None, values: Optional[List[Any]] = None):
+        self.limit = limit
+        self.after_id = after_id
+        self.values = values if values is not None else ([] if after_id is None else [after_id])
+
+    @property
+    def fetch_size(self) -> int:
+        """Rows to fetch: one extra row tells whether another page exists."""
+        return self.limit + 1
+
+    @property
+    def sort_value(self) -> Any:
+        """Sort column value of the cursor of a list ordered by a column before id."""
+        if self.after_id is None:
+            return None
+        if len(self.values) != 2:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"status": "error", "message": "Invalid pagination cursor"}
+            )
+        return self.values[0]
+
+    def split(self, items: Sequence, key: Callable[[Any], Any] = attrgetter('id')) -> Tuple[Sequence, Optional[str]]:
+        """Trim the look-ahead row and build the cursor of the next page; key may return a tuple."""
+        if len(items) <= self.limit:
+            return items, None
+        page = items[:self.limit]
+        values = key(page[-1])
+        if not isinstance(values, tuple):
+            values = (values,)
+        return page, encode_cursor(*values)
+
+
+def get_pagination(
+    limit: int = Query(
+        Config.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=Config.MAX_PAGE_SIZE,
+        description=f"Page size (at most {Config.MAX_PAGE_SIZE})"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page")
+) -> Pagination:
+    """Dependency that parses limit/cursor query parameters"""
+    if cursor is None:
+        return Pagination(limit)
+
+    try:
+        values = decode_cursor(cursor)
+        after_id = int(values[-1])
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": "error", "message": "Invalid pagination cursor"}
+        )
+    return Pagination(limit, after_id, values)
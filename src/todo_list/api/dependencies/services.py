@@ -1,12 +1,20 @@
+import inspect
+from typing import Any, Callable
+
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from todo_list.config import Config
 from todo_list.repositories.project_repository import ProjectRepository
 from todo_list.repositories.task_repository import TaskRepository
+from todo_list.scheduler import deadline_scheduler
 from todo_list.services.project_service import ProjectService
 from todo_list.services.task_service import TaskService
+from todo_list.services.async_services import AsyncProjectService, AsyncTaskService
 
-from .database import get_db
+from .database import get_db, get_async_db
 
 
 def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
@@ -18,4 +26,29 @@ def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
 def get_task_service(db: Session = Depends(get_db)) -> TaskService:
     """Dependency that provides TaskService instance"""
     task_repo = TaskRepository(db)
-    return TaskService(task_repo)
+    return TaskService(task_repo, deadline_scheduler.notify)
+
+
+def get_async_project_service(db: AsyncSession = Depends(get_async_db)) -> AsyncProjectService:
+    """Dependency that provides AsyncProjectService instance"""
+    return AsyncProjectService(db)
+
+
+def get_async_task_service(db: AsyncSession = Depends(get_async_db)) -> AsyncTaskService:
+    """Dependency that provides AsyncTaskService instance"""
+    return AsyncTaskService(db)
+
+
+# Service dependencies used by the controllers, chosen by USE_ASYNC_DB
+project_service_provider = get_async_project_service if Config.USE_ASYNC_DB else get_project_service
+task_service_provider = get_async_task_service if Config.USE_ASYNC_DB else get_task_service
+
+
+async def run_service(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Call a service method from a controller without blocking the event loop.
+    Async service methods are awaited; sync ones run in the threadpool.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
@@ -1,9 +1,29 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from todo_list.cache import project_cache, task_cache
+from todo_list.config import Config
+from todo_list.db.session import db
+from todo_list.scheduler import deadline_scheduler
+from .dependencies.services import get_task_service
+from .metrics import CONTENT_TYPE, collect_metrics, multiprocess_metrics, render_metrics, request_metrics
+from .middleware import CompressionMiddleware, TimingMiddleware
 from .routers import api_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if Config.DEADLINE_SCHEDULER_ENABLED:
+        deadline_scheduler.start(get_task_service)
+    if Config.METRICS_ENABLED:
+        multiprocess_metrics.start(collect_metrics)
+    yield
+    await multiprocess_metrics.stop()
+    await deadline_scheduler.stop()
+
+
 def create_application() -> FastAPI:
     app = FastAPI(
         title="TodoList API",
@@ -11,7 +31,8 @@ def create_application() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        lifespan=lifespan
     )
     
     app.add_middleware(
@@ -22,12 +43,61 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
     
+    if Config.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=Config.COMPRESSION_MINIMUM_SIZE,
+            encodings=Config.COMPRESSION_ENCODINGS,
+            levels={
+                'gzip': Config.COMPRESSION_GZIP_LEVEL,
+                'br': Config.COMPRESSION_BROTLI_QUALITY,
+                'zstd': Config.COMPRESSION_ZSTD_LEVEL,
+            }
+        )
+    
+    # Added last so it is outermost and times the other middleware too
+    if Config.METRICS_ENABLED:
+        app.add_middleware(TimingMiddleware, metrics=request_metrics)
+    
     app.include_router(api_router, prefix="/api/v1")
     
     @app.get("/health", tags=["health"])
     async def health_check():
         return {"status": "healthy", "message": "TodoList API is running"}
     
+    @app.get("/internal/db-pool", tags=["internal"], include_in_schema=False)
+    async def db_pool_status():
+        return {"status": "success", "data": db.get_pool_status()}
+    
+    @app.get("/internal/cache", tags=["internal"], include_in_schema=False)
+    async def cache_status():
+        return {"status": "success", "data": {"task": task_cache.stats(), "project": project_cache.stats()}}
+    
+    @app.get("/internal/scheduler", tags=["internal"], include_in_schema=False)
+    async def scheduler_status():
+        return {"status": "success", "data": deadline_scheduler.stats()}
+    
+    @app.get("/internal/slow-queries", tags=["internal"], include_in_schema=False)
+    async def slow_queries():
+        return {
+            "status": "success",
+            "data": {
+                "enabled": db.slow_query_log_enabled,
+                "threshold_ms": db.slow_query_log.threshold * 1000,
+                "explain": db.slow_query_log.explain,
+                "queries": db.slow_query_log.recent()
+            }
+        }
+    
+    @app.delete("/internal/slow-queries", tags=["internal"], include_in_schema=False)
+    async def clear_slow_queries():
+        db.slow_query_log.clear()
+        return {"status": "success", "message": "Slow query log cleared"}
+    
+    @app.get("/metrics", tags=["internal"], include_in_schema=False)
+    async def metrics():
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
+    
     @app.get("/", tags=["root"])
     async def root():
         return {
@@ -0,0 +1,270 @@
+import asyncio
+import bisect
+import contextlib
+import glob
+import json
+import os
+import threading
+from collections import Counter
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from todo_list.cache import project_cache, task_cache
+from todo_list.config import Config
+from todo_list.db.instrumentation import QueryStats
+from todo_list.db.session import db
+from todo_list.scheduler import deadline_scheduler
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+# Pool statistics exposed as metrics: (key, metric name, type, help, scale)
+POOL_METRICS = (
+    ('size', 'todo_list_db_pool_size', 'gauge', 'Connections the pool keeps open', 1),
+    ('checked_out', 'todo_list_db_pool_checked_out', 'gauge', 'Connections in use', 1),
+    ('checked_in', 'todo_list_db_pool_checked_in', 'gauge', 'Idle connections in the pool', 1),
+    ('overflow', 'todo_list_db_pool_overflow', 'gauge', 'Connections open beyond the pool size', 1),
+    ('checkouts', 'todo_list_db_pool_checkouts_total', 'counter', 'Connection checkouts', 1),
+    ('timeouts', 'todo_list_db_pool_checkout_timeouts_total', 'counter', 'Checkouts that timed out', 1),
+    ('wait_time_total_ms', 'todo_list_db_pool_checkout_wait_seconds_total', 'counter',
+     'Time spent waiting for a connection', 0.001),
+    ('wait_time_max_ms', 'todo_list_db_pool_checkout_wait_seconds_max', 'gauge',
+     'Longest wait for a connection', 0.001),
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+# (name, type, help, samples), each sample being (name, labels, value)
+Family = Tuple[str, str, str, List[Tuple[str, Labels, float]]]
+
+
+class Histogram:
+    """Observations counted in cumulative buckets, as Prometheus exposes them."""
+    
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+    
+    def samples(self, name: str, labels: Labels) -> Iterable[Tuple[str, Labels, float]]:
+        totals = list(accumulate(self.counts))
+        for bound, total in zip(self.buckets, totals):
+            yield f'{name}_bucket', labels + (('le', format_value(bound)),), total
+        yield f'{name}_bucket', labels + (('le', '+Inf'),), totals[-1]
+        yield f'{name}_sum', labels, self.sum
+        yield f'{name}_count', labels, totals[-1]
+
+
+class RequestMetrics:
+    """Latency, responses and database use of the requests served, by route template."""
+    
+    def __init__(self, latency_buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.latency_buckets = latency_buckets
+        self._lock = threading.Lock()
+        self._latency: Dict[Labels, Histogram] = {}
+        self._db_time: Dict[Labels, Histogram] = {}
+        self._statements: Dict[Labels, Histogram] = {}
+        self._responses: Counter = Counter()
+    
+    def observe(self, method: str, route: str, status: int, duration: float, queries: QueryStats) -> None:
+        labels = (('method', method), ('route', route))
+        with self._lock:
+            if labels not in self._latency:
+                self._latency[labels] = Histogram(self.latency_buckets)
+                self._db_time[labels] = Histogram(self.latency_buckets)
+                self._statements[labels] = Histogram(STATEMENT_BUCKETS)
+            self._latency[labels].observe(duration)
+            self._db_time[labels].observe(queries.duration)
+            self._statements[labels].observe(queries.statements)
+            self._responses[labels + (('status', str(status)),)] += 1
+    
+    def families(self) -> List[Family]:
+        with self._lock:
+            return [
+                ('todo_list_http_request_duration_seconds', 'histogram', 'Time to serve a request',
+                 [sample for labels, histogram in sorted(self._latency.items())
+                  for sample in histogram.samples('todo_list_http_request_duration_seconds', labels)]),
+                ('todo_list_http_request_db_duration_seconds', 'histogram', 'Time a request spent running statements',
+                 [sample for labels, histogram in sorted(self._db_time.items())
+                  for sample in histogram.samples('todo_list_http_request_db_duration_seconds', labels)]),
+                ('todo_list_http_request_db_statements', 'histogram', 'Statements run by a request',
+                 [sample for labels, histogram in sorted(self._statements.items())
+                  for sample in histogram.samples('todo_list_http_request_db_statements', labels)]),
+                ('todo_list_http_responses_total', 'counter', 'Responses sent, by status code',
+                 [('todo_list_http_responses_total', labels, count)
+                  for labels, count in sorted(self._responses.items())]),
+            ]
+
+
+class MultiprocessMetrics:
+    """
+    Metrics of the worker processes of one server, merged on every scrape.
+    
+    Each process writes its samples to <pid>.json in a directory the workers
+    share, every interval seconds and whenever it serves a scrape. Samples
+    add up across processes, except *_max gauges, which take the largest
+    value. A process marked dead keeps its counters but loses its gauges,
+    as in prometheus_client's multiprocess mode.
+    """
+    
+    def __init__(self, directory: Optional[str], interval: float):
+        self.directory = directory
+        self.interval = interval
+        self._collect: Optional[Callable[[], List[Family]]] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self, collect: Callable[[], List[Family]]) -> None:
+        """Publish collect() on the current event loop every interval seconds."""
+        if self.directory is None or self._task is not None:
+            return
+        self._collect = collect
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        # Keep what was counted since the last write
+        self.write(self._collect())
+    
+    def write(self, families: List[Family]) -> None:
+        self._dump(self._path(os.getpid()), families)
+    
+    def mark_process_dead(self, pid: int) -> None:
+        """Drop the gauges of a process that exited; its counters stay in the totals."""
+        if self.directory is None:
+            return
+        families = self._read(self._path(pid))
+        if families is not None:
+            self._dump(self._path(pid), [family for family in families if family[1] != 'gauge'])
+    
+    def reset(self) -> None:
+        """Remove the files left by an earlier server."""
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+    
+    def merge(self) -> List[Family]:
+        merged: Dict[str, Tuple[str, str, Dict[Tuple[str, Labels], float]]] = {}
+        for path in sorted(glob.glob(os.path.join(self.directory, '*.json'))):
+            for family, kind, help_text, samples in self._read(path) or ():
+                values = merged.setdefault(family, (kind, help_text, {}))[2]
+                for name, labels, value in samples:
+                    key = (name, tuple(tuple(pair) for pair in labels))
+                    if name.endswith('_max'):
+                        values[key] = max(values.get(key, value), value)
+                    else:
+                        values[key] = values.get(key, 0) + value
+        return [
+            (family, kind, help_text, [(name, labels, value) for (name, labels), value in values.items()])
+            for family, (kind, help_text, values) in merged.items()
+        ]
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.to_thread(self.write, self._collect())
+            await asyncio.sleep(self.interval)
+    
+    def _path(self, pid: int) -> str:
+        return os.path.join(self.directory, f'{pid}.json')
+    
+    @staticmethod
+    def _dump(path: str, families: List[Family]) -> None:
+        # Readers only ever see a complete file
+        with open(f'{path}.tmp', 'w') as file:
+            json.dump(families, file)
+        os.replace(f'{path}.tmp', path)
+    
+    @staticmethod
+    def _read(path: str) -> Optional[List[Family]]:
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+
+request_metrics = RequestMetrics()
+multiprocess_metrics = MultiprocessMetrics(Config.METRICS_MULTIPROC_DIR, Config.METRICS_MULTIPROC_INTERVAL)
+
+
+def render_metrics(metrics: RequestMetrics = request_metrics) -> str:
+    """
+    Metrics in the Prometheus text exposition format: those of this process,
+    or of every worker when they share a metrics directory.
+    """
+    families = collect_metrics(metrics)
+    if multiprocess_metrics.directory is not None:
+        multiprocess_metrics.write(families)
+        families = multiprocess_metrics.merge()
+    return format_metrics(families)
+
+
+def collect_metrics(metrics: RequestMetrics = request_metrics) -> List[Family]:
+    """All metrics of this process."""
+    families = metrics.families()
+    
+    pool_samples = {name: [] for _, name, _, _, _ in POOL_METRICS}
+    for engine, stats in db.get_pool_status().items():
+        for key, name, _, _, scale in POOL_METRICS:
+            if key in stats:
+                pool_samples[name].append((name, (('engine', engine),), round(stats[key] * scale, 6)))
+    families.extend(
+        (name, kind, help_text, pool_samples[name]) for _, name, kind, help_text, _ in POOL_METRICS
+    )
+    
+    caches = {'task': task_cache.stats(), 'project': project_cache.stats()}
+    for key, name, kind, help_text in (
+        ('hits', 'todo_list_entity_cache_hits_total', 'counter', 'Entity cache lookups answered from the cache'),
+        ('misses', 'todo_list_entity_cache_misses_total', 'counter', 'Entity cache lookups that went to the database'),
+        ('size', 'todo_list_entity_cache_entries', 'gauge', 'Entries held by the entity cache'),
+    ):
+        families.append((name, kind, help_text, [
+            (name, (('cache', cache),), stats[key]) for cache, stats in caches.items()
+        ]))
+    
+    scheduler = deadline_scheduler.stats()
+    families.extend([
+        ('todo_list_deadline_scheduler_leader', 'gauge', 'Whether this process runs the deadline scheduler',
+         [('todo_list_deadline_scheduler_leader', (), int(scheduler['leader']))]),
+        ('todo_list_deadline_scheduler_scheduled', 'gauge', 'Deadlines waiting in the scheduler heap',
+         [('todo_list_deadline_scheduler_scheduled', (), scheduler['scheduled'])]),
+        ('todo_list_deadline_scheduler_closed_total', 'counter', 'Tasks closed by the deadline scheduler',
+         [('todo_list_deadline_scheduler_closed_total', (), scheduler['closed'])]),
+    ])
+    return families
+
+
+def format_metrics(families: List[Family]) -> str:
+    lines = []
+    for family, kind, help_text, samples in families:
+        lines.append(f'# HELP {family} {help_text}')
+        lines.append(f'# TYPE {family} {kind}')
+        for name, labels, value in samples:
+            lines.append(f'{name}{format_labels(labels)} {format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{escape_label(value)}"' for key, value in labels) + '}'
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
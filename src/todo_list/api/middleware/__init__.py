@@ -0,0 +1,5 @@
+from .compression import CompressionMiddleware, available_encodings, negotiate_encoding
+from .timing import TimingMiddleware
+
+
+__all__ = ['CompressionMiddleware', 'TimingMiddleware', 'available_encodings', 'negotiate_encoding']
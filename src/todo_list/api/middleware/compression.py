@@ -0,0 +1,191 @@
+import zlib
+from typing import Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Compressor:
+    """Incremental encoder of one response body."""
+    
+    encoding: str
+    
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Encode a chunk; unless final, flush so the client can decode everything sent so far."""
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    encoding = 'gzip'
+    
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    
+    def compress(self, data: bytes, final: bool) -> bytes:
+        mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(data) + self._compressor.flush(mode)
+
+
+class BrotliCompressor(Compressor):
+    encoding = 'br'
+    
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+    
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self._compressor.process(data)
+        return body + (self._compressor.finish() if final else self._compressor.flush())
+
+
+class ZstdCompressor(Compressor):
+    encoding = 'zstd'
+    
+    def __init__(self, level: int):
+        if zstd is not None:
+            self._compressor = zstd.ZstdCompressor(level=level)
+        else:
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if zstd is not None:
+            mode = zstd.ZstdCompressor.FLUSH_FRAME if final else zstd.ZstdCompressor.FLUSH_BLOCK
+            return self._compressor.compress(data, mode)
+        body = self._compressor.compress(data)
+        if final:
+            return body + self._compressor.flush()
+        return body + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+
+COMPRESSORS = {
+    'zstd': ZstdCompressor,
+    'br': BrotliCompressor,
+    'gzip': GzipCompressor,
+}
+
+
+def available_encodings() -> Sequence[str]:
+    """Encodings whose library is installed, gzip always included."""
+    available = ['gzip']
+    if brotli is not None:
+        available.append('br')
+    if zstd is not None or zstandard is not None:
+        available.append('zstd')
+    return available
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding of an Accept-Encoding header to its quality value."""
+    qualities = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def negotiate_encoding(header: Optional[str], preferred: Sequence[str]) -> Optional[str]:
+    """Pick the encoding with the highest client quality; ties follow the server preference."""
+    if not header:
+        return None
+    qualities = parse_accept_encoding(header)
+    wildcard = qualities.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for encoding in preferred:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionResponder(IdentityResponder):
+    """Compresses one response with the negotiated encoding."""
+    
+    def __init__(self, app: ASGIApp, minimum_size: int, compressor: Compressor):
+        super().__init__(app, minimum_size)
+        self.compressor = compressor
+        self.content_encoding = compressor.encoding
+    
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        return self.compressor.compress(body, final=not more_body)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with zstd, brotli or gzip, following Accept-Encoding.
+    
+    Bodies below minimum_size go out as they are. Streaming responses are
+    compressed chunk by chunk and flushed after each one, so clients can
+    decode data as it arrives.
+    
+    Every response, a 304 included, carries Vary: Accept-Encoding, and its
+    ETag is weak whenever an encoding was negotiated: a 304 cannot tell
+    whether the 200 it stands for would have been large enough to compress.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Sequence[str] = ('zstd', 'br', 'gzip'),
+        levels: Optional[Dict[str, int]] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        available = available_encodings()
+        self.encodings = [encoding for encoding in encodings if encoding in available]
+        self.levels = {'gzip': 6, 'br': 4, 'zstd': 3, **(levels or {})}
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate_encoding(Headers(scope=scope).get('accept-encoding'), self.encodings)
+        if encoding is None:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        else:
+            compressor = COMPRESSORS[encoding](self.levels[encoding])
+            responder = CompressionResponder(self.app, self.minimum_size, compressor)
+        
+        async def send_with_validators(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(raw=message['headers'])
+                if 'accept-encoding' not in headers.get('vary', '').lower():
+                    headers.add_vary_header('Accept-Encoding')
+                # The encoded body is a different representation, so a strong
+                # ETag of the identity body only holds weakly (RFC 9110 8.8.3)
+                etag = headers.get('etag')
+                if encoding is not None and etag and not etag.startswith('W/'):
+                    headers['ETag'] = f'W/{etag}'
+            await send(message)
+        
+        await responder(scope, receive, send_with_validators)
@@ -0,0 +1,55 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo_list.api.metrics import RequestMetrics
+from todo_list.db.instrumentation import track_queries
+
+
+class TimingMiddleware:
+    """
+    Times every request and counts the statements it runs.
+
+    The numbers go to the client in a Server-Timing header and to the
+    metrics registry, labelled with the route template rather than the
+    path so task ids do not make a series each.
+    """
+    
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        status = 500
+        
+        with track_queries() as queries:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message['type'] == 'http.response.start':
+                    status = message['status']
+                    total_ms = (time.perf_counter() - started) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        'Server-Timing',
+                        f'db;dur={queries.duration * 1000:.2f};desc="{queries.statements} statements", '
+                        f'total;dur={total_ms:.2f}'
+                    )
+                await send(message)
+            
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                route = scope.get('route')
+                self.metrics.observe(
+                    scope['method'],
+                    route.path if route is not None else 'unmatched',
+                    status,
+                    time.perf_counter() - started,
+                    queries
+                )
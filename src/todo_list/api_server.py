@@ -1,14 +1,12 @@
 import uvicorn
 
-from todo_list.api.main import create_application
-
-
-app = create_application()
+from todo_list.api.main import app  # noqa: F401 - kept importable as todo_list.api_server:app
 
 
 if __name__ == "__main__":
+    # Development server; production runs the serve command
     uvicorn.run(
-        "todo_list.api_server:app",
+        "todo_list.api.main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
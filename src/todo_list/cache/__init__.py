@@ -0,0 +1,20 @@
+from todo_list.config import Config
+
+from .backends import CacheBackend, NullCacheBackend, LRUTTLCacheBackend
+from .entity_cache import EntityCache
+
+
+def create_backend() -> CacheBackend:
+    if Config.ENTITY_CACHE_BACKEND == 'memory':
+        return LRUTTLCacheBackend(max_size=Config.ENTITY_CACHE_MAX_SIZE, ttl=Config.ENTITY_CACHE_TTL)
+    return NullCacheBackend()
+
+
+task_cache = EntityCache('task', create_backend())
+project_cache = EntityCache('project', create_backend())
+
+
+__all__ = [
+    'CacheBackend', 'NullCacheBackend', 'LRUTTLCacheBackend', 'EntityCache',
+    'create_backend', 'task_cache', 'project_cache'
+]
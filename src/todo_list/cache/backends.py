@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class CacheBackend:
+    """Key/value store behind an EntityCache. Values are opaque bytes."""
+    
+    def get(self, key: Hashable) -> Optional[bytes]:
+        raise NotImplementedError
+    
+    def set(self, key: Hashable, value: bytes) -> None:
+        raise NotImplementedError
+    
+    def delete(self, key: Hashable) -> None:
+        raise NotImplementedError
+    
+    def clear(self) -> None:
+        raise NotImplementedError
+    
+    def size(self) -> int:
+        raise NotImplementedError
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that stores nothing, turning the cache off."""
+    
+    def get(self, key: Hashable) -> Optional[bytes]:
+        return None
+    
+    def set(self, key: Hashable, value: bytes) -> None:
+        pass
+    
+    def delete(self, key: Hashable) -> None:
+        pass
+    
+    def clear(self) -> None:
+        pass
+    
+    def size(self) -> int:
+        return 0
+
+
+class LRUTTLCacheBackend(CacheBackend):
+    """In-process LRU cache with a bounded number of entries and a time to live."""
+    
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
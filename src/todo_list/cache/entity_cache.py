@@ -0,0 +1,85 @@
+import pickle
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+from sqlalchemy.orm import Session
+
+from .backends import CacheBackend
+
+
+class EntityCache:
+    """
+    Read-through cache of repository lookups.
+    
+    Values are stored as pickled snapshots, so a cached entity is never bound
+    to the session that loaded it. Every hit is merged into the caller's
+    session without a query, the way SQLAlchemy's own caching recipes do.
+    
+    Readers take a generation() before querying and pass it to set(), which
+    drops the value if anything was invalidated in between: it may have been
+    read before that write committed.
+    """
+    
+    def __init__(self, name: str, backend: CacheBackend):
+        self.name = name
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+    
+    def get(self, session: Session, key: Hashable) -> Optional[Any]:
+        payload = self.backend.get(key)
+        with self._stats_lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if payload is None:
+            return None
+        return self._attach(session, pickle.loads(payload))
+    
+    def generation(self) -> int:
+        with self._generation_lock:
+            return self._generation
+    
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        payload = pickle.dumps(value)
+        with self._generation_lock:
+            if generation is not None and generation != self._generation:
+                return
+            self.backend.set(key, payload)
+    
+    def invalidate(self, *keys: Hashable) -> None:
+        if not keys:
+            return
+        # Bump first, so a set() racing with the deletes below is dropped
+        with self._generation_lock:
+            self._generation += 1
+        for key in keys:
+            self.backend.delete(key)
+    
+    def clear(self) -> None:
+        with self._generation_lock:
+            self._generation += 1
+        self.backend.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            'backend': type(self.backend).__name__,
+            'size': self.backend.size(),
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+        }
+    
+    def _attach(self, session: Session, value: Any) -> Any:
+        if isinstance(value, tuple):
+            return tuple(self._attach(session, item) for item in value)
+        if hasattr(value, '_sa_instance_state'):
+            return session.merge(value, load=False)
+        return value
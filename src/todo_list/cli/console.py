@@ -8,6 +8,8 @@ from todo_list.repositories.task_repository import TaskRepository
 from todo_list.services.project_service import ProjectService
 from todo_list.services.task_service import TaskService
 from todo_list.commands.autoclose_overdue import autoclose_overdue_cmd
+from todo_list.commands.rebuild_counters import rebuild_counters_cmd
+from todo_list.commands.serve import serve_cmd
 from todo_list.models.task import TaskStatus
 
 
@@ -30,6 +32,17 @@ class TodoCLI:
     def close_session(self):
         self.session.close()
 
+def format_age(seconds: float) -> str:
+    """Render a duration as its two largest units, e.g. '3d 4h'."""
+    minutes, _ = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
 @click.group()
 def cli():
     click.echo("⚠️  WARNING: CLI interface is deprecated and will be removed soon.")
@@ -65,24 +78,27 @@ def list():
     """List all projects"""
     todo = TodoCLI()
     try:
-        projects = todo.project_service.get_all_projects()
+        # One grouped query for every project instead of loading each project's tasks
+        projects = todo.project_service.get_project_stats()
         if not projects:
             click.echo("No projects found")
             return
         
         for project in projects:
-            tasks = todo.task_service.get_tasks_by_project(project.id)
-            task_count = len(tasks)
-            
-            pending_tasks = len([t for t in tasks if t.status != 'done'])
-            done_tasks = len([t for t in tasks if t.status == 'done'])
+            task_count = project['task_count']
+            done_tasks = project['status_counts'][TaskStatus.DONE.value]
+            pending_tasks = task_count - done_tasks
             
-            click.echo(f"📁 {project.id}: {project.name}")
+            click.echo(f"📁 {project['id']}: {project['name']}")
             click.echo(f"   Tasks: {task_count} total ({pending_tasks} pending, {done_tasks} done)")
+            if project['overdue_count']:
+                click.echo(f"   Overdue: {project['overdue_count']}")
+            if project['oldest_open_age_seconds'] is not None:
+                click.echo(f"   Oldest open task: {format_age(project['oldest_open_age_seconds'])} old")
             
-            if project.description:
-                click.echo(f"   Description: {project.description}")
-            click.echo(f"   Created: {project.created_at}")
+            if project['description']:
+                click.echo(f"   Description: {project['description']}")
+            click.echo(f"   Created: {project['created_at']}")
             click.echo()
     finally:
         todo.close_session()
@@ -284,6 +300,8 @@ def edit(task_id, title, description, deadline, status):
         todo.close_session()
 
 cli.add_command(autoclose_overdue_cmd, name="autoclose-overdue")
+cli.add_command(rebuild_counters_cmd, name="rebuild-counters")
+cli.add_command(serve_cmd, name="serve")
 
 
 if __name__ == '__main__':
@@ -1,3 +1,7 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
 import click
 
 from todo_list.db.session import db
@@ -5,26 +9,62 @@ from todo_list.repositories.task_repository import TaskRepository
 from todo_list.services.task_service import TaskService
 
 
-def auto_close_overdue_tasks():
+def auto_close_overdue_tasks(batch_size: int = None, dry_run: bool = False, workers: int = 1):
+    started = time.perf_counter()
+    if dry_run:
+        session = db.get_session()
+        try:
+            task_service = TaskService(TaskRepository(session))
+            overdue_count = task_service.count_overdue_tasks()
+        finally:
+            session.close()
+        elapsed = time.perf_counter() - started
+        click.echo(f"ℹ️  {overdue_count} overdue task(s) would be closed (dry run, {elapsed:.2f}s)")
+        return overdue_count
+    
+    # Each worker claims its own batches, skipping rows locked by the others
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_close_overdue_worker, [batch_size] * workers))
+    elapsed = time.perf_counter() - started
+    closed_count = sum(worker_closed for worker_closed, _ in results)
+    
+    if workers > 1:
+        for number, (worker_closed, worker_elapsed) in enumerate(results, start=1):
+            click.echo(
+                f"   Worker {number}: {worker_closed} task(s) in {worker_elapsed:.2f}s "
+                f"({_rate(worker_closed, worker_elapsed):.0f} tasks/s)"
+            )
+    
+    if closed_count > 0:
+        click.echo(
+            f"✅ Auto-closed {closed_count} overdue task(s) in {elapsed:.2f}s "
+            f"({_rate(closed_count, elapsed):.0f} tasks/s)"
+        )
+    else:
+        click.echo(f"ℹ️  No overdue tasks found to close ({elapsed:.2f}s)")
+    
+    return closed_count
+
+def _close_overdue_worker(batch_size: int = None) -> Tuple[int, float]:
     session = db.get_session()
     try:
-        task_repo = TaskRepository(session)
-        task_service = TaskService(task_repo)
-        
-        closed_count = task_service.auto_close_overdue_tasks()
-        
-        if closed_count > 0:
-            click.echo(f"✅ Auto-closed {closed_count} overdue task(s)")
-        else:
-            click.echo("ℹ️  No overdue tasks found to close")
-        
-        return closed_count
+        task_service = TaskService(TaskRepository(session))
+        started = time.perf_counter()
+        closed_count = task_service.auto_close_overdue_tasks(batch_size)
+        return closed_count, time.perf_counter() - started
     finally:
         session.close()
 
+def _rate(count: int, elapsed: float) -> float:
+    return count / elapsed if elapsed > 0 else count
+
 @click.command()
-def autoclose_overdue_cmd():
-    auto_close_overdue_tasks()
+@click.option('--batch-size', type=click.IntRange(min=1), help='Tasks closed per UPDATE statement (default: AUTOCLOSE_BATCH_SIZE)')
+@click.option('--workers', type=click.IntRange(min=1), default=1, show_default=True,
+              help='Threads closing batches in parallel, each on its own connection')
+@click.option('--dry-run', is_flag=True, help='Only count the overdue tasks, do not close them')
+def autoclose_overdue_cmd(batch_size, workers, dry_run):
+    auto_close_overdue_tasks(batch_size, dry_run, workers)
 
 
 if __name__ == "__main__":
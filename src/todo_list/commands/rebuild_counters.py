@@ -0,0 +1,38 @@
+import time
+
+import click
+
+from todo_list.db.session import db
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.services.project_service import ProjectService
+
+
+def rebuild_project_counters(dry_run: bool = False):
+    session = db.get_session()
+    try:
+        project_service = ProjectService(ProjectRepository(session))
+        
+        started = time.perf_counter()
+        drifted = project_service.rebuild_task_counters(dry_run)
+        elapsed = time.perf_counter() - started
+        
+        if not drifted:
+            click.echo(f"✅ Project counters match the tasks ({elapsed:.2f}s)")
+        elif dry_run:
+            click.echo(f"ℹ️  Counters of {len(drifted)} project(s) have drifted: {', '.join(map(str, drifted))} (dry run, {elapsed:.2f}s)")
+        else:
+            click.echo(f"✅ Rebuilt counters of {len(drifted)} project(s): {', '.join(map(str, drifted))} ({elapsed:.2f}s)")
+        
+        return drifted
+    finally:
+        session.close()
+
+@click.command()
+@click.option('--dry-run', is_flag=True, help='Only report the projects whose counters drifted, do not fix them')
+def rebuild_counters_cmd(dry_run):
+    """Recount the tasks of every project into the project counters"""
+    rebuild_project_counters(dry_run)
+
+
+if __name__ == "__main__":
+    rebuild_counters_cmd()
@@ -0,0 +1,207 @@
+import gc
+import importlib.util
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from typing import Optional
+
+import click
+import uvicorn
+
+from todo_list.api.metrics import multiprocess_metrics
+from todo_list.cache import NullCacheBackend, project_cache, task_cache
+from todo_list.config import Config
+from todo_list.db.session import db
+
+
+APP = 'todo_list.api.main:app'
+
+# A worker that dies sooner than this after starting is not restarted, so a
+# broken deployment fails instead of forking in a loop
+MIN_WORKER_UPTIME = 5.0
+# Exit code uvicorn uses when the app fails to start
+STARTUP_FAILURE = 3
+
+
+def serve(
+    host: str = Config.SERVER_HOST,
+    port: int = Config.SERVER_PORT,
+    workers: int = Config.SERVER_WORKERS,
+    keep_alive: int = Config.SERVER_KEEP_ALIVE,
+    backlog: int = Config.SERVER_BACKLOG,
+    graceful_timeout: int = Config.SERVER_GRACEFUL_TIMEOUT,
+    access_log: bool = Config.SERVER_ACCESS_LOG,
+    freeze: bool = True,
+):
+    config = uvicorn.Config(
+        APP,
+        host=host,
+        port=port,
+        loop='auto',
+        http='auto',
+        timeout_keep_alive=keep_alive,
+        backlog=backlog,
+        timeout_graceful_shutdown=graceful_timeout,
+        access_log=access_log,
+        log_level='info',
+    )
+    click.echo(
+        f"🚀 Serving {APP} on {host}:{port} with {workers} worker(s) "
+        f"(loop: {_event_loop()}, http: {_http_parser()})"
+    )
+    
+    if workers == 1:
+        uvicorn.Server(config).run()
+        return
+    
+    _disable_process_caches()
+    metrics_directory = _share_metrics()
+    try:
+        if not hasattr(os, 'fork'):
+            # uvicorn's own workers are spawned, each importing the app itself
+            uvicorn.run(
+                APP, host=host, port=port, workers=workers, timeout_keep_alive=keep_alive,
+                backlog=backlog, timeout_graceful_shutdown=graceful_timeout, access_log=access_log
+            )
+            return
+        
+        # Import the app once and bind the socket here; the forked workers
+        # share both and accept connections from the same listening socket.
+        config.load()
+        sock = config.bind_socket()
+        if freeze:
+            # Move everything allocated so far out of the collector's reach, so
+            # collections in the workers do not write to (and copy) those pages
+            gc.collect()
+            gc.freeze()
+        _supervise(config, sock, workers)
+    finally:
+        if metrics_directory is not None:
+            shutil.rmtree(metrics_directory, ignore_errors=True)
+
+def _supervise(config: uvicorn.Config, sock, workers: int):
+    children = {}
+    stopping = False
+    
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(config, sock)
+        children[pid] = time.monotonic()
+    
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        # New connections are refused once the draining workers close their copies
+        sock.close()
+        # Workers stop accepting, drain in-flight requests for up to
+        # graceful_timeout seconds and run the lifespan shutdown
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+    
+    while children:
+        pid, status = os.wait()
+        started = children.pop(pid, None)
+        multiprocess_metrics.mark_process_dead(pid)
+        if started is None or stopping:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        if time.monotonic() - started < MIN_WORKER_UPTIME:
+            click.echo(f"❌ Worker {pid} exited with {code} right after starting; shutting down", err=True)
+            stop(signal.SIGTERM, None)
+            continue
+        click.echo(f"⚠️  Worker {pid} exited with {code}; starting a new one", err=True)
+        spawn()
+    sock.close()
+
+def _disable_process_caches():
+    # A worker only invalidates its own cache, so the others would serve
+    # stale entities and ETags for up to ENTITY_CACHE_TTL after every write
+    if Config.ENTITY_CACHE_BACKEND != 'memory':
+        return
+    if 'ENTITY_CACHE_BACKEND' in os.environ:
+        click.echo(
+            "⚠️  ENTITY_CACHE_BACKEND=memory caches in each worker; the others serve stale "
+            f"entities for up to {Config.ENTITY_CACHE_TTL:g}s after a write",
+            err=True
+        )
+        return
+    # Spawned workers read the environment, forked ones keep these caches
+    os.environ['ENTITY_CACHE_BACKEND'] = 'none'
+    task_cache.backend = NullCacheBackend()
+    project_cache.backend = NullCacheBackend()
+
+def _share_metrics() -> Optional[str]:
+    # Each worker only counts the requests it serves; a shared directory lets
+    # any of them answer a scrape with the totals. Returns the directory if
+    # created here, to be removed on exit.
+    if not Config.METRICS_ENABLED:
+        return None
+    if multiprocess_metrics.directory is not None:
+        multiprocess_metrics.reset()
+        return None
+    directory = tempfile.mkdtemp(prefix='todo_list-metrics-')
+    os.environ['METRICS_MULTIPROC_DIR'] = directory
+    multiprocess_metrics.directory = directory
+    return directory
+
+def _run_worker(config: uvicorn.Config, sock):
+    # Never return into the supervisor's loop, whatever happens here
+    status = 0
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        # Pooled connections must not be shared with the parent or siblings
+        db.engine.dispose(close=False)
+        server = uvicorn.Server(config)
+        server.run(sockets=[sock])
+        if not server.started:
+            status = STARTUP_FAILURE
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+def _event_loop() -> str:
+    return 'uvloop' if importlib.util.find_spec('uvloop') else 'asyncio'
+
+def _http_parser() -> str:
+    return 'httptools' if importlib.util.find_spec('httptools') else 'h11'
+
+@click.command()
+@click.option('--host', default=Config.SERVER_HOST, show_default=True, help='Interface to bind')
+@click.option('--port', type=click.IntRange(min=0, max=65535), default=Config.SERVER_PORT, show_default=True)
+@click.option('--workers', type=click.IntRange(min=1), default=Config.SERVER_WORKERS, show_default=True,
+              help='Worker processes, forked after the app is imported')
+@click.option('--keep-alive', type=click.IntRange(min=1), default=Config.SERVER_KEEP_ALIVE, show_default=True,
+              help='Seconds an idle keep-alive connection stays open')
+@click.option('--backlog', type=click.IntRange(min=1), default=Config.SERVER_BACKLOG, show_default=True,
+              help='Connections the kernel queues before accepting')
+@click.option('--graceful-timeout', type=click.IntRange(min=0), default=Config.SERVER_GRACEFUL_TIMEOUT,
+              show_default=True, help='Seconds to drain in-flight requests on shutdown')
+@click.option('--access-log/--no-access-log', default=Config.SERVER_ACCESS_LOG, show_default=True)
+@click.option('--gc-freeze/--no-gc-freeze', default=True, show_default=True,
+              help='Freeze the imported objects before forking workers')
+def serve_cmd(host, port, workers, keep_alive, backlog, graceful_timeout, access_log, gc_freeze):
+    serve(host, port, workers, keep_alive, backlog, graceful_timeout, access_log, gc_freeze)
+
+
+if __name__ == "__main__":
+    serve_cmd()
@@ -15,6 +15,42 @@ class Config:
     MAX_PROJECT_DESCRIPTION_LENGTH = int(os.getenv('MAX_PROJECT_DESCRIPTION_LENGTH', '150'))
     MAX_TASK_TITLE_LENGTH = int(os.getenv('MAX_TASK_TITLE_LENGTH', '30'))
     MAX_TASK_DESCRIPTION_LENGTH = int(os.getenv('MAX_TASK_DESCRIPTION_LENGTH', '150'))
+    DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', '50'))
+    MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', '200'))
+    AUTOCLOSE_BATCH_SIZE = int(os.getenv('AUTOCLOSE_BATCH_SIZE', '1000'))
+    MAX_BULK_TASKS = int(os.getenv('MAX_BULK_TASKS', '1000'))
+    BULK_INSERT_CHUNK_SIZE = int(os.getenv('BULK_INSERT_CHUNK_SIZE', '500'))
+    MAX_SEARCH_QUERY_LENGTH = int(os.getenv('MAX_SEARCH_QUERY_LENGTH', '200'))
+    # The memory cache lives in each worker process, so it is off by default with several
+    ENTITY_CACHE_BACKEND = os.getenv(
+        'ENTITY_CACHE_BACKEND', 'memory' if int(os.getenv('SERVER_WORKERS', '1')) == 1 else 'none'
+    ).lower()
+    ENTITY_CACHE_MAX_SIZE = int(os.getenv('ENTITY_CACHE_MAX_SIZE', '1024'))
+    ENTITY_CACHE_TTL = float(os.getenv('ENTITY_CACHE_TTL', '30'))
+    USE_ASYNC_DB = os.getenv('USE_ASYNC_DB', 'false').lower() in ('1', 'true', 'yes')
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    COMPRESSION_MINIMUM_SIZE = int(os.getenv('COMPRESSION_MINIMUM_SIZE', '1024'))
+    COMPRESSION_ENCODINGS = [
+        encoding.strip() for encoding in os.getenv('COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',') if encoding.strip()
+    ]
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv('COMPRESSION_ZSTD_LEVEL', '3'))
+    DEADLINE_SCHEDULER_ENABLED = os.getenv('DEADLINE_SCHEDULER_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    DEADLINE_SCHEDULER_LOAD_SIZE = int(os.getenv('DEADLINE_SCHEDULER_LOAD_SIZE', '1000'))
+    DEADLINE_SCHEDULER_REFRESH_INTERVAL = float(os.getenv('DEADLINE_SCHEDULER_REFRESH_INTERVAL', '60'))
+    DEADLINE_SCHEDULER_LEADER_RETRY_INTERVAL = float(os.getenv('DEADLINE_SCHEDULER_LEADER_RETRY_INTERVAL', '30'))
+    DEADLINE_SCHEDULER_GRACE_PERIOD = float(os.getenv('DEADLINE_SCHEDULER_GRACE_PERIOD', '1'))
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR') or None
+    METRICS_MULTIPROC_INTERVAL = float(os.getenv('METRICS_MULTIPROC_INTERVAL', '5'))
+    SERVER_HOST = os.getenv('SERVER_HOST', '0.0.0.0')
+    SERVER_PORT = int(os.getenv('SERVER_PORT', '8000'))
+    SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', '1'))
+    SERVER_KEEP_ALIVE = int(os.getenv('SERVER_KEEP_ALIVE', '65'))
+    SERVER_BACKLOG = int(os.getenv('SERVER_BACKLOG', '2048'))
+    SERVER_GRACEFUL_TIMEOUT = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', '30'))
+    SERVER_ACCESS_LOG = os.getenv('SERVER_ACCESS_LOG', 'true').lower() in ('1', 'true', 'yes')
     
     @classmethod
     def get_all_limits(cls) -> Dict[str, Any]:
@@ -26,4 +62,10 @@ class Config:
             'max_project_description_length': cls.MAX_PROJECT_DESCRIPTION_LENGTH,
             'max_task_title_length': cls.MAX_TASK_TITLE_LENGTH,
             'max_task_description_length': cls.MAX_TASK_DESCRIPTION_LENGTH,
+            'default_page_size': cls.DEFAULT_PAGE_SIZE,
+            'max_page_size': cls.MAX_PAGE_SIZE,
+            'autoclose_batch_size': cls.AUTOCLOSE_BATCH_SIZE,
+            'max_bulk_tasks': cls.MAX_BULK_TASKS,
+            'bulk_insert_chunk_size': cls.BULK_INSERT_CHUNK_SIZE,
+            'max_search_query_length': cls.MAX_SEARCH_QUERY_LENGTH,
         }
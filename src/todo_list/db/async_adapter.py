@@ -0,0 +1,31 @@
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+class AsyncAdapter:
+    """
+    Exposes the public methods of a synchronous repository or service as coroutines.
+    Each call runs the synchronous code through AsyncSession.run_sync, so its
+    queries go through the async driver without blocking the event loop.
+    """
+    target_class: type = None
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    def build(self, sync_session: Session) -> Any:
+        return self.target_class(sync_session)
+    
+    def __getattr__(self, name: str) -> Callable:
+        if name.startswith('_') or not callable(getattr(self.target_class, name, None)):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        async def call(*args, **kwargs):
+            return await self.session.run_sync(
+                lambda sync_session: getattr(self.build(sync_session), name)(*args, **kwargs)
+            )
+        
+        call.__name__ = name
+        return call
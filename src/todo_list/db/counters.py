@@ -0,0 +1,154 @@
+from sqlalchemy import DDL, MetaData, Table, event
+
+
+# project_counters holds the task count by status of every project that has
+# had tasks. Triggers on tasks keep it current in the writing transaction:
+# per row on SQLite, per statement with transition tables on PostgreSQL so a
+# bulk UPDATE touches each project's counters once.
+COUNTERS_TABLE = 'project_counters'
+
+POSTGRES_COUNTER_DDL = [
+    f"""
+    CREATE FUNCTION project_counters_add(project_ids integer[], statuses varchar[], deltas integer[])
+    RETURNS void LANGUAGE sql AS $$
+        INSERT INTO {COUNTERS_TABLE} AS counters (project_id, todo_count, doing_count, done_count)
+        SELECT d.project_id,
+               coalesce(sum(d.delta) FILTER (WHERE d.status = 'todo'), 0),
+               coalesce(sum(d.delta) FILTER (WHERE d.status = 'doing'), 0),
+               coalesce(sum(d.delta) FILTER (WHERE d.status = 'done'), 0)
+        FROM unnest(project_ids, statuses, deltas) AS d(project_id, status, delta)
+        -- Skips projects deleted by the statement, whose counters cascade away
+        JOIN projects ON projects.id = d.project_id
+        GROUP BY d.project_id
+        ORDER BY d.project_id
+        ON CONFLICT (project_id) DO UPDATE SET
+            todo_count = counters.todo_count + EXCLUDED.todo_count,
+            doing_count = counters.doing_count + EXCLUDED.doing_count,
+            done_count = counters.done_count + EXCLUDED.done_count
+    $$
+    """,
+    """
+    CREATE FUNCTION project_counters_on_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM project_counters_add(array_agg(project_id), array_agg(status), array_agg(1)) FROM new_rows;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE FUNCTION project_counters_on_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM project_counters_add(array_agg(project_id), array_agg(status), array_agg(-1)) FROM old_rows;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE FUNCTION project_counters_on_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM project_counters_add(array_agg(d.project_id), array_agg(d.status), array_agg(d.delta))
+        FROM (
+            -- Only rows whose status or project changed move between counters
+            WITH moved AS (
+                SELECT old_rows.project_id AS old_project_id, old_rows.status AS old_status,
+                       new_rows.project_id AS new_project_id, new_rows.status AS new_status
+                FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+                WHERE (old_rows.project_id, old_rows.status) IS DISTINCT FROM (new_rows.project_id, new_rows.status)
+            )
+            SELECT old_project_id AS project_id, old_status AS status, -1 AS delta FROM moved
+            UNION ALL
+            SELECT new_project_id, new_status, 1 FROM moved
+        ) AS d;
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counters_on_insert()
+    """,
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counters_on_delete()
+    """,
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_counters_on_update()
+    """,
+]
+
+SQLITE_COUNTER_DDL = [
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO {COUNTERS_TABLE} (project_id, todo_count, doing_count, done_count)
+        VALUES (new.project_id, new.status IS 'todo', new.status IS 'doing', new.status IS 'done')
+        ON CONFLICT (project_id) DO UPDATE SET
+            todo_count = todo_count + excluded.todo_count,
+            doing_count = doing_count + excluded.doing_count,
+            done_count = done_count + excluded.done_count;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_ad AFTER DELETE ON tasks BEGIN
+        UPDATE {COUNTERS_TABLE} SET
+            todo_count = todo_count - (old.status IS 'todo'),
+            doing_count = doing_count - (old.status IS 'doing'),
+            done_count = done_count - (old.status IS 'done')
+        WHERE project_id = old.project_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_au AFTER UPDATE OF status, project_id ON tasks
+    WHEN old.status IS NOT new.status OR old.project_id IS NOT new.project_id BEGIN
+        UPDATE {COUNTERS_TABLE} SET
+            todo_count = todo_count - (old.status IS 'todo'),
+            doing_count = doing_count - (old.status IS 'doing'),
+            done_count = done_count - (old.status IS 'done')
+        WHERE project_id = old.project_id;
+        INSERT INTO {COUNTERS_TABLE} (project_id, todo_count, doing_count, done_count)
+        VALUES (new.project_id, new.status IS 'todo', new.status IS 'doing', new.status IS 'done')
+        ON CONFLICT (project_id) DO UPDATE SET
+            todo_count = todo_count + excluded.todo_count,
+            doing_count = doing_count + excluded.doing_count,
+            done_count = done_count + excluded.done_count;
+    END
+    """,
+    # Foreign keys are not enforced by default on SQLite, so cascade by hand
+    f"""
+    CREATE TRIGGER {COUNTERS_TABLE}_project_ad AFTER DELETE ON projects BEGIN
+        DELETE FROM {COUNTERS_TABLE} WHERE project_id = old.id;
+    END
+    """,
+]
+
+# Counts the tasks that existed before the triggers
+BACKFILL_COUNTERS = f"""
+    INSERT INTO {COUNTERS_TABLE} (project_id, todo_count, doing_count, done_count)
+    SELECT project_id,
+           sum(CASE WHEN status = 'todo' THEN 1 ELSE 0 END),
+           sum(CASE WHEN status = 'doing' THEN 1 ELSE 0 END),
+           sum(CASE WHEN status = 'done' THEN 1 ELSE 0 END)
+    FROM tasks
+    GROUP BY project_id
+"""
+
+
+def register_counter_ddl(metadata: MetaData, counters: Table) -> None:
+    """
+    Install the counter triggers and backfill the counters when create_all
+    creates the counters table. Runs once every table exists, since the
+    triggers are on tasks and projects.
+    """
+    dialect_statements = {'postgresql': POSTGRES_COUNTER_DDL, 'sqlite': SQLITE_COUNTER_DDL}
+    
+    def install(target, connection, tables=(), **kw):
+        statements = dialect_statements.get(connection.dialect.name)
+        if statements is None or counters not in tables:
+            return
+        for statement in statements + [BACKFILL_COUNTERS]:
+            connection.execute(DDL(statement))
+    
+    event.listen(metadata, 'after_create', install)
@@ -0,0 +1,42 @@
+import zlib
+
+from sqlalchemy import Table, false, text, update
+from sqlalchemy.orm import Session
+
+
+def advisory_key(name: str) -> int:
+    """Stable 32-bit key for a named PostgreSQL advisory lock."""
+    return zlib.crc32(name.encode())
+
+
+def lock_for_write(session: Session, name: str, table: Table) -> None:
+    """
+    Serialize the transactions that check a limit before inserting, until the
+    current transaction commits or rolls back.
+    
+    PostgreSQL takes a transaction-level advisory lock on `name`. SQLite only
+    allows one writer, so a write matching no rows of `table` takes the
+    database write lock up front. Other dialects are left unlocked.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': advisory_key(name)})
+    elif dialect == 'sqlite':
+        _take_sqlite_write_lock(session, table)
+
+
+def lock_table_writes(session: Session, table: Table) -> None:
+    """
+    Block inserts, updates and deletes on `table` until the current
+    transaction ends, while still letting other sessions read it.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        session.execute(text(f"LOCK TABLE {table.name} IN SHARE MODE"))
+    elif dialect == 'sqlite':
+        _take_sqlite_write_lock(session, table)
+
+
+def _take_sqlite_write_lock(session: Session, table: Table) -> None:
+    # A write matching no rows still takes the database write lock
+    session.execute(update(table).where(false()).values({table.c.id: table.c.id}))
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class CheckoutTimingMixin:
+    """Records how long callers wait to check a connection out of the pool."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_time_total += waited
+                self.wait_time_max = max(self.wait_time_max, waited)
+
+
+class TimedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def timed_pool_class(default_pool_class: type) -> type:
+    """Timed counterpart of the pool class a dialect would use, if there is one."""
+    if issubclass(default_pool_class, AsyncAdaptedQueuePool):
+        return TimedAsyncAdaptedQueuePool
+    if issubclass(default_pool_class, QueuePool):
+        return TimedQueuePool
+    return default_pool_class
+
+
+def pool_statistics(pool: Pool) -> Dict[str, Any]:
+    """Snapshot of a pool's live connection counts and checkout wait times."""
+    stats = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': max(pool.overflow(), 0),
+            'max_overflow': pool._max_overflow,
+            'timeout': pool.timeout(),
+        })
+    else:
+        stats['status'] = pool.status()
+    
+    if isinstance(pool, CheckoutTimingMixin):
+        with pool._stats_lock:
+            stats.update({
+                'checkouts': pool.checkouts,
+                'timeouts': pool.timeouts,
+                'wait_time_total_ms': round(pool.wait_time_total * 1000, 3),
+                'wait_time_avg_ms': round(pool.wait_time_total * 1000 / pool.checkouts, 3) if pool.checkouts else 0.0,
+                'wait_time_max_ms': round(pool.wait_time_max * 1000, 3),
+            })
+    return stats
@@ -0,0 +1,86 @@
+from typing import Optional, Tuple
+
+from sqlalchemy import DDL, Float, Table, cast, event, func, literal_column, table, column
+from sqlalchemy.sql.elements import ColumnElement
+
+
+# PostgreSQL keeps a weighted tsvector of title and description in a stored
+# generated column with a GIN index; SQLite keeps an external-content FTS5
+# table in sync with triggers. Both are created with the tasks table.
+SEARCH_CONFIG = 'english'
+SEARCH_VECTOR_COLUMN = 'search_vector'
+SEARCH_INDEX = 'ix_tasks_search_vector'
+FTS_TABLE = 'tasks_fts'
+# Relative bm25 weights of the title and description columns on SQLite
+FTS_WEIGHTS = (2.0, 1.0)
+
+POSTGRES_SEARCH_DDL = [
+    f"""
+    ALTER TABLE tasks ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    f"CREATE INDEX {SEARCH_INDEX} ON tasks USING gin ({SEARCH_VECTOR_COLUMN})",
+]
+
+SQLITE_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, description, content='tasks', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    # Index the rows that existed before the table
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def register_search_ddl(tasks: Table) -> None:
+    """Create the search structures of the dialect whenever the tasks table is created."""
+    for statement in POSTGRES_SEARCH_DDL:
+        event.listen(tasks, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(tasks, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+    event.listen(tasks, 'before_drop', DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect='sqlite'))
+
+
+def fts_query(query_text: str) -> str:
+    """Quote every word of a user query so FTS5 matches all of them instead of parsing its syntax."""
+    return ' '.join('"{}"'.format(word.replace('"', '""')) for word in query_text.split())
+
+
+def full_text_match(dialect: str, query_text: str) -> Optional[Tuple[Optional[Table], ColumnElement, ColumnElement]]:
+    """
+    Return (table to join on rowid, match condition, rank) of query_text for
+    the dialect, or None when it has no full-text search. Higher ranks are
+    better matches.
+    """
+    if dialect == 'postgresql':
+        vector = literal_column(f'tasks.{SEARCH_VECTOR_COLUMN}')
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+        # ts_rank_cd is a real; as a double it round-trips through cursors exactly
+        return None, vector.op('@@')(ts_query), cast(func.ts_rank_cd(vector, ts_query), Float)
+    if dialect == 'sqlite':
+        fts = table(FTS_TABLE, column('rowid'))
+        match = literal_column(FTS_TABLE).op('MATCH')(fts_query(query_text))
+        # bm25 is lower for better matches
+        return fts, match, -func.bm25(literal_column(FTS_TABLE), *FTS_WEIGHTS)
+    return None
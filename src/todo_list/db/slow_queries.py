@@ -0,0 +1,149 @@
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    import greenlet
+except ImportError:
+    greenlet = None
+
+
+logger = logging.getLogger(__name__)
+
+REPOSITORY_PACKAGE = 'todo_list.repositories'
+MAX_PARAMETERS_LENGTH = 1000
+
+
+class SlowQueryLog:
+    """
+    Logs statements slower than a threshold and keeps the latest ones.
+
+    Each entry names the repository method the statement came from and,
+    with explain on, the plan of a re-run of the statement: EXPLAIN
+    (ANALYZE, BUFFERS) on PostgreSQL, EXPLAIN QUERY PLAN on SQLite. Only
+    plain SELECTs are explained, because ANALYZE executes the statement
+    again.
+    """
+    
+    def __init__(self, threshold: float, explain: bool = False, max_entries: int = 100):
+        self.threshold = threshold
+        self.explain = explain
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+    
+    def install(self, engine: Engine) -> None:
+        """Watch the statements of an engine; async engines pass their sync_engine."""
+        if not event.contains(engine, 'before_cursor_execute', self._before_cursor_execute):
+            event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+    
+    def recent(self) -> List[Dict[str, Any]]:
+        """Recorded statements, slowest first."""
+        with self._lock:
+            entries = list(self._entries)
+        return sorted(entries, key=lambda entry: entry['duration_ms'], reverse=True)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._slow_query_started = time.perf_counter()
+    
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - context._slow_query_started
+        if duration < self.threshold:
+            return
+        
+        entry = {
+            'recorded_at': datetime.now(timezone.utc).isoformat(),
+            'duration_ms': round(duration * 1000, 3),
+            'origin': find_origin(),
+            'statement': statement,
+            'parameters': truncate(repr(parameters)),
+            'plan': None,
+        }
+        if self.explain and not executemany and is_explainable(statement):
+            entry['plan'] = explain(conn, statement, parameters)
+        
+        logger.warning(
+            "Slow query (%.1f ms) from %s: %s; parameters: %s",
+            entry['duration_ms'], entry['origin'] or 'unknown', statement, entry['parameters']
+        )
+        if entry['plan']:
+            logger.warning("Plan:\n%s", entry['plan'])
+        
+        with self._lock:
+            self._entries.append(entry)
+
+
+def find_origin() -> Optional[str]:
+    """The innermost repository method on the stack, as Class.method."""
+    origin = _repository_frame(sys._getframe(2))
+    # Async sessions run statements in a greenlet; the coroutine that
+    # awaited them is on the stack of the greenlet that spawned it.
+    if origin is None and greenlet is not None:
+        parent = greenlet.getcurrent().parent
+        if parent is not None and parent.gr_frame is not None:
+            origin = _repository_frame(parent.gr_frame)
+    return origin
+
+
+def _repository_frame(frame) -> Optional[str]:
+    while frame is not None:
+        if frame.f_globals.get('__name__', '').startswith(REPOSITORY_PACKAGE):
+            owner = frame.f_locals.get('self')
+            name = frame.f_code.co_name
+            return f'{type(owner).__name__}.{name}' if owner is not None else name
+        frame = frame.f_back
+    return None
+
+
+def is_explainable(statement: str) -> bool:
+    normalized = statement.lstrip().upper()
+    return normalized.startswith('SELECT') and 'FOR UPDATE' not in normalized
+
+
+def explain(conn, statement: str, parameters) -> Optional[str]:
+    """Plan of the statement, run on the same connection so it sees the same transaction."""
+    dialect = conn.dialect.name
+    if dialect == 'postgresql':
+        prefix = 'EXPLAIN (ANALYZE, BUFFERS) '
+    elif dialect == 'sqlite':
+        prefix = 'EXPLAIN QUERY PLAN '
+    else:
+        return None
+    
+    # The raw DBAPI cursor keeps the EXPLAIN out of the engine's events; a
+    # savepoint keeps a failed EXPLAIN from aborting the caller's transaction.
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if dialect == 'postgresql':
+            cursor.execute('SAVEPOINT slow_query_explain')
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        finally:
+            if dialect == 'postgresql':
+                cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+                cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+    except Exception as e:
+        logger.warning("Could not explain slow query: %s", e)
+        return None
+    finally:
+        cursor.close()
+    
+    if dialect == 'sqlite':
+        return '\n'.join(str(row[-1]) for row in rows)
+    return '\n'.join(row[0] for row in rows)
+
+
+def truncate(text: str, limit: int = MAX_PARAMETERS_LENGTH) -> str:
+    return text if len(text) <= limit else text[:limit] + '...'
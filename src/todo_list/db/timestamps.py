@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """
+    Current time for the timestamps the application writes.
+    
+    SQLite's now() only has whole seconds, so two writes in the same second
+    would leave updated_at, and every ETag derived from it, unchanged.
+    """
+    return datetime.now(timezone.utc)
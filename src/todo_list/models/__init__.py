@@ -1,5 +1,6 @@
 from .project import Project
+from .project_counter import ProjectCounter
 from .task import Task, TaskStatus
 
 
-__all__ = ['Project', 'Task', 'TaskStatus']
+__all__ = ['Project', 'ProjectCounter', 'Task', 'TaskStatus']
@@ -5,19 +5,21 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from todo_list.db.base import Base
+from todo_list.db.timestamps import utc_now
 
 
 class Project(Base):
     __tablename__ = "projects"
-
+    
     _max_name_length = int(os.getenv('MAX_PROJECT_NAME_LENGTH', 100))
     _max_description_length = int(os.getenv('MAX_PROJECT_DESCRIPTION_LENGTH', 1000))
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(_max_name_length), unique=True, index=True, nullable=False)
     description = Column(String(_max_description_length))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Stamped by the application so stored and bound values compare alike on SQLite
+    created_at = Column(DateTime(timezone=True), default=utc_now, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utc_now)
     
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
     
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy.ext.hybrid import hybrid_property
+
+from todo_list.db.base import Base
+from todo_list.db.counters import COUNTERS_TABLE, register_counter_ddl
+
+
+class ProjectCounter(Base):
+    """Task counts by status of a project, kept current by triggers on tasks."""
+    __tablename__ = COUNTERS_TABLE
+    
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    todo_count = Column(Integer, nullable=False, default=0, server_default='0')
+    doing_count = Column(Integer, nullable=False, default=0, server_default='0')
+    done_count = Column(Integer, nullable=False, default=0, server_default='0')
+    
+    @hybrid_property
+    def task_count(self):
+        return self.todo_count + self.doing_count + self.done_count
+    
+    def __repr__(self):
+        return (
+            f"<ProjectCounter(project_id={self.project_id}, todo={self.todo_count}, "
+            f"doing={self.doing_count}, done={self.done_count})>"
+        )
+
+
+register_counter_ddl(Base.metadata, ProjectCounter.__table__)
@@ -1,11 +1,13 @@
 import enum
 import os
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from todo_list.db.base import Base
+from todo_list.db.timestamps import utc_now
+from todo_list.db.search import register_search_ddl
 
 
 class TaskStatus(enum.Enum):
@@ -16,7 +18,7 @@ class TaskStatus(enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
-
+    
     _max_title_length = int(os.getenv('MAX_TASK_TITLE_LENGTH', 200))
     _max_description_length = int(os.getenv('MAX_TASK_DESCRIPTION_LENGTH', 2000))
     
@@ -25,13 +27,35 @@ class Task(Base):
     description = Column(String(_max_description_length))
     status = Column(String(20), default=TaskStatus.TODO.value)
     deadline = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Stamped by the application so stored and bound values compare alike on SQLite
+    created_at = Column(DateTime(timezone=True), default=utc_now, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=utc_now)
     closed_at = Column(DateTime(timezone=True), nullable=True)
-
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     
     project = relationship("Project", back_populates="tasks")
     
+    __table_args__ = (
+        Index(
+            'ix_tasks_open_deadline', 'deadline',
+            postgresql_where=text("deadline IS NOT NULL AND closed_at IS NULL"),
+            sqlite_where=text("deadline IS NOT NULL AND closed_at IS NULL")
+        ),
+        # Unclosed tasks of each project, for the per-project stats
+        Index(
+            'ix_tasks_open_project_created_at', 'project_id', 'created_at',
+            postgresql_where=text("closed_at IS NULL"),
+            sqlite_where=text("closed_at IS NULL")
+        ),
+        # Listing filters and sort orders; id closes each index for keyset pagination
+        Index('ix_tasks_status_id', 'status', 'id'),
+        Index('ix_tasks_deadline_id', 'deadline', 'id'),
+        Index('ix_tasks_created_at_id', 'created_at', 'id'),
+    )
+    
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+
+register_search_ddl(Task.__table__)
@@ -1,5 +1,10 @@
 from .project_repository import ProjectRepository
 from .task_repository import TaskRepository
+from .task_filter import TaskFilter, TASK_SORT_KEYS
+from .async_repositories import AsyncProjectRepository, AsyncTaskRepository
 
 
-__all__ = ['ProjectRepository', 'TaskRepository']
+__all__ = [
+    'ProjectRepository', 'TaskRepository', 'AsyncProjectRepository', 'AsyncTaskRepository',
+    'TaskFilter', 'TASK_SORT_KEYS'
+]
@@ -0,0 +1,13 @@
+from todo_list.db.async_adapter import AsyncAdapter
+from .project_repository import ProjectRepository
+from .task_repository import TaskRepository
+
+
+class AsyncProjectRepository(AsyncAdapter):
+    """ProjectRepository running on an AsyncSession"""
+    target_class = ProjectRepository
+
+
+class AsyncTaskRepository(AsyncAdapter):
+    """TaskRepository running on an AsyncSession"""
+    target_class = TaskRepository
@@ -1,14 +1,22 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import delete, func, insert
 from sqlalchemy.orm import Session
 
+from todo_list.cache import project_cache, task_cache
+from todo_list.db.locks import lock_for_write, lock_table_writes
 from todo_list.models.project import Project
+from todo_list.models.project_counter import ProjectCounter
+from todo_list.models.task import Task, TaskStatus
+from todo_list.repositories.task_filter import open_condition, overdue_condition
 from todo_list.exceptions import NotFoundException, DuplicateEntryException
 
 
 class ProjectRepository:
     def __init__(self, session: Session):
         self.session = session
+        self.cache = project_cache
+        self.task_cache = task_cache
     
     def create(self, name: str, description: str = None) -> Project:
         if self.get_by_name(name):
@@ -20,21 +28,114 @@ class ProjectRepository:
         self.session.refresh(project)
         return project
     
+    def lock_for_insert(self) -> None:
+        lock_for_write(self.session, 'projects', Project.__table__)
+    
+    def rollback(self) -> None:
+        self.session.rollback()
+    
+    def count(self) -> int:
+        return self.session.query(func.count(Project.id)).scalar()
+    
+    def has_tasks(self, project_id: int) -> bool:
+        return self.session.query(
+            self.session.query(Task.id).filter(Task.project_id == project_id).exists()
+        ).scalar()
+    
     def get_by_id(self, project_id: int) -> Optional[Project]:
-        return self.session.query(Project).filter(Project.id == project_id).first()
+        row = self.get_with_task_count(project_id)
+        return row[0] if row else None
     
     def get_by_name(self, name: str) -> Optional[Project]:
         return self.session.query(Project).filter(Project.name == name).first()
     
-    def get_all(self) -> List[Project]:
-        return self.session.query(Project).all()
+    def get_all(self, limit: int = None, after_id: int = None) -> List[Project]:
+        return self._paginate(self.session.query(Project), limit, after_id).all()
+    
+    def get_with_task_count(self, project_id: int) -> Optional[Tuple[Project, int]]:
+        row = self.cache.get(self.session, project_id)
+        if row is None:
+            generation = self.cache.generation()
+            row = self._query_with_task_count().filter(Project.id == project_id).first()
+            if row is not None:
+                row = tuple(row)
+                self.cache.set(project_id, row, generation)
+        return row
+    
+    def get_all_with_task_counts(self, limit: int = None, after_id: int = None) -> List[Tuple[Project, int]]:
+        return self._paginate(self._query_with_task_count(), limit, after_id).all()
+    
+    def get_rows_with_task_counts(self, limit: int = None, after_id: int = None) -> List[Dict]:
+        """Like get_all_with_task_counts, as plain column dicts for read-only callers such as the API."""
+        query = self.session.query(
+            Project.id,
+            Project.name,
+            Project.description,
+            Project.created_at,
+            Project.updated_at,
+            self._task_count().label('task_count')
+        )
+        query = self._paginate(query, limit, after_id)
+        keys = [column['name'] for column in query.column_descriptions]
+        return [dict(zip(keys, row)) for row in query]
+    
+    def get_status_stats(self, limit: int = None, after_id: int = None) -> List[Dict]:
+        """
+        Task counts by status, overdue task count and creation time of the
+        oldest open task of each project. Status counts come from the counters;
+        only the open tasks of the page's projects are read.
+        """
+        statuses = [task_status.value for task_status in TaskStatus]
+        status_counts = [
+            func.coalesce(getattr(ProjectCounter, f'{value}_count'), 0).label(f'status_{value}')
+            for value in statuses
+        ]
+        query = (
+            self.session.query(
+                Project.id,
+                Project.name,
+                Project.description,
+                Project.created_at,
+                *status_counts,
+                self._open_tasks(func.count(Task.id), overdue_condition()).label('overdue_count'),
+                self._open_tasks(func.min(Task.created_at), open_condition()).label('oldest_open_created_at')
+            )
+            .outerjoin(ProjectCounter, ProjectCounter.project_id == Project.id)
+        )
+        return [
+            {
+                'id': row.id,
+                'name': row.name,
+                'description': row.description,
+                'created_at': row.created_at,
+                'task_count': sum(row._mapping[f'status_{value}'] for value in statuses),
+                'status_counts': {value: row._mapping[f'status_{value}'] for value in statuses},
+                'overdue_count': row.overdue_count,
+                'oldest_open_created_at': row.oldest_open_created_at,
+            }
+            for row in self._paginate(query, limit, after_id)
+        ]
+    
+    def get_page_version(self, limit: int = None, after_id: int = None) -> Tuple:
+        """
+        Version of a page of projects: the id, last change and task count of
+        each of its projects. Task counts are read from the counters, so tasks
+        themselves are never scanned.
+        """
+        query = self.session.query(
+            Project.id,
+            func.coalesce(Project.updated_at, Project.created_at),
+            self._task_count()
+        )
+        return tuple(tuple(row) for row in self._paginate(query, limit, after_id))
     
     def update(self, project_id: int, name: str = None, description: str = None) -> Optional[Project]:
-        project = self.get_by_id(project_id)
+        project = self._get_for_write(project_id)
         if not project:
             raise NotFoundException(f"Project with id {project_id} not found")
         
-        if name and name != project.name:
+        renamed = bool(name) and name != project.name
+        if renamed:
             if self.get_by_name(name):
                 raise DuplicateEntryException(f"Project with name '{name}' already exists")
             project.name = name
@@ -43,14 +144,100 @@ class ProjectRepository:
             project.description = description
         
         self.session.commit()
+        self.cache.invalidate(project_id)
+        if renamed:
+            # Cached tasks carry the project name
+            self.task_cache.clear()
         self.session.refresh(project)
         return project
     
     def delete(self, project_id: int) -> bool:
-        project = self.get_by_id(project_id)
+        project = self._get_for_write(project_id)
         if not project:
             raise NotFoundException(f"Project with id {project_id} not found")
         
         self.session.delete(project)
         self.session.commit()
+        self.cache.invalidate(project_id)
+        # Its tasks are deleted with it
+        self.task_cache.clear()
         return True
+    
+    def rebuild_counters(self, dry_run: bool = False) -> List[int]:
+        """
+        Recount the tasks of every project by status and rewrite the counters
+        that drifted from it. Task writes wait until the rebuild ends, so none
+        can slip in between the count and the fix. Returns the ids of the
+        projects whose counters had drifted.
+        """
+        lock_table_writes(self.session, Task.__table__)
+        statuses = [task_status.value for task_status in TaskStatus]
+        
+        actual = {}
+        rows = (
+            self.session.query(Task.project_id, Task.status, func.count(Task.id))
+            .filter(Task.status.in_(statuses))
+            .group_by(Task.project_id, Task.status)
+        )
+        for project_id, task_status, count in rows:
+            actual.setdefault(project_id, dict.fromkeys(statuses, 0))[task_status] = count
+        
+        stored = {
+            counter.project_id: {value: getattr(counter, f'{value}_count') for value in statuses}
+            for counter in self.session.query(ProjectCounter)
+        }
+        empty = dict.fromkeys(statuses, 0)
+        drifted = sorted(
+            project_id for project_id in actual.keys() | stored.keys()
+            if actual.get(project_id, empty) != stored.get(project_id, empty)
+        )
+        
+        if dry_run or not drifted:
+            self.session.rollback()
+            return drifted
+        
+        self.session.execute(delete(ProjectCounter).where(ProjectCounter.project_id.in_(drifted)))
+        rows = [
+            {'project_id': project_id, **{f'{value}_count': actual[project_id][value] for value in statuses}}
+            for project_id in drifted if project_id in actual
+        ]
+        if rows:
+            self.session.execute(insert(ProjectCounter), rows)
+        self.session.commit()
+        self.cache.invalidate(*drifted)
+        return drifted
+    
+    def _get_for_write(self, project_id: int) -> Optional[Project]:
+        return self.session.query(Project).filter(Project.id == project_id).first()
+    
+    def _query_with_task_count(self):
+        return self.session.query(Project, self._task_count().label('task_count'))
+    
+    def _task_count(self):
+        # Read the trigger-maintained counters instead of counting each
+        # project's tasks; projects that never had tasks have no counters row.
+        return func.coalesce(
+            self.session.query(ProjectCounter.task_count)
+            .filter(ProjectCounter.project_id == Project.id)
+            .correlate(Project)
+            .scalar_subquery(),
+            0
+        )
+    
+    def _open_tasks(self, aggregate, condition):
+        # Correlated per project, so only the unclosed tasks of the page's
+        # projects are read, through ix_tasks_open_project_created_at
+        return (
+            self.session.query(aggregate)
+            .filter(Task.project_id == Project.id, condition)
+            .correlate(Project)
+            .scalar_subquery()
+        )
+    
+    def _paginate(self, query, limit: int = None, after_id: int = None):
+        if after_id is not None:
+            query = query.filter(Project.id > after_id)
+        query = query.order_by(Project.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, func
+
+from todo_list.models.task import Task, TaskStatus
+
+
+# Columns a task listing may be ordered by. Each one is backed by an index
+# ending in tasks.id, which keyset pagination uses as the tie-breaker.
+TASK_SORT_KEYS = ('id', 'deadline', 'created_at')
+
+
+class TaskFilter:
+    """Conditions of a task listing; conditions left empty do not filter."""
+    
+    def __init__(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        project_ids: Optional[Iterable[int]] = None,
+        deadline_after: Optional[datetime] = None,
+        deadline_before: Optional[datetime] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ):
+        self.statuses = list(statuses or [])
+        self.project_ids = list(project_ids or [])
+        self.deadline_after = deadline_after
+        self.deadline_before = deadline_before
+        self.created_after = created_after
+        self.created_before = created_before
+    
+    def __repr__(self):
+        conditions = ', '.join(f'{name}={value!r}' for name, value in vars(self).items() if value)
+        return f"<TaskFilter({conditions})>"
+
+
+def open_condition():
+    """Tasks that are neither done nor closed."""
+    return and_(Task.status != TaskStatus.DONE.value, Task.closed_at.is_(None))
+
+
+def overdue_condition():
+    """Open tasks whose deadline has passed."""
+    return and_(Task.deadline.isnot(None), Task.deadline < func.now(), open_condition())
@@ -1,18 +1,26 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_
 from sqlalchemy import func
+from sqlalchemy import delete, insert, select, update
 
+from todo_list.cache import project_cache, task_cache
+from todo_list.db.locks import lock_for_write
+from todo_list.db.search import full_text_match
+from todo_list.repositories.task_filter import TaskFilter, open_condition, overdue_condition
 from todo_list.models.task import Task, TaskStatus
 from todo_list.models.project import Project
-from todo_list.exceptions import NotFoundException
+from todo_list.models.project_counter import ProjectCounter
+from todo_list.exceptions import BusinessRuleException, NotFoundException, ValidationException
 
 
 class TaskRepository:
     def __init__(self, session: Session):
         self.session = session
+        self.cache = task_cache
+        self.project_cache = project_cache
     
     def create(self, title: str, project_id: int, description: str = None, 
                deadline: datetime = None) -> Task:
@@ -29,57 +37,367 @@ class TaskRepository:
         )
         self.session.add(task)
         self.session.commit()
-        self.session.refresh(task)
-        return task
+        self.project_cache.invalidate(project_id)
+        return self.get_by_id(task.id)
+    
+    def lock_project_tasks(self, project_id: int) -> None:
+        lock_for_write(self.session, f'tasks:project:{project_id}', Task.__table__)
+    
+    def rollback(self) -> None:
+        self.session.rollback()
+    
+    def count_by_project(self, project_id: int) -> int:
+        # One counters row instead of counting the project's tasks
+        count = (
+            self.session.query(ProjectCounter.task_count)
+            .filter(ProjectCounter.project_id == project_id)
+            .scalar()
+        )
+        return count or 0
+    
+    def count_by_projects(self, project_ids: Iterable[int]) -> Dict[int, int]:
+        rows = (
+            self.session.query(ProjectCounter.project_id, ProjectCounter.task_count)
+            .filter(ProjectCounter.project_id.in_(list(project_ids)))
+            .all()
+        )
+        return dict(rows)
+    
+    def get_existing_project_ids(self, project_ids: Iterable[int]) -> Set[int]:
+        rows = self.session.query(Project.id).filter(Project.id.in_(list(project_ids))).all()
+        return {project_id for project_id, in rows}
+    
+    def create_many(self, rows: List[Dict], chunk_size: int) -> List[Task]:
+        """Insert rows with one multi-row INSERT ... RETURNING per chunk, in a single transaction."""
+        task_ids = []
+        if rows:
+            # Core insert on the table: the ORM bulk path splits rows into
+            # separate statements whenever their set of non-null keys differs.
+            statement = (
+                insert(Task.__table__)
+                .returning(Task.id)
+                .execution_options(insertmanyvalues_page_size=chunk_size)
+            )
+            values = [
+                {
+                    'title': row['title'],
+                    'description': row.get('description'),
+                    'deadline': row.get('deadline'),
+                    'project_id': row['project_id'],
+                    'status': TaskStatus.TODO.value,
+                }
+                for row in rows
+            ]
+            task_ids = self.session.execute(statement, values).scalars().all()
+        self.session.commit()
+        self.project_cache.invalidate(*{row['project_id'] for row in rows})
+        return self.get_by_ids(task_ids)
+    
+    def get_by_ids(self, task_ids: Iterable[int]) -> List[Task]:
+        task_ids = list(task_ids)
+        if not task_ids:
+            return []
+        return self._query().filter(Task.id.in_(task_ids)).order_by(Task.id).all()
     
     def get_by_id(self, task_id: int) -> Optional[Task]:
-        return self.session.query(Task).filter(Task.id == task_id).first()
+        task = self.cache.get(self.session, task_id)
+        if task is None:
+            generation = self.cache.generation()
+            task = self._get_for_write(task_id)
+            if task is not None:
+                self.cache.set(task_id, task, generation)
+        return task
     
-    def get_all(self) -> List[Task]:
-        return self.session.query(Task).all()
+    def get_all(self, limit: int = None, after_id: int = None) -> List[Task]:
+        return self._paginate(self._query(), limit, after_id).all()
     
-    def get_by_project(self, project_id: int) -> List[Task]:
-        return self.session.query(Task).filter(Task.project_id == project_id).all()
+    def get_by_project(self, project_id: int, limit: int = None, after_id: int = None) -> List[Task]:
+        query = self._query().filter(Task.project_id == project_id)
+        return self._paginate(query, limit, after_id).all()
     
     def get_overdue_tasks(self) -> List[Task]:
-        current_time = func.now()
-        return self.session.query(Task).filter(
-            and_(
-                Task.deadline.isnot(None),
-                Task.deadline < current_time,
-                Task.status != TaskStatus.DONE.value,
-                Task.closed_at.is_(None)
+        return self._query().filter(self._overdue_condition()).all()
+    
+    def get_all_rows(self, limit: int = None, after_id: int = None, task_filter: TaskFilter = None,
+                     sort: str = 'id', after_value=None) -> List[Dict]:
+        """
+        Like get_all, as plain column dicts for read-only callers such as the API.
+        
+        sort is a column of TASK_SORT_KEYS, prefixed with '-' for descending
+        order. Pages after the first pass the sort value and id of the last
+        row seen as after_value and after_id.
+        """
+        query = self._filter(self._row_query(), task_filter)
+        return self._rows(self._paginate(query, limit, after_id, sort, after_value))
+    
+    def get_rows_by_project(self, project_id: int, limit: int = None, after_id: int = None) -> List[Dict]:
+        query = self._row_query().filter(Task.project_id == project_id)
+        return self._rows(self._paginate(query, limit, after_id))
+    
+    def get_overdue_rows(self) -> List[Dict]:
+        return self._rows(self._row_query().filter(self._overdue_condition()))
+    
+    def search_rows(self, query_text: str, limit: int = None, after_id: int = None,
+                    after_rank: float = None) -> List[Dict]:
+        """
+        Tasks whose title or description match query_text, best match first,
+        as column dicts with their rank. Pages after the first pass the rank
+        and id of the last row seen as after_rank and after_id.
+        """
+        search = full_text_match(self.session.get_bind().dialect.name, query_text)
+        if search is None:
+            raise BusinessRuleException("Full-text search is not supported on this database")
+        
+        fts, match, rank = search
+        query = self._row_query().add_columns(rank.label('rank')).filter(match)
+        if fts is not None:
+            query = query.join(fts, fts.c.rowid == Task.id)
+        if after_id is not None:
+            query = query.filter(or_(rank < after_rank, and_(rank == after_rank, Task.id > after_id)))
+        query = query.order_by(rank.desc(), Task.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return self._rows(query)
+    
+    def get_page_version(self, limit: int = None, after_id: int = None, project_id: int = None,
+                         task_filter: TaskFilter = None, sort: str = 'id', after_value=None) -> Tuple:
+        """Summarize a page of tasks in one aggregate row that changes whenever the page does."""
+        query = self._filter(self._version_query(), task_filter)
+        if project_id is not None:
+            query = query.filter(Task.project_id == project_id)
+        return self._aggregate_version(self._paginate(query, limit, after_id, sort, after_value))
+    
+    def get_overdue_version(self) -> Tuple:
+        return self._aggregate_version(self._version_query().filter(self._overdue_condition()))
+    
+    def count_overdue_tasks(self) -> int:
+        return self.session.query(func.count(Task.id)).filter(self._overdue_condition()).scalar()
+    
+    def get_upcoming_deadlines(self, limit: int, after_deadline: datetime = None,
+                               after_id: int = None) -> List[Tuple[datetime, int]]:
+        """(deadline, id) of open tasks with a deadline, in deadline order after the given key."""
+        query = self.session.query(Task.deadline, Task.id).filter(Task.deadline.isnot(None), open_condition())
+        if after_deadline is not None:
+            query = query.filter(
+                or_(Task.deadline > after_deadline, and_(Task.deadline == after_deadline, Task.id > after_id))
             )
-        ).all()
+        return [tuple(row) for row in query.order_by(Task.deadline, Task.id).limit(limit).all()]
+    
+    def close_overdue_batch(self, batch_size: int) -> List[int]:
+        """
+        Close up to batch_size overdue tasks in one UPDATE and commit.
+        
+        The batch is claimed with FOR UPDATE SKIP LOCKED, so concurrent callers
+        close disjoint batches instead of waiting on each other's rows. SQLite
+        has no row locks and serializes the writers instead.
+        """
+        batch = (
+            select(Task.id)
+            .where(self._overdue_condition())
+            .order_by(Task.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(Task)
+            .where(Task.id.in_(batch))
+            .values(status=TaskStatus.DONE.value, closed_at=func.now())
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        closed_ids = self.session.execute(statement).scalars().all()
+        self.session.commit()
+        self.cache.invalidate(*closed_ids)
+        return closed_ids
     
     def close_task(self, task_id: int) -> Optional[Task]:
-        task = self.get_by_id(task_id)
+        task = self._get_for_write(task_id)
         if not task:
             raise NotFoundException(f"Task with id {task_id} not found")
         
         task.status = TaskStatus.DONE.value
         task.closed_at = datetime.now()
         self.session.commit()
-        return task
+        self.cache.invalidate(task_id)
+        return self.get_by_id(task_id)
     
     def update(self, task_id: int, **kwargs) -> Optional[Task]:
-        task = self.get_by_id(task_id)
+        task = self._get_for_write(task_id)
         if not task:
             raise NotFoundException(f"Task with id {task_id} not found")
         
+        project_ids = {task.project_id}
         for key, value in kwargs.items():
             if hasattr(task, key) and value is not None:
                 setattr(task, key, value)
+        project_ids.add(task.project_id)
         
         self.session.commit()
-        self.session.refresh(task)
-        return task
+        self.cache.invalidate(task_id)
+        if len(project_ids) > 1:
+            self.project_cache.invalidate(*project_ids)
+        return self.get_by_id(task_id)
     
     def delete(self, task_id: int) -> bool:
-        task = self.get_by_id(task_id)
+        task = self._get_for_write(task_id)
         if not task:
             raise NotFoundException(f"Task with id {task_id} not found")
         
+        project_id = task.project_id
         self.session.delete(task)
         self.session.commit()
+        self.cache.invalidate(task_id)
+        self.project_cache.invalidate(project_id)
         return True
+    
+    def close_many(self, task_ids: Iterable[int]) -> List[int]:
+        # Tasks that were already closed keep their original closed_at
+        return self._update_many(
+            task_ids,
+            status=TaskStatus.DONE.value,
+            closed_at=func.coalesce(Task.closed_at, func.now())
+        )
+    
+    def update_status_many(self, task_ids: Iterable[int], status: str) -> List[int]:
+        return self._update_many(task_ids, status=status)
+    
+    def delete_many(self, task_ids: Iterable[int]) -> List[int]:
+        statement = (
+            delete(Task)
+            .where(Task.id.in_(list(task_ids)))
+            .returning(Task.id, Task.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = self.session.execute(statement).all()
+        self.session.commit()
+        deleted_ids = [task_id for task_id, _ in deleted]
+        self.cache.invalidate(*deleted_ids)
+        self.project_cache.invalidate(*{project_id for _, project_id in deleted})
+        return deleted_ids
+    
+    def _update_many(self, task_ids: Iterable[int], **values) -> List[int]:
+        statement = (
+            update(Task)
+            .where(Task.id.in_(list(task_ids)))
+            .values(**values)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = self.session.execute(statement).scalars().all()
+        self.session.commit()
+        self.cache.invalidate(*updated_ids)
+        return updated_ids
+    
+    def _get_for_write(self, task_id: int) -> Optional[Task]:
+        # Writes always start from the database row, never from a cached copy.
+        return self._query().filter(Task.id == task_id).first()
+    
+    def _overdue_condition(self):
+        return overdue_condition()
+    
+    def _version_query(self):
+        # Task responses embed the project name, so a renamed project is a new version too
+        return (
+            self.session.query(
+                Task.id.label('id'),
+                func.coalesce(Task.updated_at, Task.created_at).label('task_version'),
+                func.coalesce(Project.updated_at, Project.created_at).label('project_version')
+            )
+            .join(Task.project)
+        )
+    
+    def _aggregate_version(self, query) -> Tuple:
+        page = query.subquery()
+        row = self.session.query(
+            func.count(page.c.id),
+            func.sum(page.c.id),
+            func.max(page.c.task_version),
+            func.max(page.c.project_version)
+        ).one()
+        return tuple(row)
+    
+    def _row_query(self):
+        # Selecting columns skips building and tracking ORM instances, which
+        # costs several times more than the SELECT itself on large pages.
+        return (
+            self.session.query(
+                Task.id,
+                Task.title,
+                Task.description,
+                Task.status,
+                Task.deadline,
+                Task.created_at,
+                Task.updated_at,
+                Task.closed_at,
+                Task.project_id,
+                Project.name.label('project_name')
+            )
+            .join(Task.project)
+        )
+    
+    def _rows(self, query) -> List[Dict]:
+        keys = [column['name'] for column in query.column_descriptions]
+        return [dict(zip(keys, row)) for row in query]
+    
+    def _query(self):
+        # Task responses always show the project name, so load it in the same
+        # SELECT instead of lazy-loading Task.project once per row.
+        return self.session.query(Task).options(joinedload(Task.project))
+    
+    def _filter(self, query, task_filter: Optional[TaskFilter]):
+        if task_filter is None:
+            return query
+        if task_filter.statuses:
+            query = query.filter(Task.status.in_(task_filter.statuses))
+        if task_filter.project_ids:
+            query = query.filter(Task.project_id.in_(task_filter.project_ids))
+        if task_filter.deadline_after is not None:
+            query = query.filter(Task.deadline > task_filter.deadline_after)
+        if task_filter.deadline_before is not None:
+            query = query.filter(Task.deadline < task_filter.deadline_before)
+        if task_filter.created_after is not None:
+            query = query.filter(Task.created_at > task_filter.created_after)
+        if task_filter.created_before is not None:
+            query = query.filter(Task.created_at < task_filter.created_before)
+        return query
+    
+    def _paginate(self, query, limit: int = None, after_id: int = None, sort: str = 'id', after_value=None):
+        descending = sort.startswith('-')
+        key = sort.lstrip('-')
+        if key == 'id':
+            if after_id is not None:
+                query = query.filter(Task.id < after_id if descending else Task.id > after_id)
+            query = query.order_by(Task.id.desc() if descending else Task.id)
+        else:
+            column = getattr(Task, key)
+            if after_id is not None:
+                query = query.filter(self._after(column, self._cursor_value(after_value), after_id, descending))
+            # NULLs sort as the highest values in both directions, which is
+            # PostgreSQL's default, so descending pages scan the index backwards.
+            if descending:
+                query = query.order_by(column.desc().nulls_first(), Task.id.desc())
+            else:
+                query = query.order_by(column.asc().nulls_last(), Task.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    def _after(self, column, value, after_id: int, descending: bool):
+        """Keyset condition for the rows after (value, after_id), NULL being the highest value."""
+        if descending:
+            if value is None:
+                return or_(column.isnot(None), Task.id < after_id)
+            return or_(column < value, and_(column == value, Task.id < after_id))
+        if value is None:
+            return and_(column.is_(None), Task.id > after_id)
+        return or_(column > value, and_(column == value, Task.id > after_id), column.is_(None))
+    
+    def _cursor_value(self, value):
+        # Cursors carry datetimes as text
+        if value is None or isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValidationException("Invalid pagination cursor")
@@ -0,0 +1,15 @@
+from todo_list.config import Config
+
+from .deadline_scheduler import DeadlineScheduler
+from .leader import LeaderElection
+
+
+deadline_scheduler = DeadlineScheduler(
+    load_size=Config.DEADLINE_SCHEDULER_LOAD_SIZE,
+    refresh_interval=Config.DEADLINE_SCHEDULER_REFRESH_INTERVAL,
+    leader_retry_interval=Config.DEADLINE_SCHEDULER_LEADER_RETRY_INTERVAL,
+    grace_period=Config.DEADLINE_SCHEDULER_GRACE_PERIOD
+)
+
+
+__all__ = ['DeadlineScheduler', 'LeaderElection', 'deadline_scheduler']
@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from todo_list.db.session import db
+
+from .leader import LeaderElection
+
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive deadlines are compared as UTC, like the database's now() on SQLite
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class DeadlineScheduler:
+    """
+    Closes overdue tasks as their deadlines pass, from inside the API process.
+    
+    Deadlines of open tasks are kept in a min-heap, read load_size at a time
+    in deadline order. The scheduler sleeps until the earliest one, then
+    closes every overdue task with the same set-based UPDATE as
+    autoclose-overdue, so heap entries left stale by later edits close
+    nothing. Task writes in this process push their deadline onto the heap;
+    writes from other processes are picked up by reloading it every
+    refresh_interval seconds. Only the elected leader among the processes
+    sharing the database runs it.
+    """
+    
+    name = 'deadline-scheduler'
+    
+    def __init__(self, load_size: int, refresh_interval: float, leader_retry_interval: float,
+                 grace_period: float = 0.0):
+        self.load_size = load_size
+        self.refresh_interval = refresh_interval
+        self.leader_retry_interval = leader_retry_interval
+        self.grace_period = timedelta(seconds=grace_period)
+        self.closed_count = 0
+        self.last_run_at: Optional[datetime] = None
+        self._heap: List[Tuple[datetime, int]] = []
+        # Key of the last row read and whether rows may follow it
+        self._loaded_until: Optional[Tuple[datetime, int]] = None
+        self._exhausted = False
+        self._service_factory: Optional[Callable[[Session], Any]] = None
+        self._leader: Optional[LeaderElection] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    @property
+    def is_leader(self) -> bool:
+        return self._leader is not None and self._leader.held
+    
+    def start(self, service_factory: Callable[[Session], Any]) -> None:
+        """Run the scheduler on the current event loop; service_factory builds a TaskService on a session."""
+        if self._task is not None:
+            return
+        self._service_factory = service_factory
+        self._leader = LeaderElection(db.engine, self.name)
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+    
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        self._loop = None
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    
+    def notify(self, task_id: int, deadline: Optional[datetime]) -> None:
+        """Schedule the deadline of a task just written; safe to call from any thread."""
+        loop = self._loop
+        if loop is None or deadline is None:
+            return
+        with contextlib.suppress(RuntimeError):  # the loop closed while stopping
+            loop.call_soon_threadsafe(self._schedule, task_id, deadline)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'running': self._task is not None,
+            'leader': self.is_leader,
+            'scheduled': len(self._heap),
+            'next_deadline': self._heap[0][0].isoformat() if self._heap else None,
+            'closed': self.closed_count,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await asyncio.to_thread(self._leader.acquire):
+                    try:
+                        await self._lead()
+                    finally:
+                        self._reset()
+                        await asyncio.to_thread(self._leader.release)
+            except Exception:
+                logger.exception("Deadline scheduler failed, retrying in %ss", self.leader_retry_interval)
+            await asyncio.sleep(self.leader_retry_interval)
+    
+    async def _lead(self) -> None:
+        refresh_at = 0.0
+        while await asyncio.to_thread(self._leader.is_held):
+            if self._loop.time() >= refresh_at:
+                self._reset()
+                refresh_at = self._loop.time() + self.refresh_interval
+            if self._needs_load():
+                await self._load_more()
+            
+            now = datetime.now(timezone.utc)
+            if self._heap and self._heap[0][0] + self.grace_period <= now:
+                while self._heap and self._heap[0][0] + self.grace_period <= now:
+                    heapq.heappop(self._heap)
+                await self._close_overdue(now)
+                continue
+            
+            timeout = refresh_at - self._loop.time()
+            if self._heap:
+                timeout = min(timeout, (self._heap[0][0] + self.grace_period - now).total_seconds())
+            await self._sleep(timeout)
+    
+    def _schedule(self, task_id: int, deadline: datetime) -> None:
+        if not self.is_leader:
+            return
+        due_at = _as_utc(deadline)
+        # Deadlines past the rows read so far are read in order later
+        if self._exhausted or (self._loaded_until is not None and due_at <= _as_utc(self._loaded_until[0])):
+            heapq.heappush(self._heap, (due_at, task_id))
+            self._wakeup.set()
+    
+    def _needs_load(self) -> bool:
+        # Every heap entry is at or before _loaded_until, so the heap only
+        # holds the next deadline while it is not empty
+        return not self._exhausted and (self._loaded_until is None or not self._heap)
+    
+    async def _load_more(self) -> None:
+        after_deadline, after_id = self._loaded_until or (None, None)
+        rows = await asyncio.to_thread(
+            self._call_service, 'get_upcoming_deadlines', self.load_size, after_deadline, after_id
+        )
+        for deadline, task_id in rows:
+            heapq.heappush(self._heap, (_as_utc(deadline), task_id))
+        if rows:
+            self._loaded_until = rows[-1]
+        self._exhausted = len(rows) < self.load_size
+    
+    async def _close_overdue(self, now: datetime) -> None:
+        self.closed_count += await asyncio.to_thread(self._call_service, 'auto_close_overdue_tasks')
+        self.last_run_at = now
+    
+    def _reset(self) -> None:
+        self._heap = []
+        self._loaded_until = None
+        self._exhausted = False
+    
+    async def _sleep(self, timeout: float) -> None:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), max(timeout, 0))
+        self._wakeup.clear()
+    
+    def _call_service(self, method_name: str, *args) -> Any:
+        session = db.get_session()
+        try:
+            return getattr(self._service_factory(session), method_name)(*args)
+        finally:
+            session.close()
@@ -0,0 +1,113 @@
+import threading
+from typing import Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
+
+from todo_list.db.locks import advisory_key
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class LeaderElection:
+    """
+    Elects one process among those sharing a database, without waiting.
+    
+    PostgreSQL leaders hold a session-level advisory lock on a dedicated
+    connection opened outside the engine's pool, so leading does not take a
+    pool slot; the server releases it if the process dies. SQLite
+    leaders hold an exclusive flock on a file next to the database. With
+    in-memory databases and other dialects every process leads.
+    """
+    
+    def __init__(self, engine: Engine, name: str):
+        self.engine = engine
+        self.name = name
+        self.held = False
+        self._connection: Optional[Connection] = None
+        self._lock_engine: Optional[Engine] = None
+        self._lock_file = None
+        self._mutex = threading.Lock()
+    
+    def acquire(self) -> bool:
+        with self._mutex:
+            if not self.held:
+                self.held = self._acquire()
+            return self.held
+    
+    def is_held(self) -> bool:
+        """Whether this process still leads, checking the lock's connection is alive."""
+        with self._mutex:
+            if self.held and self._connection is not None:
+                try:
+                    self._connection.execute(text("SELECT 1"))
+                    self._connection.commit()
+                except SQLAlchemyError:
+                    self._release()
+            return self.held
+    
+    def release(self) -> None:
+        with self._mutex:
+            if self.held:
+                self._release()
+    
+    def _acquire(self) -> bool:
+        dialect = self.engine.dialect.name
+        database = self.engine.url.database
+        if dialect == 'postgresql':
+            return self._acquire_advisory_lock()
+        if dialect == 'sqlite' and fcntl is not None and database and database != ':memory:':
+            return self._acquire_file_lock(f"{database}.{self.name}.lock")
+        return True
+    
+    def _acquire_advisory_lock(self) -> bool:
+        if self._lock_engine is None:
+            # Without a pool, closing a connection closes it on the server too
+            self._lock_engine = create_engine(self.engine.url, poolclass=NullPool)
+        connection = self._lock_engine.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {'key': advisory_key(self.name)}
+            ).scalar()
+            # Session-level locks outlive the transaction; do not sit idle in one
+            connection.commit()
+        except SQLAlchemyError:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return False
+        self._connection = connection
+        return True
+    
+    def _acquire_file_lock(self, path: str) -> bool:
+        lock_file = open(path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+    
+    def _release(self) -> None:
+        self.held = False
+        connection, self._connection = self._connection, None
+        lock_file, self._lock_file = self._lock_file, None
+        if connection is not None:
+            try:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': advisory_key(self.name)})
+                connection.commit()
+            except SQLAlchemyError:
+                # A dead connection lost the lock with it
+                connection.invalidate()
+            finally:
+                connection.close()
+        if lock_file is not None:
+            # Closing the file drops the flock
+            lock_file.close()
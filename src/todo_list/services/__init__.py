@@ -1,5 +1,6 @@
 from .project_service import ProjectService
 from .task_service import TaskService
+from .async_services import AsyncProjectService, AsyncTaskService
 
 
-__all__ = ['ProjectService', 'TaskService']
+__all__ = ['ProjectService', 'TaskService', 'AsyncProjectService', 'AsyncTaskService']
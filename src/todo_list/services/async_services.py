@@ -0,0 +1,24 @@
+from sqlalchemy.orm import Session
+
+from todo_list.db.async_adapter import AsyncAdapter
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.scheduler import deadline_scheduler
+from .project_service import ProjectService
+from .task_service import TaskService
+
+
+class AsyncProjectService(AsyncAdapter):
+    """ProjectService running on an AsyncSession"""
+    target_class = ProjectService
+    
+    def build(self, sync_session: Session) -> ProjectService:
+        return ProjectService(ProjectRepository(sync_session))
+
+
+class AsyncTaskService(AsyncAdapter):
+    """TaskService running on an AsyncSession"""
+    target_class = TaskService
+    
+    def build(self, sync_session: Session) -> TaskService:
+        return TaskService(TaskRepository(sync_session), deadline_scheduler.notify)
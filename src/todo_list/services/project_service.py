@@ -1,5 +1,6 @@
 import os
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 from todo_list.repositories.project_repository import ProjectRepository
 from todo_list.exceptions import ValidationException, BusinessRuleException
@@ -22,20 +23,52 @@ class ProjectService:
         if description and len(description) > self.max_project_description_length:
             raise ValidationException(f"Project description cannot exceed {self.max_project_description_length} characters")
         
-        all_projects = self.project_repository.get_all()
-        if len(all_projects) >= self.max_projects:
-            raise BusinessRuleException(f"Cannot create more than {self.max_projects} projects")
-        
-        return self.project_repository.create(name, description)
+        # Count and insert under one lock so parallel creates cannot overshoot the limit
+        try:
+            self.project_repository.lock_for_insert()
+            if self.project_repository.count() >= self.max_projects:
+                raise BusinessRuleException(f"Cannot create more than {self.max_projects} projects")
+            
+            return self.project_repository.create(name, description)
+        except Exception:
+            self.project_repository.rollback()
+            raise
     
     def get_project(self, project_id: int):
         return self.project_repository.get_by_id(project_id)
     
+    def get_project_with_task_count(self, project_id: int):
+        return self.project_repository.get_with_task_count(project_id)
+    
     def get_project_by_name(self, name: str):
         return self.project_repository.get_by_name(name)
     
-    def get_all_projects(self) -> List:
-        return self.project_repository.get_all()
+    def get_all_projects(self, limit: int = None, after_id: int = None) -> List:
+        return self.project_repository.get_all(limit, after_id)
+    
+    def get_all_projects_with_task_counts(self, limit: int = None, after_id: int = None) -> List:
+        return self.project_repository.get_all_with_task_counts(limit, after_id)
+    
+    def get_project_rows_with_task_counts(self, limit: int = None, after_id: int = None) -> List[Dict]:
+        return self.project_repository.get_rows_with_task_counts(limit, after_id)
+    
+    def get_project_stats(self, limit: int = None, after_id: int = None) -> List[Dict]:
+        """Per-project task statistics, with the age of the oldest open task in seconds."""
+        now = datetime.now(timezone.utc)
+        rows = self.project_repository.get_status_stats(limit, after_id)
+        for row in rows:
+            oldest = row['oldest_open_created_at']
+            if oldest is not None and oldest.tzinfo is None:
+                # Naive timestamps come from the database clock, which is UTC
+                oldest = oldest.replace(tzinfo=timezone.utc)
+            row['oldest_open_age_seconds'] = (now - oldest).total_seconds() if oldest is not None else None
+        return rows
+    
+    def get_projects_version(self, limit: int = None, after_id: int = None) -> Tuple:
+        return self.project_repository.get_page_version(limit, after_id)
+    
+    def rebuild_task_counters(self, dry_run: bool = False) -> List[int]:
+        return self.project_repository.rebuild_counters(dry_run)
     
     def update_project(self, project_id: int, name: str = None, description: str = None):
         if name and len(name.strip()) == 0:
@@ -50,8 +83,7 @@ class ProjectService:
         return self.project_repository.update(project_id, name, description)
     
     def delete_project(self, project_id: int):
-        project = self.project_repository.get_by_id(project_id)
-        if project and project.tasks:
+        if self.project_repository.has_tasks(project_id):
             raise BusinessRuleException("Cannot delete project with existing tasks")
         
         return self.project_repository.delete(project_id)
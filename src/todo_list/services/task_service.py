@@ -1,50 +1,143 @@
 import os
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from todo_list.repositories.task_repository import TaskRepository
+from todo_list.repositories.task_filter import TaskFilter, TASK_SORT_KEYS
+from todo_list.models.task import TaskStatus
 from todo_list.exceptions import ValidationException
 
 
+# Called with the id and new deadline of every task written with a deadline
+DeadlineHook = Callable[[int, datetime], None]
+
+
 class TaskService:
-    def __init__(self, task_repository: TaskRepository):
+    def __init__(self, task_repository: TaskRepository, on_deadline_change: Optional[DeadlineHook] = None):
         self.task_repository = task_repository
+        self.on_deadline_change = on_deadline_change
         self.max_tasks_per_project = int(os.getenv('MAX_NUMBER_OF_TASKS_PER_PROJECT', 100))
         self.max_task_title_length = int(os.getenv('MAX_TASK_TITLE_LENGTH', 200))
         self.max_task_description_length = int(os.getenv('MAX_TASK_DESCRIPTION_LENGTH', 2000))
+        self.autoclose_batch_size = int(os.getenv('AUTOCLOSE_BATCH_SIZE', 1000))
+        self.bulk_insert_chunk_size = int(os.getenv('BULK_INSERT_CHUNK_SIZE', 500))
+        self.max_search_query_length = int(os.getenv('MAX_SEARCH_QUERY_LENGTH', 200))
     
     def create_task(self, title: str, project_id: int, description: str = None, 
                    deadline: datetime = None):
-        if not title or len(title.strip()) == 0:
-            raise ValidationException("Task title cannot be empty")
+        self._validate_new_task(title, description, deadline)
         
-        if len(title) > self.max_task_title_length:
-            raise ValidationException(f"Task title cannot exceed {self.max_task_title_length} characters")
+        # Count and insert under one lock so parallel creates cannot overshoot the limit
+        try:
+            self.task_repository.lock_project_tasks(project_id)
+            if self.task_repository.count_by_project(project_id) >= self.max_tasks_per_project:
+                raise ValidationException(f"Cannot create more than {self.max_tasks_per_project} tasks per project")
+            
+            task = self.task_repository.create(title, project_id, description, deadline)
+        except Exception:
+            self.task_repository.rollback()
+            raise
         
-        if description and len(description) > self.max_task_description_length:
-            raise ValidationException(f"Task description cannot exceed {self.max_task_description_length} characters")
-        
-        if deadline and deadline < datetime.now():
-            raise ValidationException("Deadline cannot be in the past")
+        self._deadline_changed(task.id, deadline)
+        return task
+    
+    def create_tasks_bulk(self, items: List[Dict]) -> Tuple[List, List[Dict]]:
+        """
+        Create many tasks in one transaction. Items that fail validation, name a
+        missing project or exceed their project's task limit are returned as
+        errors by index instead of aborting the batch.
+        """
+        errors = []
+        valid_items = []
+        for index, item in enumerate(items):
+            try:
+                self._validate_new_task(item.get('title'), item.get('description'), item.get('deadline'))
+            except ValidationException as e:
+                errors.append({'index': index, 'project_id': item.get('project_id'), 'message': str(e)})
+                continue
+            valid_items.append((index, item))
         
-        project_tasks = self.task_repository.get_by_project(project_id)
-        if len(project_tasks) >= self.max_tasks_per_project:
-            raise ValidationException(f"Cannot create more than {self.max_tasks_per_project} tasks per project")
+        project_ids = sorted({item['project_id'] for _, item in valid_items})
+        try:
+            # Same per-project locks as create_task, taken in id order to avoid deadlocks
+            for project_id in project_ids:
+                self.task_repository.lock_project_tasks(project_id)
+            existing_project_ids = self.task_repository.get_existing_project_ids(project_ids)
+            task_counts = self.task_repository.count_by_projects(project_ids)
+            
+            rows = []
+            for index, item in valid_items:
+                project_id = item['project_id']
+                if project_id not in existing_project_ids:
+                    message = f"Project with id {project_id} not found"
+                elif task_counts.get(project_id, 0) >= self.max_tasks_per_project:
+                    message = f"Cannot create more than {self.max_tasks_per_project} tasks per project"
+                else:
+                    task_counts[project_id] = task_counts.get(project_id, 0) + 1
+                    rows.append(item)
+                    continue
+                errors.append({'index': index, 'project_id': project_id, 'message': message})
+            
+            tasks = self.task_repository.create_many(rows, self.bulk_insert_chunk_size)
+        except Exception:
+            self.task_repository.rollback()
+            raise
         
-        return self.task_repository.create(title, project_id, description, deadline)
+        for task in tasks:
+            self._deadline_changed(task.id, task.deadline)
+        errors.sort(key=lambda error: error['index'])
+        return tasks, errors
     
     def get_task(self, task_id: int):
         return self.task_repository.get_by_id(task_id)
     
-    def get_tasks_by_project(self, project_id: int) -> List:
-        return self.task_repository.get_by_project(project_id)
+    def get_tasks_by_project(self, project_id: int, limit: int = None, after_id: int = None) -> List:
+        return self.task_repository.get_by_project(project_id, limit, after_id)
     
-    def get_all_tasks(self) -> List:
-        return self.task_repository.get_all()
+    def get_all_tasks(self, limit: int = None, after_id: int = None) -> List:
+        return self.task_repository.get_all(limit, after_id)
     
     def get_overdue_tasks(self) -> List:
         return self.task_repository.get_overdue_tasks()
     
+    def get_task_rows(self, limit: int = None, after_id: int = None, task_filter: TaskFilter = None,
+                      sort: str = 'id', after_value=None) -> List[Dict]:
+        self._validate_listing(task_filter, sort)
+        return self.task_repository.get_all_rows(limit, after_id, task_filter, sort, after_value)
+    
+    def get_task_rows_by_project(self, project_id: int, limit: int = None, after_id: int = None) -> List[Dict]:
+        return self.task_repository.get_rows_by_project(project_id, limit, after_id)
+    
+    def get_overdue_task_rows(self) -> List[Dict]:
+        return self.task_repository.get_overdue_rows()
+    
+    def search_task_rows(self, query_text: str, limit: int = None, after_id: int = None,
+                         after_rank: float = None) -> List[Dict]:
+        query_text = (query_text or '').strip()
+        if not query_text:
+            raise ValidationException("Search query cannot be empty")
+        if len(query_text) > self.max_search_query_length:
+            raise ValidationException(f"Search query cannot exceed {self.max_search_query_length} characters")
+        if after_id is not None and (isinstance(after_rank, bool) or not isinstance(after_rank, (int, float))):
+            raise ValidationException("Invalid pagination cursor")
+        
+        return self.task_repository.search_rows(query_text, limit, after_id, after_rank)
+    
+    def get_tasks_version(self, limit: int = None, after_id: int = None, project_id: int = None,
+                          task_filter: TaskFilter = None, sort: str = 'id', after_value=None) -> Tuple:
+        self._validate_listing(task_filter, sort)
+        return self.task_repository.get_page_version(limit, after_id, project_id, task_filter, sort, after_value)
+    
+    def get_overdue_tasks_version(self) -> Tuple:
+        return self.task_repository.get_overdue_version()
+    
+    def get_upcoming_deadlines(self, limit: int, after_deadline: datetime = None,
+                               after_id: int = None) -> List[Tuple[datetime, int]]:
+        return self.task_repository.get_upcoming_deadlines(limit, after_deadline, after_id)
+    
+    def count_overdue_tasks(self) -> int:
+        return self.task_repository.count_overdue_tasks()
+    
     def update_task(self, task_id: int, **kwargs):
         if 'title' in kwargs:
             if not kwargs['title'] or len(kwargs['title'].strip()) == 0:
@@ -58,7 +151,12 @@ class TaskService:
         if 'deadline' in kwargs and kwargs['deadline'] and kwargs['deadline'] < datetime.now():
             raise ValidationException("Deadline cannot be in the past")
         
-        return self.task_repository.update(task_id, **kwargs)
+        task = self.task_repository.update(task_id, **kwargs)
+        self._deadline_changed(task_id, kwargs.get('deadline'))
+        return task
+    
+    def update_task_status(self, task_id: int, status: TaskStatus):
+        return self.task_repository.update(task_id, status=TaskStatus(status).value)
     
     def delete_task(self, task_id: int):
         return self.task_repository.delete(task_id)
@@ -66,12 +164,66 @@ class TaskService:
     def close_task(self, task_id: int):
         return self.task_repository.close_task(task_id)
     
-    def auto_close_overdue_tasks(self) -> int:
-        overdue_tasks = self.get_overdue_tasks()
-        closed_count = 0
+    def close_tasks(self, task_ids: List[int]) -> Tuple[List[int], List[int]]:
+        return self._split_missing(task_ids, self.task_repository.close_many(task_ids))
+    
+    def update_tasks_status(self, task_ids: List[int], status: TaskStatus) -> Tuple[List[int], List[int]]:
+        affected_ids = self.task_repository.update_status_many(task_ids, TaskStatus(status).value)
+        return self._split_missing(task_ids, affected_ids)
+    
+    def delete_tasks(self, task_ids: List[int]) -> Tuple[List[int], List[int]]:
+        return self._split_missing(task_ids, self.task_repository.delete_many(task_ids))
+    
+    def _deadline_changed(self, task_id: int, deadline: Optional[datetime]) -> None:
+        if self.on_deadline_change is not None and deadline is not None:
+            self.on_deadline_change(task_id, deadline)
+    
+    def _split_missing(self, requested_ids: List[int], affected_ids: List[int]) -> Tuple[List[int], List[int]]:
+        """Split the requested ids, in request order, into affected and missing ones."""
+        affected = set(affected_ids)
+        requested = list(dict.fromkeys(requested_ids))
+        return (
+            [task_id for task_id in requested if task_id in affected],
+            [task_id for task_id in requested if task_id not in affected]
+        )
+    
+    def _validate_listing(self, task_filter: Optional[TaskFilter], sort: str) -> None:
+        if sort.lstrip('-') not in TASK_SORT_KEYS:
+            raise ValidationException(f"Tasks can only be sorted by {', '.join(TASK_SORT_KEYS)}")
+        if task_filter is None:
+            return
         
-        for task in overdue_tasks:
-            self.close_task(task.id)
-            closed_count += 1
+        for status in task_filter.statuses:
+            if status not in [s.value for s in TaskStatus]:
+                raise ValidationException(f"Invalid task status '{status}'")
+        if task_filter.deadline_after and task_filter.deadline_before and task_filter.deadline_after >= task_filter.deadline_before:
+            raise ValidationException("deadline_after must be earlier than deadline_before")
+        if task_filter.created_after and task_filter.created_before and task_filter.created_after >= task_filter.created_before:
+            raise ValidationException("created_after must be earlier than created_before")
+    
+    def _validate_new_task(self, title: str, description: str = None, deadline: datetime = None):
+        if not title or len(title.strip()) == 0:
+            raise ValidationException("Task title cannot be empty")
         
-        return closed_count
+        if len(title) > self.max_task_title_length:
+            raise ValidationException(f"Task title cannot exceed {self.max_task_title_length} characters")
+        
+        if description and len(description) > self.max_task_description_length:
+            raise ValidationException(f"Task description cannot exceed {self.max_task_description_length} characters")
+        
+        if deadline and deadline < datetime.now():
+            raise ValidationException("Deadline cannot be in the past")
+    
+    def auto_close_overdue_tasks(self, batch_size: int = None) -> int:
+        batch_size = batch_size or self.autoclose_batch_size
+        if batch_size < 1:
+            raise ValidationException("Batch size must be at least 1")
+        
+        closed_count = 0
+        while True:
+            closed_ids = self.task_repository.close_overdue_batch(batch_size)
+            # A short batch does not mean none are left: SKIP LOCKED also passes
+            # over overdue rows that other transactions hold locked
+            if not closed_ids:
+                return closed_count
+            closed_count += len(closed_ids)
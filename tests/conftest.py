@@ -0,0 +1,98 @@
+import os
+
+# The app builds its engines at import; keep them off a real server
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import todo_list.models  # noqa: F401 - registers every table
+from todo_list.api.dependencies.database import get_db
+from todo_list.api.main import app
+from todo_list.cache import project_cache, task_cache
+from todo_list.db.base import Base
+
+
+class StatementCounter:
+    """Counts the statements an engine runs while active."""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+    
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+        return self
+    
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+    
+    def _count(self, *args):
+        self.count += 1
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    task_cache.clear()
+    project_cache.clear()
+    yield
+    task_cache.clear()
+    project_cache.clear()
+
+
+def create_memory_engine():
+    # One shared connection, so every session and thread sees the same in-memory database
+    engine = create_engine(
+        'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def engine():
+    engine = create_memory_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "todo.db"}', connect_args={'timeout': 30})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(engine):
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    def override_get_db():
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
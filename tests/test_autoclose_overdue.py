@@ -0,0 +1,60 @@
+import re
+from datetime import datetime, timedelta
+
+from click.testing import CliRunner
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from todo_list.commands.autoclose_overdue import autoclose_overdue_cmd
+from todo_list.db.session import db
+from todo_list.models.project import Project
+from todo_list.models.task import Task
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.services.task_service import TaskService
+
+
+OVERDUE = 200
+WORKERS = 4
+
+
+class SkippingRepository:
+    """Returns the given batches, as SKIP LOCKED does when other transactions hold some rows."""
+    
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.calls = 0
+    
+    def close_overdue_batch(self, batch_size):
+        self.calls += 1
+        return self.batches.pop(0) if self.batches else []
+
+
+def test_a_short_batch_does_not_end_the_run():
+    repository = SkippingRepository([1, 2], [3, 4, 5], [6])
+    
+    assert TaskService(repository).auto_close_overdue_tasks(batch_size=5) == 6
+    # Only an empty batch ends it
+    assert repository.calls == 4
+
+
+def test_workers_close_every_overdue_task_once(file_engine, monkeypatch):
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+    monkeypatch.setattr(db, 'get_session', factory)
+    with factory() as session:
+        project_id = session.execute(insert(Project).returning(Project.id), {'name': 'Overdue'}).scalar()
+        session.execute(insert(Task.__table__), [
+            {'title': f'Task {number}', 'project_id': project_id, 'status': 'todo',
+             'deadline': datetime.now() - timedelta(days=1)}
+            for number in range(OVERDUE)
+        ])
+        session.commit()
+    
+    result = CliRunner().invoke(autoclose_overdue_cmd, ['--workers', str(WORKERS), '--batch-size', '7'])
+    
+    assert result.exit_code == 0, result.output
+    worker_totals = [int(count) for count in re.findall(r'Worker \d+: (\d+) task', result.output)]
+    assert len(worker_totals) == WORKERS
+    assert sum(worker_totals) == OVERDUE
+    assert f'Auto-closed {OVERDUE} overdue task(s)' in result.output
+    with factory() as session:
+        assert TaskRepository(session).count_overdue_tasks() == 0
@@ -0,0 +1,55 @@
+import pytest
+
+
+@pytest.fixture
+def project_id(client):
+    # Enough projects for the list to pass the compression threshold
+    ids = [
+        client.post('/api/v1/projects/', json={'name': f'Project {number}', 'description': 'x' * 150}).json()['data']['id']
+        for number in range(10)
+    ]
+    return ids[0]
+
+
+@pytest.mark.parametrize('accept_encoding', ['gzip', 'identity'])
+@pytest.mark.parametrize('path', ['/api/v1/projects/', '/api/v1/projects/{project_id}'], ids=['compressed', 'small'])
+def test_not_modified_repeats_the_validators_of_the_full_response(client, project_id, path, accept_encoding):
+    path = path.format(project_id=project_id)
+    
+    full = client.get(path, headers={'Accept-Encoding': accept_encoding})
+    not_modified = client.get(path, headers={
+        'Accept-Encoding': accept_encoding, 'If-None-Match': full.headers['etag']
+    })
+    
+    assert full.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.headers['etag'] == full.headers['etag']
+    assert not_modified.headers['vary'] == full.headers['vary'] == 'Accept-Encoding'
+    assert full.headers['etag'].startswith('W/') == (accept_encoding == 'gzip')
+
+
+@pytest.mark.parametrize('path', ['/api/v1/tasks/{task_id}', '/api/v1/tasks/'], ids=['task', 'list'])
+def test_a_write_in_the_same_second_changes_the_etag(client, project_id, path):
+    task_id = client.post('/api/v1/tasks/', params={'project_id': project_id}, json={'title': 'Task'}).json()['data']['id']
+    path = path.format(task_id=task_id)
+    etag = client.get(path).headers['etag']
+    
+    assert client.patch(f'/api/v1/tasks/{task_id}/status', json={'status': 'doing'}).status_code == 200
+    response = client.get(path, headers={'If-None-Match': etag})
+    
+    assert response.status_code == 200
+    assert response.headers['etag'] != etag
+
+
+def test_the_project_list_etag_follows_task_counts(client, project_id):
+    def etag():
+        return client.get('/api/v1/projects/').headers['etag']
+    
+    before = etag()
+    task_id = client.post('/api/v1/tasks/', params={'project_id': project_id}, json={'title': 'Task'}).json()['data']['id']
+    created = etag()
+    assert client.delete(f'/api/v1/tasks/{task_id}').status_code == 200
+    
+    assert created != before
+    # The same page again, so the same representation
+    assert etag() == before
@@ -0,0 +1,167 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.scheduler import DeadlineScheduler, LeaderElection
+from todo_list.services.project_service import ProjectService
+from todo_list.services.task_service import TaskService
+
+
+NOW = datetime.now(timezone.utc)
+
+
+class FakeService:
+    """Upcoming deadlines of open tasks, served in pages like TaskService."""
+    
+    def __init__(self, deadlines):
+        self.rows = sorted((deadline, task_id) for task_id, deadline in deadlines.items())
+        self.loads = []
+    
+    def get_upcoming_deadlines(self, limit, after_deadline=None, after_id=None):
+        self.loads.append((after_deadline, after_id))
+        rows = [row for row in self.rows if after_deadline is None or row > (after_deadline, after_id)]
+        return rows[:limit]
+    
+    def auto_close_overdue_tasks(self):
+        return 0
+
+
+class FakeLeader:
+    def __init__(self, held=True):
+        self.held = held
+        self.released = asyncio.Event()
+    
+    def acquire(self):
+        return self.held
+    
+    def is_held(self):
+        return self.held
+    
+    def release(self):
+        self.held = False
+        self.released.set()
+
+
+def scheduler_for(service, leader=None, load_size=2, refresh_interval=60.0):
+    scheduler = DeadlineScheduler(load_size=load_size, refresh_interval=refresh_interval, leader_retry_interval=60.0)
+    scheduler._leader = leader or FakeLeader()
+    scheduler._wakeup = asyncio.Event()
+    scheduler._call_service = lambda method_name, *args: getattr(service, method_name)(*args)
+    return scheduler
+
+
+def deadlines(count):
+    return {task_id: NOW + timedelta(hours=task_id) for task_id in range(1, count + 1)}
+
+
+def test_deadlines_are_loaded_a_page_at_a_time():
+    service = FakeService(deadlines(5))
+    scheduler = scheduler_for(service)
+    
+    async def scenario():
+        assert scheduler._needs_load()
+        await scheduler._load_more()
+        # The heap holds the next deadline, so nothing more is read yet
+        assert [task_id for _, task_id in scheduler._heap] == [1, 2]
+        assert scheduler._loaded_until == (NOW + timedelta(hours=2), 2)
+        assert not scheduler._needs_load()
+        
+        scheduler._heap.clear()
+        assert scheduler._needs_load()
+        await scheduler._load_more()
+        await scheduler._load_more()
+        # A short page means every deadline has been read
+        assert sorted(task_id for _, task_id in scheduler._heap) == [3, 4, 5]
+        assert scheduler._exhausted
+        assert not scheduler._needs_load()
+    
+    asyncio.run(scenario())
+    assert service.loads == [(None, None), (NOW + timedelta(hours=2), 2), (NOW + timedelta(hours=4), 4)]
+
+
+def test_scheduled_deadlines_past_the_loaded_ones_are_left_to_a_later_load():
+    scheduler = scheduler_for(FakeService(deadlines(5)))
+    
+    async def scenario():
+        await scheduler._load_more()
+        scheduler._schedule(10, NOW + timedelta(minutes=90))
+        scheduler._schedule(11, NOW + timedelta(hours=2))
+        scheduler._schedule(12, NOW + timedelta(hours=3))
+        assert sorted(task_id for _, task_id in scheduler._heap) == [1, 2, 10, 11]
+        
+        scheduler._exhausted = True
+        scheduler._schedule(12, NOW + timedelta(hours=3))
+        assert 12 in [task_id for _, task_id in scheduler._heap]
+    
+    asyncio.run(scenario())
+
+
+def test_nothing_is_scheduled_before_the_first_load_or_by_a_follower():
+    scheduler = scheduler_for(FakeService(deadlines(5)))
+    
+    scheduler._schedule(10, NOW)
+    assert scheduler._heap == []
+    
+    scheduler._leader.held = False
+    scheduler._exhausted = True
+    scheduler._schedule(10, NOW)
+    assert scheduler._heap == []
+
+
+def test_losing_leadership_drops_the_loaded_deadlines():
+    async def scenario():
+        leader = FakeLeader()
+        scheduler = scheduler_for(FakeService(deadlines(5)), leader, refresh_interval=0.01)
+        heaps = []
+        
+        def is_held():
+            heaps.append(len(scheduler._heap))
+            return len(heaps) < 3
+        
+        leader.is_held = is_held
+        scheduler._loop = asyncio.get_running_loop()
+        task = asyncio.create_task(scheduler._run())
+        await asyncio.wait_for(leader.released.wait(), 5)
+        task.cancel()
+        
+        assert heaps[-1] == 2
+        assert scheduler._heap == []
+        assert scheduler._loaded_until is None
+        assert not scheduler._exhausted
+    
+    asyncio.run(scenario())
+
+
+def test_only_one_election_on_a_database_file_leads(file_engine):
+    first = LeaderElection(file_engine, 'test-leader')
+    second = LeaderElection(file_engine, 'test-leader')
+    try:
+        assert first.acquire()
+        assert not second.acquire()
+        assert first.is_held()
+        
+        first.release()
+        assert second.acquire()
+        assert not first.acquire()
+    finally:
+        first.release()
+        second.release()
+
+
+def test_task_writes_with_deadlines_call_the_hook(session):
+    scheduled = []
+    service = TaskService(TaskRepository(session), lambda task_id, deadline: scheduled.append(task_id))
+    project_id = ProjectService(ProjectRepository(session)).create_project('Project').id
+    deadline = datetime.now() + timedelta(days=1)
+    
+    single = service.create_task('Single', project_id, deadline=deadline)
+    service.create_task('No deadline', project_id)
+    created, _ = service.create_tasks_bulk([
+        {'project_id': project_id, 'title': 'Bulk', 'deadline': deadline},
+        {'project_id': project_id, 'title': 'Bulk without deadline'},
+    ])
+    service.update_task(single.id, title='Renamed')
+    service.update_task(created[1].id, deadline=deadline)
+    
+    assert scheduled == [single.id, created[0].id, created[1].id]
@@ -0,0 +1,14 @@
+from todo_list.cache import EntityCache, LRUTTLCacheBackend
+
+
+def test_set_is_dropped_after_an_invalidation_since_the_read(session):
+    cache = EntityCache('test', LRUTTLCacheBackend())
+    
+    generation = cache.generation()
+    # A write commits and invalidates while the reader still holds the old row
+    cache.invalidate(1)
+    cache.set(1, 'stale', generation)
+    assert cache.get(session, 1) is None
+    
+    cache.set(1, 'fresh', cache.generation())
+    assert cache.get(session, 1) == 'fresh'
@@ -0,0 +1,79 @@
+import threading
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from todo_list.exceptions import BusinessRuleException, ValidationException
+from todo_list.models.project import Project
+from todo_list.models.task import Task
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.services.project_service import ProjectService
+from todo_list.services.task_service import TaskService
+
+
+LIMIT = 5
+THREADS = 20
+
+
+def run_in_parallel(factory, create):
+    """Call create(session, number) from THREADS threads at once; returns (results, errors)."""
+    barrier = threading.Barrier(THREADS)
+    results, errors = [], []
+    lock = threading.Lock()
+    
+    def worker(number):
+        session = factory()
+        try:
+            barrier.wait()
+            result = create(session, number)
+            with lock:
+                results.append(result)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+        finally:
+            session.close()
+    
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_parallel_task_creates_respect_the_per_project_limit(file_engine, monkeypatch):
+    monkeypatch.setenv('MAX_NUMBER_OF_TASKS_PER_PROJECT', str(LIMIT))
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+    with factory() as session:
+        project_id = session.execute(insert(Project).returning(Project.id), {'name': 'Limited'}).scalar()
+        session.commit()
+    
+    results, errors = run_in_parallel(
+        factory,
+        lambda session, number: TaskService(TaskRepository(session)).create_task(f'Task {number}', project_id)
+    )
+    
+    assert len(results) == LIMIT
+    assert len(errors) == THREADS - LIMIT
+    # The task limit has always been reported as a validation error
+    assert all(isinstance(error, ValidationException) for error in errors), errors
+    with factory() as session:
+        assert session.scalar(select(func.count(Task.id)).where(Task.project_id == project_id)) == LIMIT
+
+
+def test_parallel_project_creates_respect_the_project_limit(file_engine, monkeypatch):
+    monkeypatch.setenv('MAX_NUMBER_OF_PROJECTS', str(LIMIT))
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+    
+    results, errors = run_in_parallel(
+        factory,
+        lambda session, number: ProjectService(ProjectRepository(session)).create_project(f'Project {number}')
+    )
+    
+    assert len(results) == LIMIT
+    assert len(errors) == THREADS - LIMIT
+    assert all(isinstance(error, BusinessRuleException) for error in errors), errors
+    with factory() as session:
+        assert session.scalar(select(func.count(Project.id))) == LIMIT
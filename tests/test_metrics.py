@@ -0,0 +1,38 @@
+import os
+
+from todo_list.api.metrics import MultiprocessMetrics
+
+
+def process_families(requests: int, in_use: int, longest_wait: float):
+    return [
+        ('requests_total', 'counter', 'Requests served', [('requests_total', (('route', '/'),), requests)]),
+        ('checked_out', 'gauge', 'Connections in use', [('checked_out', (), in_use)]),
+        ('wait_seconds_max', 'gauge', 'Longest wait', [('wait_seconds_max', (), longest_wait)]),
+    ]
+
+
+def merged_samples(metrics: MultiprocessMetrics):
+    return {(name, labels): value for _, _, _, samples in metrics.merge() for name, labels, value in samples}
+
+
+def test_workers_are_merged_and_dead_ones_keep_only_their_counters(tmp_path):
+    metrics = MultiprocessMetrics(str(tmp_path), interval=5)
+    # Two other workers, then this process
+    for pid, families in ((1, process_families(3, 2, 0.5)), (2, process_families(4, 1, 0.25))):
+        metrics.write(families)
+        os.replace(tmp_path / f'{os.getpid()}.json', tmp_path / f'{pid}.json')
+    metrics.write(process_families(5, 0, 0.0))
+    
+    assert merged_samples(metrics) == {
+        ('requests_total', (('route', '/'),)): 12,
+        ('checked_out', ()): 3,
+        ('wait_seconds_max', ()): 0.5,
+    }
+    
+    metrics.mark_process_dead(1)
+    
+    assert merged_samples(metrics) == {
+        ('requests_total', (('route', '/'),)): 12,
+        ('checked_out', ()): 1,
+        ('wait_seconds_max', ()): 0.25,
+    }
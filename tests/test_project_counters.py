@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, insert, update
+
+from todo_list.models import ProjectCounter, Task, TaskStatus
+from todo_list.repositories.project_repository import ProjectRepository
+from todo_list.repositories.task_repository import TaskRepository
+from todo_list.services.project_service import ProjectService
+from todo_list.services.task_service import TaskService
+
+
+STATUSES = [task_status.value for task_status in TaskStatus]
+
+
+def recount(session):
+    """Task counts by project and status, counted from the tasks themselves."""
+    counts = {}
+    rows = session.query(Task.project_id, Task.status, func.count(Task.id)).group_by(Task.project_id, Task.status)
+    for project_id, task_status, count in rows:
+        counts.setdefault(project_id, dict.fromkeys(STATUSES, 0))[task_status] = count
+    return counts
+
+
+def counters(session):
+    """Non-empty counters rows; a project without tasks may keep a row of zeros."""
+    session.expire_all()
+    counts = {
+        counter.project_id: {value: getattr(counter, f'{value}_count') for value in STATUSES}
+        for counter in session.query(ProjectCounter)
+    }
+    return {project_id: row for project_id, row in counts.items() if any(row.values())}
+
+
+@pytest.fixture
+def services(session):
+    return ProjectService(ProjectRepository(session)), TaskService(TaskRepository(session))
+
+
+def test_triggers_keep_counters_equal_to_a_recount(session, services):
+    project_service, task_service = services
+    project_ids = [project_service.create_project(f'Project {number}').id for number in range(3)]
+    deadline = datetime.now() + timedelta(days=1)
+    
+    def check():
+        assert counters(session) == recount(session)
+    
+    single = task_service.create_task('Single', project_ids[0], deadline=deadline)
+    check()
+    
+    created, errors = task_service.create_tasks_bulk([
+        {'project_id': project_ids[number % 3], 'title': f'Bulk {number}'} for number in range(12)
+    ])
+    assert not errors
+    ids = [task.id for task in created]
+    check()
+    
+    task_service.close_tasks(ids[:3])
+    check()
+    task_service.update_tasks_status(ids[3:6], TaskStatus.DOING)
+    check()
+    task_service.delete_tasks(ids[6:8])
+    check()
+    
+    task_service.update_task_status(single.id, TaskStatus.DOING)
+    check()
+    # Moves the task between projects and changes its status at once
+    task_service.update_task(ids[8], project_id=project_ids[1], status=TaskStatus.DONE.value)
+    check()
+    task_service.delete_task(ids[9])
+    check()
+    
+    # Written directly, as the API refuses deadlines in the past
+    session.execute(insert(Task.__table__), [
+        {'title': f'Overdue {number}', 'project_id': project_ids[number % 2], 'status': 'todo',
+         'deadline': datetime.now() - timedelta(days=1)}
+        for number in range(5)
+    ])
+    session.commit()
+    check()
+    assert task_service.auto_close_overdue_tasks(batch_size=2) == 5
+    check()
+    
+    # The service refuses projects with tasks; the repository cascades to them
+    project_service.project_repository.delete(project_ids[2])
+    check()
+    assert project_ids[2] not in counters(session)
+
+
+def test_rebuild_counters_repairs_drifted_counts(session, services):
+    project_service, task_service = services
+    project_ids = [project_service.create_project(f'Project {number}').id for number in range(3)]
+    task_service.create_tasks_bulk([
+        {'project_id': project_ids[number % 3], 'title': f'Task {number}'} for number in range(9)
+    ])
+    expected = recount(session)
+    
+    session.execute(
+        update(ProjectCounter).where(ProjectCounter.project_id == project_ids[0]).values(todo_count=40)
+    )
+    session.execute(delete(ProjectCounter).where(ProjectCounter.project_id == project_ids[1]))
+    session.commit()
+    
+    assert project_service.rebuild_task_counters(dry_run=True) == project_ids[:2]
+    assert counters(session) != expected
+    
+    assert project_service.rebuild_task_counters() == project_ids[:2]
+    assert counters(session) == expected
+    assert project_service.rebuild_task_counters() == []
+
+
+def test_stats_read_status_counts_from_the_counters(session, services):
+    project_service, task_service = services
+    busy, empty = (project_service.create_project(name).id for name in ('Busy', 'Empty'))
+    created, _ = task_service.create_tasks_bulk([{'project_id': busy, 'title': f'Task {number}'} for number in range(4)])
+    task_service.close_tasks([created[0].id])
+    session.execute(insert(Task.__table__), [
+        {'title': 'Overdue', 'project_id': busy, 'status': 'doing', 'deadline': datetime.now() - timedelta(days=1)}
+    ])
+    session.commit()
+    
+    stats = {row['id']: row for row in project_service.get_project_stats()}
+    
+    assert stats[busy]['status_counts'] == recount(session)[busy]
+    assert stats[busy]['task_count'] == 5
+    assert stats[busy]['overdue_count'] == 1
+    assert stats[busy]['oldest_open_created_at'] == created[1].created_at.replace(tzinfo=None)
+    assert stats[empty]['status_counts'] == dict.fromkeys(STATUSES, 0)
+    assert stats[empty]['overdue_count'] == 0
+    assert stats[empty]['oldest_open_created_at'] is None
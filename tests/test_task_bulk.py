@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.parametrize('titles, expected_status, expected_errors', [
+    (['First', 'Second'], 201, []),
+    (['First', '', 'x' * 1000], 207, [1, 2]),
+    (['', 'x' * 1000], 422, [0, 1]),
+], ids=['all-created', 'some-failed', 'all-failed'])
+def test_bulk_create_reports_invalid_titles_per_item(client, titles, expected_status, expected_errors):
+    project_id = client.post('/api/v1/projects/', json={'name': 'Bulk'}).json()['data']['id']
+    
+    response = client.post('/api/v1/tasks/bulk', json={
+        'tasks': [{'project_id': project_id, 'title': title} for title in titles]
+    })
+    
+    assert response.status_code == expected_status
+    data = response.json()['data']
+    assert [error['index'] for error in data['errors']] == expected_errors
+    assert data['total_created'] == len(titles) - len(expected_errors)
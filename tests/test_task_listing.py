@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from todo_list.models import Task
+
+
+TASKS = 9
+
+
+@pytest.fixture
+def task_ids(client):
+    project_id = client.post('/api/v1/projects/', json={'name': 'Listing'}).json()['data']['id']
+    # One statement, so every task is created in the same second
+    response = client.post('/api/v1/tasks/bulk', json={
+        'tasks': [{'project_id': project_id, 'title': f'Task {number}'} for number in range(TASKS)]
+    })
+    return [task['id'] for task in response.json()['data']['created']]
+
+
+def follow_cursors(client, params):
+    seen, cursor = [], None
+    # A cursor that never advances would loop forever
+    for _ in range(TASKS + 1):
+        response = client.get('/api/v1/tasks/', params={**params, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        data = response.json()['data']
+        seen.extend(task['id'] for task in data['tasks'])
+        cursor = data['next_cursor']
+        if cursor is None:
+            return seen
+    pytest.fail(f"Paging {params} did not end")
+
+
+@pytest.mark.parametrize('sort', ['created_at', '-created_at'])
+def test_paging_by_created_at_returns_every_task_once(client, task_ids, sort):
+    seen = follow_cursors(client, {'sort': sort, 'limit': 2})
+    
+    assert sorted(seen) == sorted(task_ids)
+    assert len(seen) == len(set(seen))
+
+
+@pytest.mark.parametrize('sort', ['created_at', '-created_at'])
+def test_paging_by_created_at_breaks_ties_by_id(client, engine, task_ids, sort):
+    with engine.begin() as connection:
+        connection.execute(Task.__table__.update().values(created_at=datetime(2026, 1, 1, 12, 0, 0)))
+    
+    seen = follow_cursors(client, {'sort': sort, 'limit': 2})
+    
+    assert seen == sorted(task_ids, reverse=sort.startswith('-'))
+
+
+def test_created_filters_keep_tasks_on_their_boundaries(client, task_ids):
+    created_at = client.get(f'/api/v1/tasks/{task_ids[0]}').json()['data']['created_at']
+    
+    def listed(**params):
+        return [task['id'] for task in client.get('/api/v1/tasks/', params=params).json()['data']['tasks']]
+    
+    created_at = datetime.fromisoformat(created_at)
+    moment = timedelta(microseconds=1)
+    assert task_ids[0] in listed(created_after=(created_at - moment).isoformat())
+    assert task_ids[0] in listed(created_before=(created_at + moment).isoformat())
+    # Both bounds are exclusive
+    assert task_ids[0] not in listed(created_after=created_at.isoformat())
+    assert task_ids[0] not in listed(created_before=created_at.isoformat())
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from todo_list.api.dependencies.database import get_db
+from todo_list.api.main import app
+from todo_list.cache import project_cache, task_cache
+from todo_list.models.project import Project
+from todo_list.models.task import Task
+from todo_list.repositories.task_repository import TaskRepository
+
+from .conftest import StatementCounter, create_memory_engine
+
+
+TASK_COUNTS = (5, 40)
+
+REPOSITORY_READS = {
+    'get_all': lambda repository, project_id: repository.get_all(),
+    'get_by_project': lambda repository, project_id: repository.get_by_project(project_id),
+    'get_overdue_tasks': lambda repository, project_id: repository.get_overdue_tasks(),
+}
+
+LIST_ROUTES = (
+    '/api/v1/tasks/',
+    '/api/v1/tasks/project/{project_id}',
+    '/api/v1/tasks/overdue',
+)
+
+
+def seed(session, tasks: int) -> int:
+    """
+    Insert a project with `tasks` open, overdue tasks, and as many other
+    projects with one such task each; returns the first project's id.
+
+    Lazy loads of Task.project are answered from the identity map once a
+    project is loaded, so only tasks of distinct projects expose an N+1.
+    """
+    project_ids = session.execute(
+        insert(Project).returning(Project.id),
+        [{'name': f'Project {number}'} for number in range(tasks + 1)]
+    ).scalars().all()
+    deadline = datetime.now() - timedelta(days=1)
+    owners = [project_ids[0]] * tasks + project_ids[1:]
+    session.execute(insert(Task.__table__), [
+        {'title': f'Task {number}', 'project_id': project_id, 'status': 'todo', 'deadline': deadline}
+        for number, project_id in enumerate(owners)
+    ])
+    session.commit()
+    return project_ids[0]
+
+
+def fresh_engine():
+    # Ids restart in every database, so entries cached from the previous one must go
+    task_cache.clear()
+    project_cache.clear()
+    return create_memory_engine()
+
+
+def count_repository_statements(tasks: int, read) -> int:
+    engine = fresh_engine()
+    try:
+        with sessionmaker(bind=engine)() as session:
+            project_id = seed(session, tasks)
+            with StatementCounter(engine) as counter:
+                listed = read(TaskRepository(session), project_id)
+                # Serialization reads the project name of every task
+                assert len([task.project.name for task in listed]) >= tasks
+            return counter.count
+    finally:
+        engine.dispose()
+
+
+def count_route_statements(tasks: int, path: str) -> int:
+    engine = fresh_engine()
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    def override_get_db():
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with factory() as session:
+            project_id = seed(session, tasks)
+        with StatementCounter(engine) as counter:
+            response = TestClient(app).get(path.format(project_id=project_id))
+        assert response.status_code == 200
+        assert len(response.json()['data']['tasks']) >= tasks
+        return counter.count
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+
+@pytest.mark.parametrize('read', REPOSITORY_READS.values(), ids=REPOSITORY_READS.keys())
+def test_repository_lists_run_a_constant_number_of_statements(read):
+    counts = [count_repository_statements(tasks, read) for tasks in TASK_COUNTS]
+    assert counts[0] == counts[1]
+
+
+@pytest.mark.parametrize('path', LIST_ROUTES)
+def test_list_routes_run_a_constant_number_of_statements(path):
+    counts = [count_route_statements(tasks, path) for tasks in TASK_COUNTS]
+    assert counts[0] == counts[1]